@@ -1,9 +1,21 @@
 import streamlit as st
-import zipfile
-import io
-import json
-import datetime
-import re
+import os
+import tempfile
+import hashlib
+import dataclasses
+import contextlib
+import pandas as pd
+from titan.engine import (
+    SiteConfig, build_page, gen_home_content, gen_about_page, gen_contact_page,
+    gen_privacy_page, gen_terms_page, gen_blog_index_html, gen_blog_post_html,
+    gen_product_page_content, profiling,
+)
+from titan.output import ZipSink, brotli, read_manifest
+from titan.images import process_image, available_formats
+from titan.fonts import FONT_DIR, TTFont, cached_faces
+from titan.export import export_site
+
+DEFAULTS = SiteConfig()
 
 # --- 1. APP CONFIGURATION ---
 st.set_page_config(
@@ -57,14 +69,11 @@ st.markdown("""
     """, unsafe_allow_html=True)
 
 # --- 3. SIDEBAR: THE CONTROL CENTER ---
-with st.sidebar:
-    st.title("Titan Architect")
-    st.caption("v31.5 | Social Sharing Added")
-    st.divider()
-    
+@st.fragment
+def sidebar_controls():
     # 3.1 VISUAL DNA
     with st.expander("🎨 Visual DNA", expanded=True):
-        theme_mode = st.selectbox("Base Theme", [
+        st.selectbox("Base Theme", [
             "Clean Corporate (Light)", 
             "Midnight SaaS (Dark)", 
             "Glassmorphism (Blur)",
@@ -73,144 +82,199 @@ with st.sidebar:
             "Forest Eco",
             "Ocean Breeze",
             "Stark Minimalist"
-        ])
+        ], key="theme_mode")
         c1, c2 = st.columns(2)
-        p_color = c1.color_picker("Primary Brand", "#0F172A") 
-        s_color = c2.color_picker("Action (CTA)", "#EF4444")  
+        c1.color_picker("Primary Brand", DEFAULTS.p_color, key="p_color") 
+        c2.color_picker("Action (CTA)", DEFAULTS.s_color, key="s_color")  
         
         st.markdown("**Typography**")
-        h_font = st.selectbox("Headings", ["Montserrat", "Space Grotesk", "Playfair Display", "Oswald", "Clash Display"])
-        b_font = st.selectbox("Body Text", ["Inter", "Open Sans", "Roboto", "Satoshi", "Lora"])
+        st.selectbox("Headings", ["Montserrat", "Space Grotesk", "Playfair Display", "Oswald", "Clash Display"], key="h_font")
+        st.selectbox("Body Text", ["Inter", "Open Sans", "Roboto", "Satoshi", "Lora"], key="b_font")
         
         st.markdown("**UI Physics**")
-        border_rad = st.select_slider("Corner Roundness", ["0px", "4px", "12px", "24px", "40px"], value="12px")
-        anim_type = st.selectbox("Animation Style", ["Fade Up", "Zoom In", "Slide Right", "None"])
+        st.select_slider("Corner Roundness", ["0px", "4px", "12px", "24px", "40px"], value=DEFAULTS.border_rad, key="border_rad")
+        st.selectbox("Animation Style", ["Fade Up", "Zoom In", "Slide Right", "None"], key="anim_type")
 
     # 3.2 MODULE MANAGER
     with st.expander("🧩 Section Manager", expanded=False):
         st.caption("Toggle sections to include:")
-        show_hero = st.checkbox("Hero Carousel", value=True)
-        show_stats = st.checkbox("Trust Stats/Logos", value=True)
-        show_features = st.checkbox("Feature Grid (4 Pillars)", value=True)
-        show_pricing = st.checkbox("Pricing Comparison Table", value=True)
-        show_inventory = st.checkbox("Portfolio/Inventory (CSV)", value=True)
-        show_blog = st.checkbox("Blog / News Engine", value=True)
-        show_gallery = st.checkbox("About Section", value=True)
-        show_testimonials = st.checkbox("Testimonials", value=True)
-        show_faq = st.checkbox("F.A.Q.", value=True)
-        show_cta = st.checkbox("Final Call to Action", value=True)
+        st.checkbox("Hero Carousel", value=DEFAULTS.show_hero, key="show_hero")
+        st.checkbox("Trust Stats/Logos", value=DEFAULTS.show_stats, key="show_stats")
+        st.checkbox("Feature Grid (4 Pillars)", value=DEFAULTS.show_features, key="show_features")
+        st.checkbox("Pricing Comparison Table", value=DEFAULTS.show_pricing, key="show_pricing")
+        st.checkbox("Portfolio/Inventory (CSV)", value=DEFAULTS.show_inventory, key="show_inventory")
+        st.checkbox("Blog / News Engine", value=DEFAULTS.show_blog, key="show_blog")
+        st.checkbox("About Section", value=DEFAULTS.show_gallery, key="show_gallery")
+        st.checkbox("Testimonials", value=DEFAULTS.show_testimonials, key="show_testimonials")
+        st.checkbox("F.A.Q.", value=DEFAULTS.show_faq, key="show_faq")
+        st.checkbox("Final Call to Action", value=DEFAULTS.show_cta, key="show_cta")
+        st.checkbox("Site Search (build-time index)", value=DEFAULTS.site_search, key="site_search", help="Adds a search box to the navigation that queries a small sharded index of products and posts, written to search/ at export. Needs the catalog or blog in a Prerendered or JSON mode.")
+        st.checkbox("Search Stemming (English)", value=DEFAULTS.search_stemming, key="search_stemming", help="Indexes words without common endings (-s, -ed, -ing, -ly), so 'chairs' also finds 'chair'.")
 
     # 3.3 TECHNICAL
     with st.expander("⚙️ SEO & Analytics", expanded=False):
         st.markdown("**Targeting**")
-        seo_area = st.text_input("Service Area (City/Region)", "Global / Online")
-        seo_kw = st.text_area("SEO Keywords", "web design, no monthly fees, one time payment website, stop web rent")
+        st.text_input("Service Area (City/Region)", DEFAULTS.seo_area, key="seo_area")
+        st.text_area("SEO Keywords", DEFAULTS.seo_kw, key="seo_kw")
         
         st.markdown("**Verification**")
-        gsc_tag = st.text_input("Google Verification ID")
-        ga_tag = st.text_input("Google Analytics ID (G-XXXX)")
-        og_image = st.text_input("Social Share Image URL")
+        st.text_input("Google Verification ID", key="gsc_tag")
+        st.text_input("Google Analytics ID (G-XXXX)", key="ga_tag")
+        st.text_input("Social Share Image URL", key="og_image")
+
+    # 3.4 IMAGES
+    with st.expander("🖼️ Image Library", expanded=False):
+        if available_formats():
+            st.file_uploader("Upload Images", type=["png", "jpg", "jpeg", "webp"], accept_multiple_files=True, key="image_files", help="Exported as resized AVIF/WebP variants with srcset and a blur placeholder.")
+            names = [f.name for f in st.session_state.get("image_files") or []]
+            if names:
+                st.caption("Use a file name in any image field or ImageURL column: " + ", ".join(f"`{n}`" for n in names) + ". The preview only shows their placeholders.")
+        else:
+            st.caption("Install `Pillow` to upload images for resized WebP/AVIF variants.")
+
+    # 3.5 DELIVERY
+    with st.expander("📦 Delivery & Performance", expanded=False):
+        st.radio("Stylesheet", ["Shared File (Cached)", "Inline, Purged Per Page", "Inline (Full)"], help="Shared File writes one styles.<hash>.css that browsers cache across pages. Inline, Purged Per Page embeds only the rules each page uses.", key="css_mode")
+        st.checkbox("Bundle JS (deferred app.<hash>.js)", value=DEFAULTS.bundle_js, key="bundle_js", help="Shared runtime code ships once as a cached, deferred bundle; each page only loads its own small entry module.")
+        st.checkbox("Icon Sprite (cached icons.<hash>.svg)", value=DEFAULTS.icon_sprite, key="icon_sprite", help="Icons reference one shared sprite file. Off: each page inlines the icon symbols it uses, once.")
+        st.checkbox("Service Worker (offline & repeat visits)", value=DEFAULTS.service_worker, key="service_worker", help="Writes a versioned sw.js that precaches the site shell and caches images, fonts and sheet data at runtime.")
+        st.number_input("Sheet Cache TTL (minutes, 0 = off)", min_value=0, max_value=1440, value=DEFAULTS.sheet_cache_ttl, help="Visitors' browsers keep parsed sheet data in IndexedDB. Later pages render from it at once and refresh it in the background once it is older than this.", key="sheet_cache_ttl")
+        st.checkbox("Self-Host Fonts (subset, from font cache)", value=DEFAULTS.self_host_fonts, key="self_host_fonts", help="Bundles the heading and body fonts found in the font cache directory, subset to the characters the site uses. Fonts not in the cache load from Google Fonts or Fontshare.")
+        if TTFont is None:
+            st.caption("Install `fonttools` to self-host fonts.")
+        elif st.session_state.self_host_fonts:
+            found = [f for f in (st.session_state.h_font, st.session_state.b_font) if cached_faces(f)]
+            st.caption(f"Font cache `{FONT_DIR}` (TITAN_FONT_DIR): " + (", ".join(found) if found else "no files for the selected fonts") + ".")
+        st.checkbox("Minify HTML, CSS & JS", value=DEFAULTS.minify_output, key="minify_output")
+        st.checkbox("Precompress (.gz + .br siblings)", value=DEFAULTS.precompress, key="precompress", help="For static hosts that serve precompressed files, e.g. nginx gzip_static / brotli_static.")
+        if not brotli:
+            st.caption("Install `brotli` to also write .br files.")
+        st.file_uploader("Previous manifest.json (download only changes)", type=["json"], key="manifest_file", help="Every export includes a manifest.json of content hashes. Upload the one from your last deploy to get a delta ZIP: changed and new files plus a deletions.json. Sitemap lastmods of unchanged pages carry over from it.")
+        st.checkbox("Store Compressed Assets As-Is", value=DEFAULTS.store_compressed, key="store_compressed", help="Images, fonts and .gz/.br files are added to the ZIP without deflating them again: faster builds, same size.")
+
+    # 3.6 BUDGETS
+    with st.expander("🎯 Performance Budgets", expanded=False):
+        st.caption("Every exported page is checked against these limits (0 = no limit).")
+        b1, b2 = st.columns(2)
+        b1.number_input("HTML per Page (KB)", min_value=0, value=DEFAULTS.budget_html_kb, key="budget_html_kb")
+        b2.number_input("Inline CSS (KB)", min_value=0, value=DEFAULTS.budget_css_kb, key="budget_css_kb")
+        b1.number_input("Inline JS (KB)", min_value=0, value=DEFAULTS.budget_js_kb, key="budget_js_kb")
+        b2.number_input("Inline SVG (KB)", min_value=0, value=DEFAULTS.budget_svg_kb, key="budget_svg_kb")
+        b1.number_input("Render-Blocking", min_value=0, value=DEFAULTS.budget_blocking, key="budget_blocking", help="Stylesheets and scripts in <head> without async/defer, e.g. the Google Fonts link and the gtag snippet.")
+        b2.number_input("Third-Party Origins", min_value=0, value=DEFAULTS.budget_origins, key="budget_origins", help="Distinct other hosts a page loads fonts, images, scripts or data from.")
+
+with st.sidebar:
+    st.title("Titan Architect")
+    st.caption("v31.5 | Social Sharing Added")
+    st.divider()
+    sidebar_controls()
 
 # --- 4. MAIN WORKSPACE ---
 st.title("🏗️ StopWebRent Site Builder")
 
 tabs = st.tabs(["1. Identity", "2. Content Blocks", "3. Pricing Logic", "4. Inventory/Portfolio", "5. Blog Engine", "6. Legal & Footer"])
 
-with tabs[0]:
+@st.fragment
+def identity_tab():
     c1, c2 = st.columns(2)
     with c1:
-        biz_name = st.text_input("Business Name", "StopWebRent.com")
-        biz_tagline = st.text_input("Tagline", "Stop Renting. Start Owning.")
-        biz_phone = st.text_input("Phone", "966572562151")
-        biz_email = st.text_input("Email (For Forms)", "hello@kaydiemscriptlab.com")
+        st.text_input("Business Name", DEFAULTS.biz_name, key="biz_name")
+        st.text_input("Tagline", DEFAULTS.biz_tagline, key="biz_tagline")
+        st.text_input("Phone", DEFAULTS.biz_phone, key="biz_phone")
+        st.text_input("Email (For Forms)", DEFAULTS.biz_email, key="biz_email")
     with c2:
-        prod_url = st.text_input("Website URL", "https://www.stopwebrent.com")
-        biz_addr = st.text_area("Address", "Kaydiem Script Lab\nKanishka’s House, Garia Station Rd\nKolkata, West Bengal 700084, India", height=100)
-        map_iframe = st.text_area("Google Map Embed Code", placeholder='<iframe src="..."></iframe>', height=100)
-        seo_d = st.text_area("Meta Description (SEO)", "Stop paying monthly fees for Wix or Shopify. The Titan Engine builds ultra-fast (0.1s) websites with $0 hosting costs. Pay once, own your code forever.", height=100)
-        logo_url = st.text_input("Logo URL (PNG/SVG)")
+        st.text_input("Website URL", DEFAULTS.prod_url, key="prod_url")
+        st.text_area("Address", DEFAULTS.biz_addr, height=100, key="biz_addr")
+        st.text_area("Google Map Embed Code", placeholder='<iframe src="..."></iframe>', height=100, key="map_iframe")
+        st.text_area("Meta Description (SEO)", DEFAULTS.seo_d, height=100, key="seo_d")
+        st.text_input("Logo URL (PNG/SVG)", key="logo_url")
         
     st.subheader("Social Links (Footer Icons)")
     sc1, sc2, sc3 = st.columns(3)
-    fb_link = sc1.text_input("Facebook URL")
-    ig_link = sc2.text_input("Instagram URL")
-    x_link = sc3.text_input("X (Twitter) URL")
+    sc1.text_input("Facebook URL", key="fb_link")
+    sc2.text_input("Instagram URL", key="ig_link")
+    sc3.text_input("X (Twitter) URL", key="x_link")
     
     sc4, sc5, sc6 = st.columns(3)
-    li_link = sc4.text_input("LinkedIn URL")
-    yt_link = sc5.text_input("YouTube URL")
-    wa_num = sc6.text_input("WhatsApp Number (No +)", "966572562151")
+    sc4.text_input("LinkedIn URL", key="li_link")
+    sc5.text_input("YouTube URL", key="yt_link")
+    sc6.text_input("WhatsApp Number (No +)", DEFAULTS.wa_num, key="wa_num")
 
-with tabs[1]:
+@st.fragment
+def content_tab():
     st.subheader("Hero Carousel")
     st.info("💡 Add up to 3 images for the sliding hero banner.")
-    hero_h = st.text_input("Hero Headline", "Stop Paying Rent for Your Website.")
-    hero_sub = st.text_input("Hero Subtext", "The Titan Engine is the world’s first 0.1s website architecture that runs on $0 monthly fees. Pay once. Own it forever.")
+    st.text_input("Hero Headline", DEFAULTS.hero_h, key="hero_h")
+    st.text_input("Hero Subtext", DEFAULTS.hero_sub, key="hero_sub")
     
     hc1, hc2, hc3 = st.columns(3)
-    hero_img_1 = hc1.text_input("Slide 1 Image", "https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=1600")
-    hero_img_2 = hc2.text_input("Slide 2 Image", "https://images.unsplash.com/photo-1551288049-bebda4e38f71?q=80&w=1600")
-    hero_img_3 = hc3.text_input("Slide 3 Image", "https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?q=80&w=1600")
+    hc1.text_input("Slide 1 Image", DEFAULTS.hero_img_1, key="hero_img_1")
+    hc2.text_input("Slide 2 Image", DEFAULTS.hero_img_2, key="hero_img_2")
+    hc3.text_input("Slide 3 Image", DEFAULTS.hero_img_3, key="hero_img_3")
     
     st.divider()
     
     st.subheader("Trust Stats Data")
     col_s1, col_s2, col_s3 = st.columns(3)
-    stat_1 = col_s1.text_input("Stat 1", "0.1s")
-    label_1 = col_s1.text_input("Label 1", "Load Speed")
+    col_s1.text_input("Stat 1", DEFAULTS.stat_1, key="stat_1")
+    col_s1.text_input("Label 1", DEFAULTS.label_1, key="label_1")
     
-    stat_2 = col_s2.text_input("Stat 2", "$0")
-    label_2 = col_s2.text_input("Label 2", "Monthly Fees")
+    col_s2.text_input("Stat 2", DEFAULTS.stat_2, key="stat_2")
+    col_s2.text_input("Label 2", DEFAULTS.label_2, key="label_2")
     
-    stat_3 = col_s3.text_input("Stat 3", "100%")
-    label_3 = col_s3.text_input("Label 3", "Ownership")
+    col_s3.text_input("Stat 3", DEFAULTS.stat_3, key="stat_3")
+    col_s3.text_input("Label 3", DEFAULTS.label_3, key="label_3")
 
     st.divider()
     
     st.subheader("The 4 Pillars (Feature Grid)")
     st.info("Keywords: bolt (speed), wallet (cost), table (sheets), shield (security), star, heart")
-    f_title = st.text_input("Features Title", "The Titan Value Pillars")
-    feat_data = st.text_area("Features List", 
-                             "bolt | The Performance Pillar | **0.1s High-Velocity Loading**. While traditional sites take 3–5s, Titan loads instantly. This satisfies Google’s Core Web Vitals perfectly for higher ranking.\nwallet | The Economic Pillar | **$0 Monthly Fees**. We eliminated hosting subscriptions. You pay once and own the raw source code forever. No 'rent', no 'maintenance fees'.\ntable | The Functional Pillar | **Google Sheets CMS**. Update prices and photos directly from a simple spreadsheet. If you can use Excel, you can manage your website instantly.\nshield | The Authority Pillar | **Unhackable Security**. By removing the database (Zero-DB Architecture), we have removed the hacker's primary entry point. Your site is impenetrable.\nlayers | The Reliability Pillar | **Global Edge Deployment**. Your site doesn't live on one slow server. It is distributed across 100+ servers worldwide (CDN), creating 99.9% uptime and instant access from any city.\nstar | The Conversion Pillar | **One-Tap WhatsApp**. We embed 'Direct-to-Chat' technology. Customers don't need to save your number; they simply tap one button to start a sales conversation immediately.",
-                             height=150)
+    st.text_input("Features Title", DEFAULTS.f_title, key="f_title")
+    st.text_area("Features List", DEFAULTS.feat_data, height=150, key="feat_data")
     
     st.subheader("About Content")
     
-    about_h = st.text_input("About Title", "Control Your Empire from a Spreadsheet")
-    about_img = st.text_input("About Side Image", "https://images.unsplash.com/photo-1543286386-713df548e9cc?q=80&w=1600")
+    st.text_input("About Title", DEFAULTS.about_h, key="about_h")
+    st.text_input("About Side Image", DEFAULTS.about_img, key="about_img")
     
     c_a1, c_a2 = st.columns(2)
-    about_short = c_a1.text_area("Home Page Summary (Short)", "No WordPress dashboard. No plugins to update. Just open your private Google Sheet, change a text, and watch your site update globally in seconds.", height=200)
-    about_long = c_a2.text_area("Full About Page Content (Long)", "**The Digital Landlord Trap**\nMost business owners don't realize they are trapped in a rental cycle. Platforms like Wix, Squarespace, and Shopify act as Digital Landlords. They charge you rent every single month to keep your business online. If you stop paying, they delete your website. Over 5 years, a cheap $29/mo website actually drains over $1,700 from your pocket.\n\n**The Titan Philosophy: Ownership**\nAt StopWebRent.com, we believe you should own your digital home, not rent it. We reject bloatware, heavy databases, and recurring subscription models. Our mission is to democratize Enterprise Grade technology for small business owners.\n\n**How We Achieve $0 Monthly Fees**\nWe utilize Static Site Architecture. Unlike traditional sites that require a heavy server running 24/7 (costing money), Titan sites are pre-built and live on the Global Edge (CDN).", height=200)
+    c_a1.text_area("Home Page Summary (Short)", DEFAULTS.about_short, height=200, key="about_short")
+    c_a2.text_area("Full About Page Content (Long)", DEFAULTS.about_long, height=200, key="about_long")
 
-with tabs[2]:
+@st.fragment
+def pricing_tab():
     st.subheader("💰 Pricing Comparison Table")
     st.info("This configures the table that compares you vs. Wix/Shopify.")
     
     col_p1, col_p2, col_p3 = st.columns(3)
-    titan_price = col_p1.text_input("Titan Setup Price", "$199")
-    titan_mo = col_p1.text_input("Titan Monthly", "$0")
+    col_p1.text_input("Titan Setup Price", DEFAULTS.titan_price, key="titan_price")
+    col_p1.text_input("Titan Monthly", DEFAULTS.titan_mo, key="titan_mo")
     
-    wix_name = col_p2.text_input("Competitor Name", "Wix (Core Plan)")
-    wix_mo = col_p2.text_input("Competitor Monthly", "$29/mo")
+    col_p2.text_input("Competitor Name", DEFAULTS.wix_name, key="wix_name")
+    col_p2.text_input("Competitor Monthly", DEFAULTS.wix_mo, key="wix_mo")
     
-    save_val = col_p3.text_input("5-Year Savings Calculation", "$1,466")
+    col_p3.text_input("5-Year Savings Calculation", DEFAULTS.save_val, key="save_val")
     
     st.caption("The table calculates: Titan (One time) vs Competitor (Monthly x 60 months).")
 
-with tabs[3]:
+@st.fragment
+def inventory_tab():
     st.subheader("Portfolio & Templates")
     st.info("⚡ Power your portfolio with a Google Sheet")
-    sheet_url = st.text_input("Google Sheet CSV Link", placeholder="https://docs.google.com/spreadsheets/d/e/.../pub?output=csv")
-    custom_feat = st.text_input("Default Product Image URL (Fallback)", "https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=800")
+    st.text_input("Google Sheet CSV Link", placeholder="https://docs.google.com/spreadsheets/d/e/.../pub?output=csv", key="sheet_url")
+    st.text_input("Default Product Image URL (Fallback)", DEFAULTS.custom_feat, key="custom_feat")
     st.caption("Required Columns: Name, Price, Description, ImageURL")
+    st.radio("Catalog Export Mode", ["Live (Browser Fetch)", "JSON Shards (Build-Time)", "Prerendered (Build-Time)"], horizontal=True, help="Build-time modes read the CSV once when you download the ZIP. JSON Shards writes a compact card index plus one data file per product; Prerendered writes finished cards plus one page per product.", key="inv_mode")
+    st.file_uploader("Catalog CSV File (Optional, used instead of the link at build time)", type=["csv"], key="inv_csv_file")
+    st.number_input("Cards Per Page (0 = show all)", min_value=0, max_value=500, value=DEFAULTS.inv_page_size, step=6, help="The grid shows this many cards, then a Load More button. Cards past the page are not built and their images are not requested.", key="inv_page_size")
 
 # --- NEW TAB: BLOG ENGINE ---
-with tabs[4]:
+@st.fragment
+def blog_tab():
     st.subheader("📰 Titan Blog Engine")
     st.info("Connect a Google Sheet to power your blog. Zero database required.")
     
-    blog_sheet_url = st.text_input("Blog CSV Link", placeholder="https://docs.google.com/spreadsheets/d/e/.../pub?output=csv", help="Publish your sheet as CSV")
+    st.text_input("Blog CSV Link", placeholder="https://docs.google.com/spreadsheets/d/e/.../pub?output=csv", help="Publish your sheet as CSV", key="blog_sheet_url")
     
     st.markdown("""
     **Required CSV Columns:**
@@ -223,872 +287,156 @@ with tabs[4]:
     7. `Content` (Full text. Supports **Bold** and * Bullets)
     """)
     
-    blog_hero_title = st.text_input("Blog Page Title", "Latest Insights")
-    blog_hero_sub = st.text_input("Blog Page Subtext", "Thoughts on technology, business, and freedom.")
+    st.text_input("Blog Page Title", DEFAULTS.blog_hero_title, key="blog_hero_title")
+    st.text_input("Blog Page Subtext", DEFAULTS.blog_hero_sub, key="blog_hero_sub")
+    st.radio("Blog Export Mode", ["Live (Browser Fetch)", "JSON Shards (Build-Time)", "Compiled (Build-Time)"], horizontal=True, help="Build-time modes read the blog CSV once when you download the ZIP. JSON Shards writes a summary index plus one data file per post; Compiled writes one finished page per post.", key="blog_mode")
+    st.file_uploader("Blog CSV File (Optional, used instead of the link at build time)", type=["csv"], key="blog_csv_file")
+    st.number_input("Posts Per Page (0 = show all)", min_value=0, max_value=500, value=DEFAULTS.blog_page_size, step=3, key="blog_page_size")
 
-with tabs[5]:
+@st.fragment
+def legal_tab():
     st.subheader("Trust & Legal")
     st.info("💡 Use `**Title**` for bold headers.")
-    testi_data = st.text_area("Testimonials (Name | Quote)", "Rajesh Gupta, HVAC Business Owner | I was paying Wix $35/month for 3 years. Titan built me a faster site for a one-time fee. I stopped the bleeding and finally own my asset.\nSarah Jenkins, Cafe Owner | Updating my menu used to be a nightmare on WordPress. Now, I just open a Google Sheet on my phone, change the price, and it updates the website instantly.\nDavid Miller, Financial Consultant | Speed is everything for SEO. My old site took 4 seconds to load. My new Titan site loads in 0.1 seconds. My Google ranking jumped to Page 1 within a month.", height=100)
+    st.text_area("Testimonials (Name | Quote)", DEFAULTS.testi_data, height=100, key="testi_data")
     
-    faq_data = st.text_area("FAQ Data (Q? ? A)", "Do I really pay $0 for hosting? ? Yes. We utilize 'Static Site Architecture' which allows your site to be hosted on Enterprise CDNs (like Netlify/Vercel) within their generous free tiers for small businesses.\nWhat about my Domain Name? ? You pay that directly to the registrar (like GoDaddy or Namecheap). It usually costs ~$15/year. We do not mark this up.\nCan I add a blog later? ? Yes. The Titan Engine is scalable. We can add a blog, gallery, or more pages for a one-time expansion fee.\nIs it secure? ? It is safer than WordPress. Because there is no database to hack, your site is virtually impenetrable to common SQL injection attacks.", height=100)
+    st.text_area("FAQ Data (Q? ? A)", DEFAULTS.faq_data, height=100, key="faq_data")
     
     l1, l2 = st.columns(2)
-    priv_txt = l1.text_area("Privacy Policy Text", "**1. Introduction & Digital Sovereignty**\nAt StopWebRent.com (operated by Kaydiem Script Lab), we treat data privacy not just as a compliance requirement, but as a fundamental architectural feature. We collect the absolute minimum amount of data required to engineer, deploy, and maintain your digital asset. This Privacy Policy outlines how we handle your information under the jurisdiction of West Bengal, India, while respecting global standards.\n\n**2. Information We Collect**\nTo provide our Titan Engine services, we collect Identity Data, Contact Data, and Technical Data (your Google Sheet ID).\n\n**3. The Static Site Privacy Advantage**\nUnlike traditional WordPress sites that store user data in complex databases (vulnerable to hacking), the websites we build for you are Static. They do not inherently store your customers data on our servers. This Zero-DB Architecture inherently reduces your liability and privacy risk.", height=200)
-    term_txt = l2.text_area("Terms of Service Text", "**1. Service Agreement**\nBy engaging StopWebRent.com (Kaydiem Script Lab) for web development services, you agree to these Terms. We provide Static Website Architecture designed for speed and cost-efficiency.\n\n**2. Payment & Fees**\nYou agree to pay the one-time architectural setup fee (e.g., $199) as advertised. StopWebRent.com does not charge monthly maintenance or hosting fees. The Client is responsible for their own Domain Name renewal fees.\n\n**3. Intellectual Property (The Ownership Clause)**\nUpon settlement of the final invoice, full intellectual property rights and source code ownership are transferred to the Client. You are granted a perpetual, worldwide, non-exclusive license to the code.", height=200)
-
-# --- 5. COMPILER ENGINE ---
-
-def format_text(text):
-    """Advanced Text Formatter v30.4"""
-    if not text: return ""
-    processed_text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
-    lines = processed_text.split('\n')
-    html_out = ""
-    in_list = False
-    
-    for line in lines:
-        clean_line = line.strip()
-        if not clean_line: continue
-        if clean_line.startswith("* "):
-            if not in_list:
-                html_out += '<ul style="margin-bottom:1rem; padding-left:1.5rem;">'
-                in_list = True
-            content = clean_line[2:] 
-            html_out += f'<li style="margin-bottom:0.5rem; opacity:0.9; color:inherit;">{content}</li>'
-        elif clean_line.startswith("<strong>") and clean_line.endswith("</strong>"):
-            if in_list: 
-                html_out += "</ul>"
-                in_list = False
-            header_text = clean_line.replace("<strong>", "").replace("</strong>", "")
-            html_out += f"<h3 style='margin-top:1.5rem; margin-bottom:0.5rem; color:var(--p); font-size:1.25rem;'>{header_text}</h3>"
-        else:
-            if in_list: 
-                html_out += "</ul>"
-                in_list = False
-            html_out += f"<p style='margin-bottom:1rem; opacity:0.9; color:inherit;'>{clean_line}</p>"
-    if in_list: html_out += "</ul>"
-    return html_out
-
-def gen_schema():
-    schema = {
-        "@context": "https://schema.org",
-        "@type": "LocalBusiness",
-        "name": biz_name,
-        "image": logo_url or hero_img_1,
-        "telephone": biz_phone,
-        "email": biz_email,
-        "areaServed": seo_area,
-        "address": {
-            "@type": "PostalAddress",
-            "streetAddress": biz_addr
-        },
-        "url": prod_url,
-        "description": seo_d
-    }
-    return f'<script type="application/ld+json">{json.dumps(schema)}</script>'
-
-def get_theme_css():
-    # Base Defaults
-    bg_color = "#ffffff"
-    text_color = "#0f172a"
-    card_bg = "#ffffff"
-    glass_nav = "rgba(255, 255, 255, 0.95)"
-    
-    # Theme Logic
-    if "Midnight" in theme_mode:
-        bg_color, text_color, card_bg, glass_nav = "#0f172a", "#f8fafc", "#1e293b", "rgba(15, 23, 42, 0.9)"
-    elif "Cyberpunk" in theme_mode:
-        bg_color, text_color, card_bg, glass_nav = "#050505", "#00ff9d", "#111", "rgba(0,0,0,0.8)"
-    elif "Luxury" in theme_mode:
-        bg_color, text_color, card_bg, glass_nav = "#1c1c1c", "#D4AF37", "#2a2a2a", "rgba(28,28,28,0.95)"
-    elif "Forest" in theme_mode:
-        bg_color, text_color, card_bg, glass_nav = "#f1f8e9", "#1b5e20", "#ffffff", "rgba(241,248,233,0.9)"
-    elif "Ocean" in theme_mode:
-        bg_color, text_color, card_bg, glass_nav = "#e0f7fa", "#006064", "#ffffff", "rgba(224,247,250,0.9)"
-    elif "Stark" in theme_mode:
-        bg_color, text_color, card_bg, glass_nav = "#ffffff", "#000000", "#ffffff", "rgba(255,255,255,1)"
-
-    anim_css = ""
-    if anim_type == "Fade Up":
-        anim_css = ".reveal { opacity: 0; transform: translateY(30px); transition: all 0.8s ease-out; } .reveal.active { opacity: 1; transform: translateY(0); }"
-    elif anim_type == "Zoom In":
-        anim_css = ".reveal { opacity: 0; transform: scale(0.95); transition: all 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.275); } .reveal.active { opacity: 1; transform: scale(1); }"
-    
-    # Hero Carousel CSS
-    hero_css = """
-    .hero { position: relative; min-height: 90vh; overflow: hidden; display: flex; align-items: center; justify-content: center; text-align: center; color: white; padding-top: 80px; background-color: var(--p); }
-    .carousel-slide { position: absolute; top: 0; left: 0; width: 100%; height: 100%; background-size: cover; background-position: center; opacity: 0; transition: opacity 1.5s ease-in-out; z-index: 0; }
-    .carousel-slide.active { opacity: 1; }
-    .hero-overlay { background: rgba(0,0,0,0.5); position: absolute; top: 0; left: 0; width: 100%; height: 100%; z-index: 1; }
-    .hero-content { z-index: 2; position: relative; animation: slideUp 1s ease-out; }
-    @keyframes slideUp { from { opacity:0; transform: translateY(30px); } to { opacity:1; transform: translateY(0); } }
-    """
-
-    return f"""
-    :root {{
-        --p: {p_color}; --s: {s_color}; --bg: {bg_color}; --txt: {text_color}; --card: {card_bg};
-        --radius: {border_rad}; --nav: {glass_nav};
-        --h-font: '{h_font}', sans-serif; --b-font: '{b_font}', sans-serif;
-    }}
-    * {{ box-sizing: border-box; }}
-    html {{ scroll-behavior: smooth; }}
-    body {{ background-color: var(--bg); color: var(--txt); font-family: var(--b-font); margin: 0; line-height: 1.6; overflow-x: hidden; }}
-    
-    p, h1, h2, h3, h4, h5, h6, span, li, div {{ color: inherit; }}
-    .legal-text {{ color: var(--txt) !important; }}
-    
-    h1, h2, h3, h4 {{ font-family: var(--h-font); color: var(--p); line-height: 1.1; margin-bottom: 1rem; }}
-    strong {{ color: var(--p); font-weight: 800; }}
-    
-    input, textarea, select {{ width: 100%; padding: 0.8rem; margin-bottom: 1rem; border: 1px solid #ccc; border-radius: 6px; font-family: inherit; }}
-    label {{ color: var(--txt); font-weight: bold; margin-bottom: 0.5rem; display: block; }}
-
-    .container {{ max-width: 1280px; margin: 0 auto; padding: 0 20px; }}
-    .btn {{ display: inline-block; padding: 1rem 2.5rem; border-radius: var(--radius); font-weight: 700; text-decoration: none; transition: 0.3s; text-transform: uppercase; letter-spacing: 0.5px; cursor: pointer; border: none; text-align: center; }}
-    .btn-primary {{ background: var(--p); color: white !important; }}
-    .btn-accent {{ background: var(--s); color: white !important; box-shadow: 0 10px 25px -5px var(--s); }}
-    .btn:hover {{ transform: translateY(-3px); filter: brightness(1.15); }}
-    
-    /* Nav */
-    nav {{ position: fixed; top: 0; width: 100%; z-index: 1000; background: var(--nav); backdrop-filter: blur(12px); border-bottom: 1px solid rgba(100,100,100,0.1); padding: 1rem 0; }}
-    .nav-flex {{ display: flex; justify-content: space-between; align-items: center; }}
-    .nav-links {{ display: flex; align-items: center; }}
-    .nav-links a {{ margin-left: 2rem; text-decoration: none; font-weight: 600; color: var(--txt); font-size: 0.9rem; opacity: 0.8; transition:0.2s; }}
-    .nav-links a:hover {{ opacity: 1; color: var(--s); }}
-    .mobile-menu {{ display: none; font-size: 1.5rem; cursor: pointer; }}
-    
-    {hero_css}
-    .hero h1 {{ color: white; font-size: clamp(2.5rem, 8vw, 5rem); margin-bottom: 1.5rem; }}
-    .hero p {{ color: rgba(255,255,255,0.9); font-size: clamp(1.1rem, 2vw, 1.5rem); max-width: 700px; margin: 0 auto 2.5rem auto; }}
-    
-    section {{ padding: 5rem 0; }}
-    .section-head {{ text-align: center; margin-bottom: 4rem; }}
-    .section-head h2 {{ font-size: 2.5rem; }}
-    
-    /* GRIDS */
-    .grid-3 {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; }}
-    .about-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: center; }}
-    
-    /* CONTACT PAGE GRID (MOBILE FIXED) */
-    .contact-grid {{ display: grid; grid-template-columns: 1fr 2fr; gap: 3rem; }}
-    
-    .card {{ background: var(--card); padding: 2rem; border-radius: var(--radius); border: 1px solid rgba(100,100,100,0.1); transition: 0.3s; height: 100%; display: flex; flex-direction: column; }}
-    .card:hover {{ transform: translateY(-5px); box-shadow: 0 20px 40px -10px rgba(0,0,0,0.1); border-color: var(--s); }}
-    
-    .prod-img {{ width: 100%; height: 250px; object-fit: cover; border-radius: calc(var(--radius) - 4px); margin-bottom: 1.5rem; background: #f1f5f9; }}
-    
-    /* PRICING TABLE */
-    .pricing-wrapper {{ overflow-x: auto; margin: 2rem 0; }}
-    .pricing-table {{ width: 100%; border-collapse: collapse; min-width: 600px; }}
-    .pricing-table th {{ background: var(--p); color: white; padding: 1.5rem; text-align: left; font-size: 1.1rem; }}
-    .pricing-table td {{ padding: 1.5rem; border-bottom: 1px solid rgba(100,100,100,0.1); background: var(--card); color: var(--txt); }}
-    .pricing-table tr:last-child td {{ font-weight: bold; font-size: 1.2rem; background: rgba(var(--s), 0.1); border-bottom: none; }}
-
-    /* FAQ */
-    details {{ background: var(--card); border: 1px solid rgba(100,100,100,0.1); border-radius: 8px; margin-bottom: 1rem; padding: 1rem; cursor: pointer; color: var(--txt); }}
-    details summary {{ font-weight: bold; font-size: 1.1rem; color: var(--txt); }}
-    details p {{ margin-top: 1rem; margin-bottom: 0; opacity: 0.9; color: var(--txt); }}
-
-    /* Footer & Social */
-    footer {{ background: var(--p); color: white; padding: 4rem 0; margin-top: auto; }}
-    .footer-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 3rem; }}
-    .footer a, footer a {{ color: rgba(255,255,255,0.8) !important; text-decoration: none; display: block; margin-bottom: 0.5rem; transition: 0.3s; }}
-    .footer a:hover, footer a:hover {{ color: #ffffff !important; text-decoration: underline; }}
-    .social-icon {{ width: 24px; height: 24px; fill: rgba(255,255,255,0.7); transition: 0.3s; }}
-    .social-icon:hover {{ fill: #ffffff; transform: scale(1.1); }}
-
-    /* Detail View */
-    .detail-view {{ display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: start; }}
-    
-    /* BLOG STYLES */
-    .blog-badge {{ background: var(--s); color: white; padding: 0.3rem 0.8rem; border-radius: 50px; font-size: 0.75rem; text-transform: uppercase; font-weight: bold; width: fit-content; margin-bottom: 1rem; display:inline-block; }}
-    .article-content ul {{ padding-left: 1.5rem; margin-bottom: 1.5rem; }}
-    .article-content li {{ margin-bottom: 0.5rem; }}
-    .article-content p {{ margin-bottom: 1.5rem; font-size: 1.1rem; opacity: 0.9; line-height: 1.8; }}
-    
-    /* SOCIAL SHARE BAR STYLES (NEW) */
-    .share-row {{ display: flex; gap: 0.8rem; margin-top: 2rem; align-items: center; flex-wrap: wrap; }}
-    .share-label {{ font-weight: bold; margin-right: 0.5rem; font-size: 0.9rem; opacity: 0.8; }}
-    .share-btn {{ width: 40px; height: 40px; display: flex; align-items: center; justify-content: center; border-radius: 50%; color: white; transition: 0.3s; border: none; cursor: pointer; text-decoration: none; }}
-    .share-btn:hover {{ transform: translateY(-3px); filter: brightness(1.1); }}
-    .share-btn svg {{ width: 18px; height: 18px; fill: white; }}
-    .bg-fb {{ background: #1877F2; }}
-    .bg-x {{ background: #000000; }}
-    .bg-li {{ background: #0A66C2; }}
-    .bg-link {{ background: #64748b; }}
-    
-    {anim_css}
-    
-    /* MOBILE OPTIMIZATIONS */
-    @media (max-width: 768px) {{
-        .nav-links {{ 
-            position: fixed; top: 70px; left: -100%; width: 100%; height: calc(100vh - 70px); 
-            background: var(--bg); flex-direction: column; padding: 2rem; transition: 0.3s; 
-            align-items: flex-start; justify-content: flex-start;
-            border-top: 1px solid rgba(0,0,0,0.1);
-        }}
-        .nav-links.active {{ left: 0; }}
-        .nav-links a {{ margin-left: 0; margin-bottom: 1.5rem; font-size: 1.1rem; }}
-        .mobile-menu {{ display: block; }}
-        
-        .hero {{ min-height: 70vh; }}
-        .about-grid {{ grid-template-columns: 1fr !important; gap: 2rem; text-align: left; }}
-        .about-grid img {{ order: 2; margin-top: 1rem; }}
-        .about-grid div {{ order: 1; }}
-        
-        /* FIX: FORCE CONTACT GRID TO 1 COLUMN ON MOBILE */
-        .contact-grid {{ grid-template-columns: 1fr; gap: 2rem; }}
-        .detail-view {{ grid-template-columns: 1fr; gap: 2rem; }}
-    }}
-    """
-
-def gen_nav():
-    logo_display = f'<img src="{logo_url}" height="40" alt="{biz_name} Logo">' if logo_url else f'<span style="font-weight:900; font-size:1.5rem; color:var(--p)">{biz_name}</span>'
-    blog_link = '<a href="blog.html" onclick="document.querySelector(\'.nav-links\').classList.remove(\'active\')">Blog</a>' if show_blog else ''
-    
-    return f"""
-    <nav><div class="container nav-flex">
-        <a href="index.html" style="text-decoration:none">{logo_display}</a>
-        <div class="mobile-menu" onclick="document.querySelector('.nav-links').classList.toggle('active')">☰</div>
-        <div class="nav-links">
-            <a href="index.html" onclick="document.querySelector('.nav-links').classList.remove('active')">Home</a>
-            {'<a href="index.html#features" onclick="document.querySelector(\'.nav-links\').classList.remove(\'active\')">Features</a>' if show_features else ''}
-            {'<a href="index.html#pricing" onclick="document.querySelector(\'.nav-links\').classList.remove(\'active\')">Savings</a>' if show_pricing else ''}
-            {'<a href="index.html#inventory" onclick="document.querySelector(\'.nav-links\').classList.remove(\'active\')">Portfolio</a>' if show_inventory else ''}
-            {blog_link}
-            <a href="about.html" onclick="document.querySelector('.nav-links').classList.remove('active')">About</a>
-            <a href="contact.html" onclick="document.querySelector('.nav-links').classList.remove('active')">Contact</a>
-            <a href="tel:{biz_phone}" class="btn-accent" style="padding:0.6rem 1.5rem; margin-left:1.5rem; margin-bottom:0; border-radius:50px; color:white !important;">Call Now</a>
-        </div>
-    </div></nav>
-    """
+    l1.text_area("Privacy Policy Text", DEFAULTS.priv_txt, height=200, key="priv_txt")
+    l2.text_area("Terms of Service Text", DEFAULTS.term_txt, height=200, key="term_txt")
 
-def gen_hero():
-    return f"""
-    <section class="hero">
-        <div class="hero-overlay"></div>
-        <div class="carousel-slide active" style="background-image: url('{hero_img_1}')"></div>
-        <div class="carousel-slide" style="background-image: url('{hero_img_2}')"></div>
-        <div class="carousel-slide" style="background-image: url('{hero_img_3}')"></div>
-        
-        <div class="container hero-content">
-            <h1>{hero_h}</h1>
-            <p>{hero_sub}</p>
-            <div style="display:flex; gap:1rem; justify-content:center; flex-wrap:wrap;">
-                <a href="#inventory" class="btn btn-accent">Explore Now</a>
-                <a href="contact.html" class="btn" style="background:rgba(255,255,255,0.2); backdrop-filter:blur(10px); color:white;">Contact Us</a>
-            </div>
-        </div>
-    </section>
-    <script>
-        let slides = document.querySelectorAll('.carousel-slide');
-        let currentSlide = 0;
-        setInterval(() => {{
-            slides[currentSlide].classList.remove('active');
-            currentSlide = (currentSlide + 1) % slides.length;
-            slides[currentSlide].classList.add('active');
-        }}, 4000);
-    </script>
-    """
-
-def get_simple_icon(name):
-    name = name.lower().strip()
-    if "code" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M9.4 16.6L4.8 12l4.6-4.6L8 6l-6 6 6 6 1.4-1.4zm5.2 0l4.6-4.6-4.6-4.6L16 6l6 6-6 6-1.4-1.4z"/></svg>'
-    if "database" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-6h2v6zm0-8h-2V7h2v2z"/></svg>'
-    if "layers" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M11.99 18.54l-7.37-5.73L3 14.07l9 7 9-7-1.63-1.27-7.38 5.74zM12 16l7.36-5.73L21 9l-9-7-9 7 1.63 1.27L12 16z"/></svg>'
-    if "truck" in name or "logistics" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M20 8h-3V4H3c-1.1 0-2 .9-2 2v11h2c0 1.66 1.34 3 3 3s3-1.34 3-3h6c0 1.66 1.34 3 3 3s3-1.34 3-3h2v-5l-3-4zM6 18.5c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5zm13.5-9l1.96 2.5H17V9.5h2.5zm-1.5 9c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5z"/></svg>'
-    if "shield" in name or "secure" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M12 1L3 5v6c0 5.55 3.84 10.74 9 12 5.16-1.26 9-6.45 9-12V5l-9-4zm0 10.99h7c-.53 4.12-3.28 7.79-7 8.94V12H5V6.3l7-3.11v8.8z"/></svg>'
-    if "hammer" in name or "build" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M22.11 11.26l-1.41-1.41c-.55-.56-1.43-.6-2.03-.1L15 6.6V3c0-.55-.45-1-1-1H9c-.55 0-1 .45-1 1v7h2v-2h2v4l-6.88 5.73c-.78.65-1.95.65-2.73 0-.78-.65-.78-1.71 0-2.36L8.53 10.2l-1.27-1.27c-.78-.78-.78-2.05 0-2.83.78-.78 2.05-.78 2.83 0l1.27 1.27 5.14-4.28c.15-.12.33-.19.51-.19.18 0 .37.07.51.19l1.41 1.41c.29.29.29.77 0 1.06L14 10.53l6.59 5.49c1.56-1.56 1.56-4.09 1.52-4.76z"/></svg>'
-    if "water" in name or "plumb" in name or "drop" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M12 22c4.97 0 9-4.03 9-9 0-4.97-9-13-9-13S3 8.03 3 13c0 4.97 4.03 9 9 9zm0-11c1.66 0 3 1.34 3 3s-1.34 3-3 3-3-1.34-3-3 1.34-3 3-3z"/></svg>'
-    if "home" in name or "roof" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z"/></svg>'
-    if "bolt" in name or "electric" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M11 21h-1l1-7H7.5c-.58 0-.57-.32-.38-.66.19-.34.05-.08.07-.12C8.48 10.94 10.42 7.54 13 3h1l-1 7h3.5c.49 0 .56.33.47.51l-.07.15C12.96 17.55 11 21 11 21z"/></svg>'
-    if "star" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M12 17.27L18.18 21l-1.64-7.03L22 9.24l-7.19-.61L12 2 9.19 8.63 2 9.24l5.46 4.73L5.82 21z"/></svg>'
-    if "heart" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M12 21.35l-1.45-1.32C5.4 15.36 2 12.28 2 8.5 2 5.42 4.42 3 7.5 3c1.74 0 3.41.81 4.5 2.09C13.09 3.81 14.76 3 16.5 3 19.58 3 22 5.42 22 8.5c0 3.78-3.4 6.86-8.55 11.54L12 21.35z"/></svg>'
-    if "wallet" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M21 18v1c0 1.1-.9 2-2 2H5c-1.11 0-2-.9-2-2V5c0-1.1.89-2 2-2h14c1.1 0 2 .9 2 2v1h-9c-1.11 0-2 .9-2 2v8c0 1.1.89 2 2 2h9zm-9-2h10V8H12v8zm4-2.5c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5z"/></svg>'
-    if "table" in name: return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M19 3H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zM5 19V5h14v14H5zm2-2h10v-2H7v2zm0-4h10v-2H7v2zm0-4h10V7H7v2z"/></svg>'
-    return '<svg viewBox="0 0 24 24" width="32" height="32" fill="currentColor"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"/></svg>'
-
-def gen_features():
-    cards = ""
-    lines = [x for x in feat_data.split('\n') if x.strip()]
-    for line in lines:
-        if "|" in line:
-            parts = line.split('|')
-            if len(parts) >= 3:
-                icon_code = get_simple_icon(parts[0])
-                title = parts[1].strip()
-                desc = parts[2].strip()
-                cards += f"""<div class="card reveal"><div style="color:var(--s); margin-bottom:1rem;">{icon_code}</div><h3 style="color:var(--p); font-size:1.2rem; text-transform:uppercase; letter-spacing:1px;">{title}</h3><div style="opacity:0.9; color:var(--txt); font-size:0.95rem;">{format_text(desc)}</div></div>"""
-            elif len(parts) == 2:
-                title = parts[0].strip()
-                desc = parts[1].strip()
-                cards += f"""<div class="card reveal"><h3 style="color:var(--s); font-size:1.2rem; text-transform:uppercase; letter-spacing:1px;">{title}</h3><div style="opacity:0.9; color:var(--txt); font-size:0.95rem;">{format_text(desc)}</div></div>"""
-    return f"""<section id="features"><div class="container"><div class="section-head reveal"><h2>{f_title}</h2></div><div class="grid-3">{cards}</div></div></section>"""
-
-def gen_stats():
-    return f"""
-    <div style="background:var(--p); color:white; padding:3rem 0; text-align:center;">
-        <div class="container grid-3">
-            <div class="reveal">
-                <h3 style="color:#ffffff; margin:0; font-size:3rem;">{stat_1}</h3>
-                <p style="color:rgba(255,255,255,0.8); margin:0;">{label_1}</p>
-            </div>
-            <div class="reveal">
-                <h3 style="color:#ffffff; margin:0; font-size:3rem;">{stat_2}</h3>
-                <p style="color:rgba(255,255,255,0.8); margin:0;">{label_2}</p>
-            </div>
-            <div class="reveal">
-                <h3 style="color:#ffffff; margin:0; font-size:3rem;">{stat_3}</h3>
-                <p style="color:rgba(255,255,255,0.8); margin:0;">{label_3}</p>
-            </div>
-        </div>
-    </div>
-    """
-
-def gen_pricing_table():
-    if not show_pricing: return ""
-    return f"""
-    <section id="pricing"><div class="container">
-        <div class="section-head reveal"><h2>The Cost of Ownership</h2><p>See how the "Monthly Trap" adds up over 5 years.</p></div>
-        <div class="pricing-wrapper reveal">
-            <table class="pricing-table">
-                <thead>
-                    <tr><th style="width:40%">Expense Category</th><th style="background:var(--s); font-size:1.2rem;">Titan Engine (Us)</th><th>{wix_name}</th><th>Standard Agency</th></tr>
-                </thead>
-                <tbody>
-                    <tr><td>Initial Setup Fee</td><td><strong>{titan_price}</strong> (One-time)</td><td>$0 (DIY)</td><td>$2,000+</td></tr>
-                    <tr><td>Annual Hosting Costs</td><td><strong>{titan_mo}</strong></td><td>{wix_mo} ($348/yr)</td><td>$600/yr</td></tr>
-                    <tr><td>SSL & Security</td><td>$0 (Included)</td><td>$0 (Included)</td><td>$100/yr</td></tr>
-                    <tr><td><strong>Your 5-Year Savings</strong></td><td style="color:var(--s); font-size:1.3rem;">You Save {save_val}</td><td>$0</td><td>$0</td></tr>
-                </tbody>
-            </table>
-        </div>
-        <p style="text-align:center; font-size:0.8rem; opacity:0.6; margin-top:1rem;">*Comparison pricing based on standard public rates. Titan Engine is not affiliated with competitor trademarks.</p>
-    </div></section>
-    """
-
-def gen_csv_parser():
-    return """
-    <script>
-    function parseCSVLine(str) {
-        const res = [];
-        let cur = '';
-        let inQuote = false;
-        for (let i = 0; i < str.length; i++) {
-            const c = str[i];
-            if (c === '"') {
-                if (inQuote && str[i+1] === '"') { cur += '"'; i++; }
-                else { inQuote = !inQuote; }
-            } else if (c === ',' && !inQuote) {
-                res.push(cur.trim()); cur = '';
-            } else { cur += c; }
-        }
-        res.push(cur.trim());
-        return res;
-    }
-    // Markdown Parser
-    function parseMarkdown(text) {
-        if (!text) return '';
-        let html = text
-            .replace(/\\r\\n/g, '\\n')
-            .replace(/\\n/g, '<br>')
-            .replace(/\\*\\*(.*?)\\*\\*/g, '<strong>$1</strong>')
-            .replace(/\\*(.*?)\\*/g, '<em>$1</em>');
-        
-        if (html.includes('* ')) {
-            const lines = html.split('<br>');
-            let inList = false;
-            let finalHtml = '';
-            lines.forEach(line => {
-                if (line.trim().startsWith('* ')) {
-                    if (!inList) { finalHtml += '<ul>'; inList = true; }
-                    finalHtml += '<li>' + line.trim().substring(2) + '</li>';
-                } else {
-                    if (inList) { finalHtml += '</ul>'; inList = false; }
-                    finalHtml += line + '<br>';
-                }
-            });
-            if (inList) finalHtml += '</ul>';
-            return finalHtml;
-        }
-        return html;
-    }
-    </script>
-    """
-
-def gen_inventory_js(is_demo=False):
-    demo_flag = "const isDemo = true;" if is_demo else "const isDemo = false;"
-    
-    return f"""
-    {gen_csv_parser()}
-    <script>
-    {demo_flag}
-    
-    async function loadInv() {{
-        try {{
-            const res = await fetch('{sheet_url}');
-            const txt = await res.text();
-            const lines = txt.split(/\\r\\n|\\n/);
-            const box = document.getElementById('inv-grid');
-            if(!box) return;
-            box.innerHTML = '';
-            for(let i=1; i<lines.length; i++) {{
-                if(!lines[i].trim()) continue;
-                const clean = parseCSVLine(lines[i]);
-                let img = clean[3] && clean[3].length > 5 ? clean[3] : '{custom_feat}'; 
-                if(clean[6] && clean[6].length > 5) img = clean[6];
-                if(clean.length > 1) {{
-                    const prodName = encodeURIComponent(clean[0]);
-                    box.innerHTML += `
-                    <div class="card reveal" style="color: var(--txt);">
-                        <img src="${{img}}" class="prod-img" loading="lazy" alt="${{clean[0]}}" onerror="this.onerror=null;this.src='{custom_feat}';">
-                        <div style="flex-grow:1; display:flex; flex-direction:column; justify-content:space-between;">
-                            <div>
-                                <h3 style="color:var(--p);">${{clean[0]}}</h3>
-                                <p style="font-weight:bold; color:var(--s); font-size:1.1rem;">${{clean[1]}}</p>
-                                <p style="font-size:0.9rem; opacity:0.9; margin-bottom:1rem; color:var(--txt);">${{clean[2] ? clean[2].substring(0,60)+'...' : ''}}</p>
-                            </div>
-                            <div style="display:grid; grid-template-columns:1fr 1fr; gap:0.5rem;">
-                                <a href="product.html?item=${{prodName}}" class="btn" style="background:#e2e8f0; color:#0f172a !important; padding:0.8rem; font-size:0.8rem;">View Details</a>
-                                <a href="https://wa.me/{wa_num}?text=I am interested in ${{prodName}}" target="_blank" class="btn-primary btn" style="padding:0.8rem; font-size:0.8rem;">WhatsApp</a>
-                            </div>
-                        </div>
-                    </div>`;
-                }}
-            }}
-        }} catch(e) {{ console.log(e); }}
-    }}
-    if(document.getElementById('inv-grid')) window.addEventListener('load', loadInv);
-    </script>
-    """
-
-def gen_inventory():
-    if not show_inventory: return ""
-    return f"""
-    <section id="inventory" style="background:rgba(0,0,0,0.02)"><div class="container">
-        <div class="section-head reveal"><h2>Portfolio / Templates</h2><p>Choose a foundation. We customize it for you.</p></div>
-        <div id="inv-grid" class="grid-3"><div style="grid-column:1/-1; text-align:center; padding:4rem; color:var(--s);">Loading Database...</div></div>
-    </div></section>
-    {gen_inventory_js(is_demo=False)}
-    """
-
-def gen_about_section():
-    formatted_about = format_text(about_short)
-    return f"""
-    <section id="about"><div class="container">
-        <div class="about-grid">
-            <div class="reveal">
-                <h2 style="font-size:2.5rem; margin-bottom:1.5rem;">{about_h}</h2>
-                <div style="font-size:1.1rem; opacity:0.9; margin-bottom:2rem; color:var(--txt);">{formatted_about}</div>
-                <a href="about.html" class="btn btn-primary" style="padding: 0.8rem 2rem; font-size:0.9rem;">Read Our Full Story</a>
-            </div>
-            <img src="{about_img}" class="reveal" loading="lazy" alt="About {biz_name}" style="width:100%; border-radius:var(--radius); box-shadow:0 20px 50px -20px rgba(0,0,0,0.2); aspect-ratio:4/3; object-fit:cover;">
-        </div>
-    </div></section>
-    """
-
-def gen_faq_section():
-    items = ""
-    for line in faq_data.split('\n'):
-        if "?" in line and not line.strip() == "":
-            parts = line.split('?', 1)
-            if len(parts) == 2:
-                q = parts[0].strip() + "?"
-                a = parts[1].replace("?", "").strip()
-                items += f"<details class='reveal'><summary>{q}</summary><p>{a}</p></details>"
-    return f"""<section id="faq" style="background:rgba(0,0,0,0.02)"><div class="container" style="max-width:800px;"><div class="section-head reveal"><h2>Frequently Asked Questions</h2></div>{items}</div></section>"""
-
-def gen_footer():
-    icons = ""
-    if fb_link: icons += f'<a href="{fb_link}" target="_blank" aria-label="Facebook"><svg class="social-icon" viewBox="0 0 24 24"><path d="M18 2h-3a5 5 0 0 0-5 5v3H7v4h3v8h4v-8h3l1-4h-4V7a1 1 0 0 1 1-1h3z"></path></svg></a>'
-    if ig_link: icons += f'<a href="{ig_link}" target="_blank" aria-label="Instagram"><svg class="social-icon" viewBox="0 0 24 24"><path d="M16.98 0a6.9 6.9 0 0 1 5.08 1.98A6.94 6.94 0 0 1 24 7.02v9.96c0 2.08-.68 3.87-1.98 5.13A7.14 7.14 0 0 1 16.94 24H7.06a7.06 7.06 0 0 1-5.03-1.89A6.96 6.96 0 0 1 0 16.94V7.02C0 2.8 2.8 0 7.02 0h9.96zM7.17 2.1c-1.4 0-2.6.48-3.46 1.33c-.85.85-1.33 2.06-1.33 3.46v10.3c0 1.3.47 2.5 1.33 3.36c.86.85 2.06 1.33 3.46 1.33h9.66c1.4 0 2.6-.48 3.46-1.33c.85-.85 1.33-2.06 1.33-3.46V6.89c0-1.4-.47-2.6-1.33-3.46c-.86-.85-2.06-1.33-3.46-1.33H7.17zm11.97 3.33c.77 0 1.4.63 1.4 1.4c0 .77-.63 1.4-1.4 1.4c-.77 0-1.4-.63-1.4-1.4c0-.77.63-1.4 1.4-1.4zM12 5.76c3.39 0 6.14 2.75 6.14 6.14c0 3.39-2.75 6.14-6.14 6.14c-3.39 0-6.14-2.75-6.14-6.14c0-3.39 2.75-6.14 6.14-6.14zm0 2.1c-2.2 0-3.99 1.79-3.99 4.04c0 2.25 1.79 4.04 3.99 4.04c2.2 0 3.99-1.79 3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04z"/></svg></a>'
-    if x_link: icons += f'<a href="{x_link}" target="_blank" aria-label="X (Twitter)"><svg class="social-icon" viewBox="0 0 24 24"><path d="M18.901 1.153h3.68l-8.04 9.19L24 22.846h-7.406l-5.8-7.584l-6.638 7.584H.474l8.6-9.83L0 1.154h7.594l5.243 6.932ZM17.61 20.644h2.039L6.486 3.24H4.298Z"></path></svg></a>'
-    if li_link: icons += f'<a href="{li_link}" target="_blank" aria-label="LinkedIn"><svg class="social-icon" viewBox="0 0 24 24"><path d="M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2a2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6zM2 9h4v12H2zM4 2a2 2 0 1 1-2 2a2 2 0 0 1 2-2z"></path></svg></a>'
-    if yt_link: icons += f'<a href="{yt_link}" target="_blank" aria-label="YouTube"><svg class="social-icon" viewBox="0 0 24 24"><path d="M23.498 6.186a3.016 3.016 0 0 0-2.122-2.136C19.505 3.545 12 3.545 12 3.545s-7.505 0-9.377.505A3.017 3.017 0 0 0 .502 6.186C0 8.07 0 12 0 12s0 3.93.502 5.814a3.016 3.016 0 0 0 2.122 2.136c1.871.505 9.376.505 9.376.505s7.505 0 9.377-.505a3.015 3.015 0 0 0 2.122-2.136C24 15.93 24 12 24 12s0-3.93-.502-5.814zM9.545 15.568V8.432L15.818 12l-6.273 3.568z"/></svg></a>'
-
-    return f"""
-    <footer><div class="container">
-        <div class="footer-grid">
-            <div>
-                <h3 style="color:white; margin-bottom:1.5rem;">{biz_name}</h3>
-                <p style="opacity:0.8; font-size:0.9rem;">{biz_addr}</p>
-                <p style="opacity:0.8; font-size:0.9rem; margin-top:1rem;">{biz_email}</p>
-                <p style="opacity:0.6; font-size:0.8rem; margin-top:1rem;">Serving: {seo_area}</p>
-                <div style="margin-top:1.5rem; display:flex; gap:1.2rem; align-items:center;">
-                    {icons}
-                </div>
-            </div>
-            <div>
-                <h4 style="color:white; font-size:0.9rem; text-transform:uppercase; letter-spacing:1px; margin-bottom:1.5rem;">Explore</h4>
-                <a href="index.html">Home</a>
-                <a href="blog.html">Blog</a>
-                <a href="about.html">About Us</a>
-                <a href="contact.html">Contact</a>
-            </div>
-            <div>
-                <h4 style="color:white; font-size:0.9rem; text-transform:uppercase; letter-spacing:1px; margin-bottom:1.5rem;">Legal</h4>
-                <a href="privacy.html">Privacy Policy</a>
-                <a href="terms.html">Terms of Service</a>
-            </div>
-        </div>
-        <div style="border-top:1px solid rgba(255,255,255,0.1); margin-top:3rem; padding-top:2rem; text-align:center; opacity:0.4; font-size:0.8rem;">
-            &copy; <a href="https://www.kaydiemscriptlab.com/" target="_blank" style="display:inline; color:white;">Kaydiem Script Lab</a>. Powered by Titan Engine.
-        </div>
-    </div></footer>
-    """
-
-def gen_wa_widget():
-    if not wa_num: return ""
-    return f"""<a href="https://wa.me/{wa_num}" class="wa-float" target="_blank" aria-label="Chat on WhatsApp" style="position:fixed; bottom:30px; right:30px; background:#25d366; color:white; width:60px; height:60px; border-radius:50%; display:flex; align-items:center; justify-content:center; box-shadow:0 10px 30px rgba(37,211,102,0.4); z-index:9999;"><svg style="width:32px;height:32px" viewBox="0 0 24 24"><path fill="currentColor" d="M12.04 2c-5.46 0-9.91 4.45-9.91 9.91c0 1.75.46 3.45 1.32 4.95L2.05 22l5.25-1.38c1.45.79 3.08 1.21 4.74 1.21c5.46 0 9.91-4.45 9.91-9.91c0-2.65-1.03-5.14-2.9-7.01A9.816 9.816 0 0 0 12.04 2m.01 1.67c2.2 0 4.26.86 5.82 2.42a8.225 8.225 0 0 1 2.41 5.83c0 4.54-3.7 8.23-8.24 8.23c-1.48 0-2.93-.39-4.19-1.15l-.3-.17l-3.12.82l.83-3.04l-.2-.32a8.188 8.188 0 0 1-1.26-4.38c.01-4.54 3.7-8.24 8.25-8.24m-3.53 3.16c-.13 0-.35.05-.54.26c-.19.2-.72.7-.72 1.72s.73 2.01.83 2.14c.1.13 1.44 2.19 3.48 3.07c.49.21.87.33 1.16.43c.49.16.94.13 1.29.08c.4-.06 1.21-.5 1.38-.98c.17-.48.17-.89.12-.98c-.05-.09-.18-.13-.37-.23c-.19-.1-.1.13-.1.13s-1.13-.56-1.32-.66c-.19-.1-.32-.15-.45.05c-.13.2-.51.65-.62.78c-.11.13-.23.15-.42.05c-.19-.1-.8-.3-1.53-.94c-.57-.5-1.02-1.12-1.21-1.45c-.11-.19-.01-.29.09-.38c.09-.08.19-.23.29-.34c.1-.11.13-.19.19-.32c.06-.13.03-.24-.01-.34c-.05-.1-.45-1.08-.62-1.48c-.16-.4-.36-.34-.51-.35c-.11-.01-.25-.01-.4-.01Z"/></svg></a>"""
-
-def gen_scripts():
-    return """
-    <script>
-    window.addEventListener('scroll', () => {
-        var reveals = document.querySelectorAll('.reveal');
-        for (var i = 0; i < reveals.length; i++) {
-            var windowHeight = window.innerHeight;
-            var elementTop = reveals[i].getBoundingClientRect().top;
-            var elementVisible = 150;
-            if (elementTop < windowHeight - elementVisible) { reveals[i].classList.add('active'); }
-        }
-    });
-    window.dispatchEvent(new Event('scroll'));
-    </script>
-    """
-
-def build_page(title, content, extra_js=""):
-    css = get_theme_css()
-    meta_tags = f'<meta name="description" content="{seo_d}">'
-    if gsc_tag: meta_tags += f'\n<meta name="google-site-verification" content="{gsc_tag}">'
-    if og_image: meta_tags += f'\n<meta property="og:image" content="{og_image}">'
-    
-    analytics = ""
-    if ga_tag:
-        analytics = f"""<script async src="https://www.googletagmanager.com/gtag/js?id={ga_tag}"></script>
-        <script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}gtag('js',new Date());gtag('config','{ga_tag}');</script>"""
-
-    return f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{title} | {biz_name}</title>
-        {meta_tags}
-        {gen_schema()}
-        <link href="https://fonts.googleapis.com/css2?family={h_font.replace(' ', '+')}:wght@400;700;900&family={b_font.replace(' ', '+')}:wght@300;400;600&display=swap" rel="stylesheet">
-        <style>{css}</style>
-        {analytics}
-    </head>
-    <body>
-        {gen_nav()}
-        {content}
-        {gen_footer()}
-        {gen_wa_widget()}
-        {gen_scripts()}
-        {extra_js}
-    </body>
-    </html>
-    """
+with tabs[0]:
+    identity_tab()
+with tabs[1]:
+    content_tab()
+with tabs[2]:
+    pricing_tab()
+with tabs[3]:
+    inventory_tab()
+with tabs[4]:
+    blog_tab()
+with tabs[5]:
+    legal_tab()
 
-# --- 404 & PRODUCTS ---
-def gen_404_content():
-    return f"""<section class="hero" style="min-height:70vh;"><div class="container"><h1 style="font-size:6rem; margin:0;">404</h1><p>Page Not Found</p><br><a href="index.html" class="btn btn-accent">Return Home</a></div></section>"""
+# --- 5. COMPILER CONFIG ---
+# Every builder widget is keyed by its SiteConfig field, so the config can be
+# rebuilt from session state by any fragment without a full script rerun.
+CONFIG_FIELDS = [f.name for f in dataclasses.fields(SiteConfig) if f.name != "images"]
 
-# --- MODIFIED: gen_product_page_content with Social Shares ---
-def gen_product_page_content(is_demo=False):
-    demo_flag = "const isDemo = true;" if is_demo else "const isDemo = false;"
-    return f"""
-    <section style="padding-top:150px;"><div class="container"><div id="product-detail" class="detail-view">
-        <div style="background:#eee; height:400px; border-radius:12px;"></div><div>Loading...</div>
-    </div></div></section>
-    {gen_csv_parser()}
-    <script>
-    {demo_flag}
-    function shareWA(url, title) {{ window.open('https://wa.me/?text=' + encodeURIComponent(title + ' ' + url), '_blank'); }}
-    async function loadProduct() {{
-        const params = new URLSearchParams(window.location.search);
-        let targetName = params.get('item');
-        if(isDemo && !targetName) targetName = "Demo Item";
-        try {{
-            const res = await fetch('{sheet_url}');
-            const txt = await res.text();
-            const lines = txt.split(/\\r\\n|\\n/);
-            for(let i=1; i<lines.length; i++) {{
-                const clean = parseCSVLine(lines[i]);
-                if(isDemo) targetName = clean[0];
-                if(clean[0] === targetName) {{
-                    let img = clean[3] || '{custom_feat}';
-                    const shareUrl = encodeURIComponent(window.location.href);
-                    const shareTitle = encodeURIComponent(clean[0]);
-                    
-                    document.getElementById('product-detail').innerHTML = `
-                        <img src="${{img}}" style="width:100%; border-radius:12px;">
-                        <div>
-                            <h1 style="font-size:3rem; line-height:1.1;">${{clean[0]}}</h1>
-                            <p style="font-size:1.5rem; color:var(--s); font-weight:bold; margin-bottom:1.5rem;">${{clean[1]}}</p>
-                            <p>${{clean[2]}}</p>
-                            <button onclick="shareWA(window.location.href, '${{clean[0]}}')" class="btn btn-primary" style="width:100%; margin-top:2rem;">Share on WhatsApp</button>
-                            
-                            <!-- SOCIAL SHARE ROW -->
-                            <div class="share-row">
-                                <span class="share-label">Share This:</span>
-                                <a href="https://www.facebook.com/sharer/sharer.php?u=${{shareUrl}}" target="_blank" class="share-btn bg-fb"><svg viewBox="0 0 24 24"><path d="M18 2h-3a5 5 0 0 0-5 5v3H7v4h3v8h4v-8h3l1-4h-4V7a1 1 0 0 1 1-1h3z"></path></svg></a>
-                                <a href="https://twitter.com/intent/tweet?url=${{shareUrl}}&text=${{shareTitle}}" target="_blank" class="share-btn bg-x"><svg viewBox="0 0 24 24"><path d="M18.901 1.153h3.68l-8.04 9.19L24 22.846h-7.406l-5.8-7.584l-6.638 7.584H.474l8.6-9.83L0 1.154h7.594l5.243 6.932ZM17.61 20.644h2.039L6.486 3.24H4.298Z"></path></svg></a>
-                                <a href="https://www.linkedin.com/sharing/share-offsite/?url=${{shareUrl}}" target="_blank" class="share-btn bg-li"><svg viewBox="0 0 24 24"><path d="M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2a2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6zM2 9h4v12H2zM4 2a2 2 0 1 1-2 2a2 2 0 0 1 2-2z"></path></svg></a>
-                                <button onclick="navigator.clipboard.writeText(window.location.href);alert('Link Copied!')" class="share-btn bg-link" title="Copy Link"><svg viewBox="0 0 24 24"><path d="M3.9 12c0-1.71 1.39-3.1 3.1-3.1h4V7H7c-2.76 0-5 2.24-5 5s2.24 5 5 5h4v-1.9H7c-1.71 0-3.1-1.39-3.1-3.1zM8 13h8v-2H8v2zm9-6h-4v1.9h4c1.71 0 3.1 1.39 3.1 3.1s-1.39 3.1-3.1 3.1h-4V17h4c2.76 0 5-2.24 5-5s-2.24-5-5-5z"></path></svg></button>
-                            </div>
-                        </div>
-                    `;
-                    break;
-                }}
-            }}
-        }} catch(e) {{}}
-    }}
-    loadProduct();
-    </script>
-    """
+def image_library():
+    """Uploaded images through the image stage: [(ImageMeta, {path: bytes}), ...].
 
-# --- BLOG GENERATION LOGIC ---
-def gen_blog_index_html():
-    return f"""
-    <section class="hero" style="min-height:40vh; background-image: linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{hero_img_1}'); background-size: cover; background-position: center;">
-        <div class="container"><h1>{blog_hero_title}</h1><p>{blog_hero_sub}</p></div>
-    </section>
-    <section>
-        <div class="container">
-            <div id="blog-grid" class="grid-3">
-                <div style="text-align:center; grid-column:1/-1;">Loading Articles...</div>
-            </div>
-        </div>
-    </section>
-    {gen_csv_parser()}
-    <script>
-    async function loadBlog() {{
-        try {{
-            const res = await fetch('{blog_sheet_url}');
-            const txt = await res.text();
-            const lines = txt.split(/\\r\\n|\\n/);
-            const box = document.getElementById('blog-grid');
-            if(!box) return;
-            box.innerHTML = '';
-            for(let i=1; i<lines.length; i++) {{
-                if(!lines[i].trim()) continue;
-                const r = parseCSVLine(lines[i]);
-                if(r.length > 4) {{
-                    box.innerHTML += `
-                    <div class="card reveal">
-                        <img src="${{r[5] || '{hero_img_1}'}}" class="prod-img" alt="${{r[1]}}">
-                        <div>
-                            <span class="blog-badge">${{r[3]}}</span>
-                            <span style="float:right; font-size:0.8rem; opacity:0.7;">${{r[2]}}</span>
-                            <h3 style="margin-top:0.5rem; color:var(--p);"><a href="post.html?id=${{r[0]}}" style="text-decoration:none; color:inherit;">${{r[1]}}</a></h3>
-                            <p style="font-size:0.95rem; opacity:0.8;">${{r[4]}}</p>
-                            <a href="post.html?id=${{r[0]}}" style="color:var(--s); font-weight:bold; text-decoration:none;">Read Article &rarr;</a>
-                        </div>
-                    </div>`;
-                }}
-            }}
-        }} catch(e) {{ console.log(e); }}
-    }}
-    window.addEventListener('load', loadBlog);
-    </script>
+    Kept in session state by upload file_id, so an upload is processed (and its bytes hashed) once.
     """
-
-# --- MODIFIED: gen_blog_post_html with Social Shares ---
-def gen_blog_post_html():
-    return f"""
-    <div id="post-container" style="padding-top:100px; min-height:60vh;">
-        <div class="container" style="text-align:center; padding:5rem 0;">
-            <h1>Loading Article...</h1>
-        </div>
-    </div>
-    
-    {gen_csv_parser()}
-    <script>
-    async function loadPost() {{
-        const params = new URLSearchParams(window.location.search);
-        const slug = params.get('id');
-        if(!slug) {{ window.location.href = 'blog.html'; return; }}
-        
-        try {{
-            const res = await fetch('{blog_sheet_url}');
-            const txt = await res.text();
-            const lines = txt.split(/\\r\\n|\\n/);
-            const container = document.getElementById('post-container');
-            
-            let found = false;
-            for(let i=1; i<lines.length; i++) {{
-                const r = parseCSVLine(lines[i]);
-                if(r[0] === slug) {{
-                    found = true;
-                    document.title = r[1] + " | {biz_name}";
-                    const contentHtml = parseMarkdown(r[6]);
-                    
-                    const shareUrl = encodeURIComponent(window.location.href);
-                    const shareTitle = encodeURIComponent(r[1]);
-                    
-                    container.innerHTML = `
-                        <div style="background:var(--p); padding:6rem 0 4rem 0; color:white; text-align:center;">
-                            <div class="container">
-                                <span class="blog-badge" style="background:rgba(255,255,255,0.2); margin-bottom:1rem; display:inline-block;">${{r[3]}}</span>
-                                <h1 style="font-size:clamp(2rem, 5vw, 3.5rem); margin-bottom:1rem; color:white;">${{r[1]}}</h1>
-                                <p style="opacity:0.8;">Published on ${{r[2]}}</p>
-                            </div>
-                        </div>
-                        <div class="container" style="max-width:800px; padding:4rem 1rem;">
-                            <img src="${{r[5]}}" style="width:100%; border-radius:12px; margin-bottom:3rem; box-shadow:0 10px 30px rgba(0,0,0,0.1);">
-                            <div class="article-content" style="line-height:1.8; color:var(--txt);">
-                                ${{contentHtml}}
-                            </div>
-                            
-                            <!-- SOCIAL SHARE ROW -->
-                            <div class="share-row" style="margin-top:3rem; border-top:1px solid #eee; padding-top:2rem;">
-                                <span class="share-label">Share Article:</span>
-                                <a href="https://www.facebook.com/sharer/sharer.php?u=${{shareUrl}}" target="_blank" class="share-btn bg-fb"><svg viewBox="0 0 24 24"><path d="M18 2h-3a5 5 0 0 0-5 5v3H7v4h3v8h4v-8h3l1-4h-4V7a1 1 0 0 1 1-1h3z"></path></svg></a>
-                                <a href="https://twitter.com/intent/tweet?url=${{shareUrl}}&text=${{shareTitle}}" target="_blank" class="share-btn bg-x"><svg viewBox="0 0 24 24"><path d="M18.901 1.153h3.68l-8.04 9.19L24 22.846h-7.406l-5.8-7.584l-6.638 7.584H.474l8.6-9.83L0 1.154h7.594l5.243 6.932ZM17.61 20.644h2.039L6.486 3.24H4.298Z"></path></svg></a>
-                                <a href="https://www.linkedin.com/sharing/share-offsite/?url=${{shareUrl}}" target="_blank" class="share-btn bg-li"><svg viewBox="0 0 24 24"><path d="M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2a2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6zM2 9h4v12H2zM4 2a2 2 0 1 1-2 2a2 2 0 0 1 2-2z"></path></svg></a>
-                                <button onclick="navigator.clipboard.writeText(window.location.href);alert('Link Copied!')" class="share-btn bg-link" title="Copy Link"><svg viewBox="0 0 24 24"><path d="M3.9 12c0-1.71 1.39-3.1 3.1-3.1h4V7H7c-2.76 0-5 2.24-5 5s2.24 5 5 5h4v-1.9H7c-1.71 0-3.1-1.39-3.1-3.1zM8 13h8v-2H8v2zm9-6h-4v1.9h4c1.71 0 3.1 1.39 3.1 3.1s-1.39 3.1-3.1 3.1h-4V17h4c2.76 0 5-2.24 5-5s-2.24-5-5-5z"></path></svg></button>
-                            </div>
-
-                            <hr style="margin:2rem 0; border:0; border-top:1px solid #eee;">
-                            <a href="blog.html" class="btn btn-primary">&larr; Back to Blog</a>
-                        </div>
-                    `;
-                    break;
-                }}
-            }}
-            if(!found) container.innerHTML = '<div class="container" style="text-align:center; padding:5rem;"><h2>Article Not Found</h2><a href="blog.html" class="btn btn-primary">Back</a></div>';
-            
-        }} catch(e) {{ console.log(e); }}
-    }}
-    window.addEventListener('load', loadPost);
-    </script>
-    """
-
-# --- 6. PAGE CONTENT GENERATION ---
-home_content = ""
-if show_hero: home_content += gen_hero()
-if show_stats: home_content += gen_stats()
-if show_features: home_content += gen_features()
-if show_pricing: home_content += gen_pricing_table()
-if show_inventory: home_content += gen_inventory()
-if show_gallery: home_content += gen_about_section()
-if show_testimonials: 
-    t_cards = "".join([f'<div class="card reveal" style="text-align:center;"><i>"{x.split("|")[1]}"</i><br><br><b>- {x.split("|")[0]}</b></div>' for x in testi_data.split('\n') if "|" in x])
-    home_content += f'<section style="background:#f8fafc"><div class="container"><div class="section-head reveal"><h2>Client Stories</h2></div><div class="grid-3">{t_cards}</div></div></section>'
-if show_faq: home_content += gen_faq_section()
-if show_cta: home_content += f'<section style="background:var(--s); color:white; text-align:center;"><div class="container reveal"><h2>Start Owning Your Future</h2><p style="margin-bottom:2rem;">Stop paying rent. Start building equity.</p><a href="contact.html" class="btn" style="background:white; color:var(--s);">Get Started</a></div></section>'
+    if not available_formats():
+        return []
+    cache = st.session_state.get("image_cache", {})
+    library = {f.file_id: cache.get(f.file_id) or process_image(f.name, f.getvalue()) for f in st.session_state.get("image_files") or []}
+    st.session_state["image_cache"] = library
+    return list(library.values())
+
+def current_config():
+    values = {name: st.session_state[name] for name in CONFIG_FIELDS}
+    return SiteConfig(**values, images=tuple(meta for meta, _ in image_library()))
+
+def config_key():
+    """The widget values and upload ids current_config() is built from; comparing it costs no build."""
+    uploads = tuple(f.file_id for f in st.session_state.get("image_files") or [])
+    return (uploads, *(st.session_state[name] for name in CONFIG_FIELDS))
+
+def budget_table(budget):
+    """Page budget rows with metric cells green within budget and red over it."""
+    columns = ["page", "html", "inline_css", "inline_js", "inline_svg", "blocking", "origins", "third_party", "lcp"]
+    df = pd.DataFrame([dict(r, origins=len(r["origins"]), third_party=", ".join(r["origins"])) for r in budget.pages], columns=columns)
+    def colour(row):
+        over = budget.pages[row.name]["over"]
+        return ["" if col not in budget.limits else "background-color: rgba(255, 75, 75, 0.3)" if col in over else "background-color: rgba(33, 195, 84, 0.2)" for col in row.index]
+    return df.style.apply(colour, axis=1)
 
 # --- 7. RENDER & DEPLOY ---
+PREVIEW_DEBOUNCE = 1.5  # seconds between preview refresh checks
+
+PREVIEW_PAGES = {
+    "Home": lambda cfg: build_page(cfg, "Home", gen_home_content(cfg)),
+    "About": lambda cfg: build_page(cfg, "About", gen_about_page(cfg)),
+    "Contact": lambda cfg: build_page(cfg, "Contact", gen_contact_page(cfg)),
+    "Blog Index": lambda cfg: build_page(cfg, "Blog", gen_blog_index_html(cfg)),
+    "Blog Post (Demo)": lambda cfg: build_page(cfg, "Article", gen_blog_post_html(cfg)),
+    "Privacy": lambda cfg: build_page(cfg, "Privacy", gen_privacy_page(cfg)),
+    "Terms": lambda cfg: build_page(cfg, "Terms", gen_terms_page(cfg)),
+    "Product Detail (Demo)": lambda cfg: build_page(cfg, "Product Name", gen_product_page_content(cfg, is_demo=True)),
+}
+
 st.divider()
 st.subheader("🚀 Launchpad")
-
-preview_mode = st.radio("Preview Page:", ["Home", "About", "Contact", "Blog Index", "Blog Post (Demo)", "Privacy", "Terms", "Product Detail (Demo)"], horizontal=True)
-
-# HELPER: Function to generate a header for inner pages with the image
-def gen_inner_header(title):
-    return f"""
-    <section class="hero" style="min-height: 40vh; background-image: linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{hero_img_1}'); background-size: cover; background-position: center;">
-        <div class="container">
-            <h1 style="font-size: 3.5rem; margin-bottom: 0;">{title}</h1>
-        </div>
-    </section>
-    """
-
-# 1. GENERATE ABOUT PAGE CONTENT
-about_body = format_text(about_long)
-about_content = f"""{gen_inner_header("About Us")}<section><div class="container"><div class="about-grid"><div class="legal-text">{about_body}</div><img src="{about_img}" style="width:100%; border-radius:12px; box-shadow:0 10px 30px rgba(0,0,0,0.1);"></div></div></section>"""
-
-# 2. GENERATE CONTACT PAGE CONTENT (FIXED MOBILE LAYOUT)
-contact_content = f"""
-{gen_inner_header("Contact Us")}
-<section>
-    <div class="container">
-        <!-- FIXED: Class instead of inline style -->
-        <div class="contact-grid">
-            <div>
-                <div style="background:var(--card); padding:2rem; border-radius:12px; border:1px solid #eee;">
-                    <h3 style="color:var(--p);">Get In Touch</h3>
-                    <p style="margin-top:1rem;"><strong>📍 Address:</strong><br>{biz_addr.replace(chr(10),'<br>')}</p>
-                    <p style="margin-top:1rem;"><strong>📞 Phone:</strong><br><a href="tel:{biz_phone}" style="color:var(--s);">{biz_phone}</a></p>
-                    <p style="margin-top:1rem;"><strong>📧 Email:</strong><br><a href="mailto:{biz_email}">{biz_email}</a></p>
-                    <br>
-                    <a href="https://wa.me/{wa_num}" target="_blank" class="btn btn-accent" style="width:100%; text-align:center;">Chat on WhatsApp</a>
-                </div>
-            </div>
-            
-            <div class="card">
-                <h3 style="margin-bottom:1.5rem;">Send a Message</h3>
-                <form action="https://formsubmit.co/{biz_email}" method="POST">
-                    <div style="display:grid; grid-template-columns:1fr 1fr; gap:1rem;">
-                        <div><label>Name</label><input type="text" name="name" required placeholder="Your Name"></div>
-                        <div><label>Email</label><input type="email" name="email" required placeholder="Your Email"></div>
-                    </div>
-                    <label>Message</label><textarea name="message" rows="5" required placeholder="How can we help you?"></textarea>
-                    <button type="submit" class="btn btn-primary" style="width:100%;">Send Message</button>
-                    <input type="hidden" name="_captcha" value="false">
-                    <input type="hidden" name="_next" value="{prod_url}/contact.html">
-                </form>
-            </div>
-        </div>
-        <br><br>
-        <div style="border-radius:12px; overflow:hidden; box-shadow:0 10px 30px rgba(0,0,0,0.1);">{map_iframe}</div>
-    </div>
-</section>
-"""
-
-# 3. GENERATE LEGAL PAGES
-privacy_content = f'{gen_inner_header("Privacy Policy")}<section><div class="container legal-text">{format_text(priv_txt)}</div></section>'
-terms_content = f'{gen_inner_header("Terms of Service")}<section><div class="container legal-text">{format_text(term_txt)}</div></section>'
+launchpad = st.container()
 
 # --- PREVIEW & DOWNLOAD ---
 c1, c2 = st.columns([3, 1])
-with c1:
-    if preview_mode == "Home": st.components.v1.html(build_page("Home", home_content), height=600, scrolling=True)
-    elif preview_mode == "About": st.components.v1.html(build_page("About", about_content), height=600, scrolling=True)
-    elif preview_mode == "Contact": st.components.v1.html(build_page("Contact", contact_content), height=600, scrolling=True)
-    elif preview_mode == "Privacy": st.components.v1.html(build_page("Privacy", privacy_content), height=600, scrolling=True)
-    elif preview_mode == "Terms": st.components.v1.html(build_page("Terms", terms_content), height=600, scrolling=True)
-    elif preview_mode == "Blog Index": st.components.v1.html(build_page("Blog", gen_blog_index_html()), height=600, scrolling=True)
-    elif preview_mode == "Blog Post (Demo)": st.components.v1.html(build_page("Article", gen_blog_post_html()), height=600, scrolling=True)
-    elif preview_mode == "Product Detail (Demo)":
+preview_box = c1.empty()
+st.session_state["preview_key"] = st.session_state["preview_hash"] = None
+
+# Edits only rerun their own tab; the preview polls the session state, builds
+# only when a widget value changed and re-sends the iframe only when the built
+# page actually changed.
+@st.fragment(run_every=PREVIEW_DEBOUNCE)
+def live_preview():
+    preview_mode = st.radio("Preview Page:", list(PREVIEW_PAGES), horizontal=True, key="preview_mode")
+    if preview_mode == "Product Detail (Demo)":
         st.info("ℹ️ Demo Mode Active: Showing the first available product from your CSV.")
-        st.components.v1.html(build_page("Product Name", gen_product_page_content(is_demo=True)), height=600, scrolling=True)
-
-with c2:
+    key = (preview_mode, config_key())
+    if key == st.session_state["preview_key"]:
+        return
+    page = PREVIEW_PAGES[preview_mode](current_config())
+    st.session_state["preview_key"] = key
+    page_hash = hashlib.blake2b(page.encode(), digest_size=16).hexdigest()
+    if page_hash != st.session_state["preview_hash"]:
+        st.session_state["preview_hash"] = page_hash
+        with preview_box:
+            st.components.v1.html(page, height=600, scrolling=True)
+
+with launchpad:
+    live_preview()
+
+@st.fragment
+def download_panel():
+    cfg = current_config()
+    inv_csv_file = st.session_state["inv_csv_file"]
+    blog_csv_file = st.session_state["blog_csv_file"]
+    manifest_file = st.session_state["manifest_file"]
     st.success("System Ready.")
+    profile_build = st.checkbox("Profile Build", key="profile_build", help="Records wall time, output bytes and fragment cache hits per compiler step and per written file.")
     if st.button("DOWNLOAD WEBSITE ZIP", type="primary"):
-        z_b = io.BytesIO()
-        with zipfile.ZipFile(z_b, "a", zipfile.ZIP_DEFLATED, False) as zf:
-            zf.writestr("index.html", build_page("Home", home_content))
-            zf.writestr("about.html", build_page("About", about_content))
-            zf.writestr("contact.html", build_page("Contact", contact_content))
-            zf.writestr("privacy.html", build_page("Privacy Policy", privacy_content))
-            zf.writestr("terms.html", build_page("Terms of Service", terms_content))
-            zf.writestr("product.html", build_page("Product Details", gen_product_page_content(is_demo=False)))
-            
-            if show_blog:
-                zf.writestr("blog.html", build_page("Blog", gen_blog_index_html()))
-                zf.writestr("post.html", build_page("Article", gen_blog_post_html()))
+        try:
+            previous = read_manifest(manifest_file.getvalue()) if manifest_file else None
+        except (ValueError, AttributeError) as e:
+            st.error(f"Could not read the previous manifest, exporting the full site: {e}")
+            previous = None
+        # The archive is spooled to disk as it is built; only the copy handed to the download button is held in memory.
+        z_f = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+        try:
+            with z_f, profiling() if profile_build else contextlib.nullcontext() as stats, ZipSink(z_f, cfg.store_compressed) as sink:
+                zf, warnings = export_site(cfg, sink, inv_csv_file, blog_csv_file, {path: data for _, files in image_library() for path, data in files.items()}, previous, delta=previous is not None)
+            for warning in warnings:
+                st.error(warning)
+            with open(z_f.name, "rb") as z_b:
+                st.download_button("📥 Click to Save", z_b, f"{cfg.biz_name.lower().replace(' ','_')}_site{'_delta' if previous is not None else ''}.zip", "application/zip")
+        finally:
+            os.unlink(z_f.name)
+        if previous is not None:
+            st.caption(f"Delta: {len(zf.hashes) - zf.unchanged} changed or new, {zf.unchanged} unchanged, {len(zf.deletions())} deleted.")
+        totals = zf.totals()
+        st.caption(f"{totals['files']} files: {totals['original']:,} → {totals['minified']:,} bytes")
+        with st.expander("📏 Output Size Report"):
+            st.dataframe(zf.report, hide_index=True)
+        over = zf.budget.failures()
+        (st.error if over else st.success)(zf.budget.summary())
+        with st.expander("🎯 Page Budgets", expanded=bool(over)):
+            st.dataframe(budget_table(zf.budget), hide_index=True)
+        if stats is not None:
+            with st.expander("⏱️ Build Profile", expanded=True):
+                st.dataframe(stats.rows(), hide_index=True)
+                st.download_button("Download build_profile.json", stats.to_json(), "build_profile.json", "application/json")
 
-            zf.writestr("404.html", build_page("404 Not Found", gen_404_content()))
-            zf.writestr("robots.txt", f"User-agent: *\nAllow: /\nSitemap: {prod_url}/sitemap.xml")
-            
-            import datetime
-            date_str = datetime.date.today().isoformat()
-            
-            sitemap_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-   <url><loc>{prod_url}/</loc><lastmod>{date_str}</lastmod></url>
-   <url><loc>{prod_url}/index.html</loc><lastmod>{date_str}</lastmod></url>
-   <url><loc>{prod_url}/about.html</loc><lastmod>{date_str}</lastmod></url>
-   <url><loc>{prod_url}/contact.html</loc><lastmod>{date_str}</lastmod></url>
-   <url><loc>{prod_url}/privacy.html</loc><lastmod>{date_str}</lastmod></url>
-   <url><loc>{prod_url}/terms.html</loc><lastmod>{date_str}</lastmod></url>
-   <url><loc>{prod_url}/blog.html</loc><lastmod>{date_str}</lastmod></url>
-</urlset>"""
-            zf.writestr("sitemap.xml", sitemap_xml)
-            
-        st.download_button("📥 Click to Save", z_b.getvalue(), f"{biz_name.lower().replace(' ','_')}_site.zip", "application/zip")
+with c2:
+    download_panel()
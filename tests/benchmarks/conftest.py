@@ -0,0 +1,100 @@
+"""Synthetic sites for the benchmark suite, plus the per-page byte budget check.
+
+Fixtures: catalogs of 10 / 1,000 / 50,000 rows, a blog of 500 posts and 100 KB legal texts.
+Page sizes are compared with page_bytes.json; TITAN_UPDATE_BASELINE=1 records the current sizes instead.
+"""
+import csv
+import io
+import json
+import os
+
+import pytest
+
+from titan.engine import SiteConfig, cache_clear, format_text
+
+CATALOG_SIZES = (10, 1000, 50000)
+BLOG_POSTS = 500
+LEGAL_BYTES = 100_000
+BASELINE = os.path.join(os.path.dirname(__file__), "page_bytes.json")
+TOLERANCE = float(os.environ.get("TITAN_BYTES_TOLERANCE", "0.02"))
+
+def _csv(header, rows):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+def catalog_csv(n):
+    return _csv(["Name", "Price", "Description", "Image", "Stock", "Category", "Image 2"], (
+        [f"Product {i}", f"${i % 500}.99", f"Item **{i}** ships *today*.\n* Fast\n* Owned forever",
+         f"https://images.unsplash.com/photo-{i:08d}?w=800", "In stock", f"Category {i % 12}", ""]
+        for i in range(n)))
+
+def blog_csv(n):
+    body = "\n".join(["**Why it matters**", "Static sites are *fast* and cheap to host."] * 20 + ["* One", "* Two", "* Three"])
+    return _csv(["Slug", "Title", "Date", "Category", "Summary", "Image", "Content"], (
+        [f"post-{i}", f"Post {i}", "Oct 20, 2026", f"Topic {i % 8}", f"Summary of post {i}.",
+         "https://images.unsplash.com/photo-00000001?w=800", body]
+        for i in range(n)))
+
+def legal_text(size):
+    section = ("**{0}. Section heading**\nThis clause explains, in **plain** words, how the *service* handles data & billing.\n"
+               "* The client owns the code.\n* No monthly fees apply.\n\n")
+    parts, total, i = [], 0, 1
+    while total < size:
+        parts.append(section.format(i))
+        total += len(parts[-1])
+        i += 1
+    return "".join(parts)
+
+def _cold():
+    cache_clear()
+    format_text.cache_clear()
+
+@pytest.fixture
+def cold():
+    """Setup for benchmark.pedantic: empties the fragment and Markdown caches, so every round measures a first build."""
+    return _cold
+
+@pytest.fixture(scope="session")
+def legal():
+    return legal_text(LEGAL_BYTES)
+
+@pytest.fixture(scope="session", params=CATALOG_SIZES, ids=lambda n: f"{n}rows")
+def catalog(request):
+    return request.param, catalog_csv(request.param)
+
+@pytest.fixture(scope="session")
+def blog():
+    return blog_csv(BLOG_POSTS)
+
+@pytest.fixture(scope="session")
+def site(legal):
+    """The default site with the legal pages at 100 KB; fonts stay remote so runs don't depend on a font cache."""
+    return SiteConfig(priv_txt=legal, term_txt=legal, self_host_fonts=False, sheet_url="catalog.csv", blog_sheet_url="blog.csv")
+
+@pytest.fixture(scope="session")
+def page_bytes():
+    """check(key, {page: bytes}) fails when a page grew more than TOLERANCE over its recorded size."""
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)
+    update = os.environ.get("TITAN_UPDATE_BASELINE") == "1"
+    seen = {}
+
+    def check(key, sizes):
+        seen[key] = sizes
+        if update: return
+        assert key in baseline, f"no byte baseline for {key}; record one with TITAN_UPDATE_BASELINE=1"
+        old = baseline[key]
+        grown = {page: (old.get(page), size) for page, size in sizes.items() if page not in old or size > old[page] * (1 + TOLERANCE)}
+        assert not grown, f"{key}: pages grew beyond {TOLERANCE:.0%} (baseline, now): {grown}"
+
+    yield check
+    if update and seen:
+        baseline.update(seen)
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+            f.write("\n")
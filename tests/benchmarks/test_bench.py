@@ -0,0 +1,93 @@
+"""Builder benchmarks: format_text, get_theme_css, build_page and full exports over synthetic sites.
+
+    pytest tests/benchmarks --benchmark-autosave                        # record timings
+    pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+
+Output bytes per page are checked on every run against page_bytes.json (see conftest.py).
+The 50,000-row prerendered export takes minutes; it only runs with TITAN_BENCH_LARGE=1.
+The site search index must stay under SEARCH_INDEX_GZ bytes gzipped, term and doc shards together.
+"""
+import dataclasses
+import gzip
+import io
+import os
+import re
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from titan.engine import (
+    assign_slugs, build_page, format_text, gen_home_content, get_theme_css, load_csv_rows,
+)
+from titan.export import export_site
+from titan.output import ZipSink
+from titan.search import build_search_index, search_docs
+
+JSON, PRERENDERED = "JSON Shards (Build-Time)", "Prerendered (Build-Time)"
+SEARCH_INDEX_GZ = 1_000_000
+_HASHED = re.compile(r'\.[0-9a-f]{10}\.')
+_PER_ROW = re.compile(r'^(products|blog|data/products|data/posts)/.+(\.\w+)$')
+
+def page_sizes(report):
+    """Largest output bytes per page kind: per-row pages and shards share one key, content hashes are dropped."""
+    sizes = {}
+    for row in report:
+        name = _HASHED.sub(".*.", _PER_ROW.sub(r"\1/*\2", row["file"]))
+        if name.endswith((".html", ".css", ".js")) or name.startswith("data/"):
+            sizes[name] = max(sizes.get(name, 0), row["minified"])
+    return sizes
+
+def test_format_text(benchmark, legal, page_bytes):
+    out = benchmark(format_text.__wrapped__, legal)
+    page_bytes("format_text[100KB]", {"html": len(out)})
+
+def test_format_text_cached(benchmark, legal):
+    format_text(legal)
+    benchmark(format_text, legal)
+
+def test_theme_css(benchmark, site, cold, page_bytes):
+    css = benchmark.pedantic(get_theme_css, args=(site,), setup=cold, rounds=50)
+    page_bytes("get_theme_css", {"css": len(css)})
+
+@pytest.mark.parametrize("purge", [False, True], ids=["inline", "purged"])
+def test_build_page(benchmark, site, catalog, purge, cold, page_bytes):
+    n, data = catalog
+    content = gen_home_content(site, assign_slugs(load_csv_rows(io.BytesIO(data))))
+    out = benchmark.pedantic(build_page, args=(site, "Home", content), kwargs={"purge": purge}, setup=cold, rounds=1 if n > 1000 else 10)
+    benchmark.extra_info["bytes"] = len(out)
+    page_bytes(f"build_page[{n}rows-{'purged' if purge else 'inline'}]", {"index.html": len(out)})
+
+def _export(benchmark, cold, cfg, key, page_bytes, rounds, **sources):
+    def run():
+        buf = io.BytesIO()
+        with ZipSink(buf) as sink:
+            zf, warnings = export_site(cfg, sink, **sources)
+        assert not warnings
+        return zf, len(buf.getvalue())
+    zf, size = benchmark.pedantic(run, setup=cold, rounds=rounds)
+    sizes = page_sizes(zf.report)
+    benchmark.extra_info.update(zip_bytes=size, pages=sizes)
+    page_bytes(key, sizes)
+
+@pytest.mark.parametrize("mode", [JSON, PRERENDERED], ids=["json", "prerendered"])
+def test_export_catalog(benchmark, site, catalog, mode, cold, page_bytes):
+    n, data = catalog
+    if n > 1000 and mode == PRERENDERED and not os.environ.get("TITAN_BENCH_LARGE"):
+        pytest.skip("set TITAN_BENCH_LARGE=1 for the 50,000-row prerendered export")
+    cfg = dataclasses.replace(site, inv_mode=mode, show_blog=False)
+    _export(benchmark, cold, cfg, f"export[{n}rows-{mode.split()[0].lower()}]", page_bytes, 1 if n > 1000 else 3, inv_source=io.BytesIO(data))
+
+@pytest.mark.parametrize("mode", [JSON, PRERENDERED], ids=["json", "prerendered"])
+def test_export_blog(benchmark, site, blog, mode, cold, page_bytes):
+    cfg = dataclasses.replace(site, blog_mode=mode, show_inventory=False)
+    _export(benchmark, cold, cfg, f"export[500posts-{mode.split()[0].lower()}]", page_bytes, 3, blog_source=io.BytesIO(blog))
+
+def test_search_index(benchmark, site, catalog, page_bytes):
+    n, data = catalog
+    docs = search_docs(site, assign_slugs(load_csv_rows(io.BytesIO(data))))
+    files = benchmark.pedantic(build_search_index, args=(docs, {}), rounds=1 if n > 1000 else 10)
+    sizes = {f"search/{part}/*.json.gz": sum(len(gzip.compress(text.encode())) for path, text in files.items() if path.startswith(f"search/{part}/")) for part in ("t", "d")}
+    benchmark.extra_info.update(files=len(files), **sizes)
+    page_bytes(f"search_index[{n}rows]", sizes)
+    assert sum(sizes.values()) < SEARCH_INDEX_GZ
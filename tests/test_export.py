@@ -0,0 +1,28 @@
+"""Build-time sections without a sheet or without rows export empty, with a warning."""
+import dataclasses
+import io
+
+import pytest
+
+from titan.engine import SiteConfig
+from titan.export import export_site
+from titan.output import ZipSink
+
+PRERENDERED = "Prerendered (Build-Time)"
+SITE = SiteConfig(self_host_fonts=False, inv_mode=PRERENDERED, blog_mode=PRERENDERED)
+
+def export(cfg, **sources):
+    with ZipSink(io.BytesIO()) as sink:
+        return export_site(cfg, sink, **sources)[1]
+
+@pytest.mark.parametrize("field, section", [("sheet_url", "catalog"), ("blog_sheet_url", "blog")])
+def test_missing_sheet_warns(field, section):
+    warnings = export(dataclasses.replace(SITE, **{field: ""}, show_blog=section == "blog", show_inventory=section == "catalog"))
+    assert warnings == [f"The {section} uses a build-time mode but has no sheet URL or CSV file; it was exported empty."]
+
+def test_header_only_sheet_warns():
+    warnings = export(dataclasses.replace(SITE, show_blog=False), inv_source=io.BytesIO(b"Name,Price,Description\n"))
+    assert warnings == ["The catalog sheet has no data rows; it was exported empty."]
+
+def test_rows_do_not_warn():
+    assert export(dataclasses.replace(SITE, show_blog=False), inv_source=io.BytesIO(b"Name,Price,Description\nChair,$5,Oak\n")) == []
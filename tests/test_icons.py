@@ -0,0 +1,37 @@
+"""Feature-line icons: icon_name() picks the same icon as the substring matcher it replaced."""
+import pytest
+
+from titan.engine import ICONS, icon_name
+
+# The pre-registry matcher, in its order: the first rule with a substring of the keyword wins.
+BASELINE_RULES = [
+    (("code",), "code"), (("database",), "database"), (("layers",), "layers"),
+    (("truck", "logistics"), "truck"), (("shield", "secure"), "shield"), (("hammer", "build"), "hammer"),
+    (("water", "plumb", "drop"), "water"), (("home", "roof"), "home"), (("bolt", "electric"), "bolt"),
+    (("star",), "star"), (("heart",), "heart"), (("wallet",), "wallet"), (("table",), "table"),
+]
+
+def baseline_icon(keyword):
+    keyword = keyword.lower().strip()
+    for subs, name in BASELINE_RULES:
+        if any(s in keyword for s in subs): return name
+    return "check"
+
+KEYWORDS = [
+    "code", "coder", "codes", "Coding", "database", "databases", "layers", "truck", "trucks", "trucking",
+    "logistics", "shield", "shields", "secure", "securely", "hammer", "hammers", "build", "builds", "builder",
+    "buildings", "Building", "water", "waterproof", "waterproofing", "plumb", "plumber", "plumbers", "plumbing",
+    "drop", "drops", "dropship", "home", "homes", "homeowner", "roof", "roofs", "roofer", "roofing", "bolt",
+    "bolts", "electric", "electrician", "electricians", "electrical", "star", "stars", "starred", "heart",
+    "hearts", "wallet", "wallets", "table", "tables", "glass", "support", "  Bolt ", "SHIELD", "check", "",
+]
+
+@pytest.mark.parametrize("keyword", KEYWORDS)
+def test_matches_baseline(keyword):
+    assert icon_name(keyword) == baseline_icon(keyword)
+
+def test_registry():
+    assert icon_name("fast delivery") == "bolt"
+    assert icon_name("glasses") == "check"
+    assert icon_name("wait") == "check"
+    assert all(icon_name(name) == name for name in ICONS)
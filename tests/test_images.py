@@ -0,0 +1,35 @@
+"""Image stage: one variant per width step, and srcsets without duplicate width descriptors."""
+import io
+import re
+
+import pytest
+
+from titan.engine import IMG_WIDTHS, SiteConfig, responsive_img
+from titan.images import available_formats, process_image
+
+Image = pytest.importorskip("PIL.Image")
+pytestmark = pytest.mark.skipif(not available_formats(), reason="needs Pillow with WebP support")
+
+def png(width, height):
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 120, 40)).save(buf, "PNG")
+    return buf.getvalue()
+
+@pytest.mark.parametrize("width, steps", [
+    (3000, list(IMG_WIDTHS)),
+    (IMG_WIDTHS[-1], list(IMG_WIDTHS)),
+    (1200, [480, 960, 1200]),
+    (300, [300]),
+])
+def test_variant_steps(width, steps):
+    meta, files = process_image(f"photo-{width}.png", png(width, 200))
+    for _, variants in meta.variants:
+        assert [w for w, _ in variants] == steps
+    assert len(files) == len(steps) * len(meta.variants)
+
+def test_srcset_widths_unique():
+    meta, _ = process_image("wide.png", png(3000, 2000))
+    markup = responsive_img(SiteConfig(images=(meta,)), "wide.png")
+    for srcset in re.findall(r'srcset="([^"]+)"', markup):
+        widths = re.findall(r' (\d+)w', srcset)
+        assert len(widths) == len(set(widths)) == len(IMG_WIDTHS)
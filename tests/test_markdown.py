@@ -0,0 +1,34 @@
+"""Golden corpus for Titan Markdown: format_text() and its JS twin must render every case identically."""
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from titan.engine import JS_MODULES, format_text
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "markdown_golden.json")
+with open(CORPUS_PATH, encoding="utf-8") as f:
+    CORPUS = json.load(f)
+
+@pytest.mark.parametrize("case", CORPUS, ids=[c["name"] for c in CORPUS])
+def test_format_text(case):
+    assert format_text(case["input"]) == case["html"]
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_js_twin():
+    script = JS_MODULES["md"] + """
+    const corpus = JSON.parse(require('fs').readFileSync(process.argv[1], 'utf8'));
+    console.log(JSON.stringify(corpus.map(c => formatText(c.input))));
+    """
+    out = subprocess.run(["node", "-e", script, CORPUS_PATH], capture_output=True, text=True, check=True).stdout
+    results = json.loads(out)
+    assert len(results) == len(CORPUS)
+    for case, got in zip(CORPUS, results):
+        assert got == case["html"], case["name"]
+
+def test_linear_time():
+    """Unpaired markers and unclosed links must not rescan the line: 200k of them render in one pass."""
+    text = "*a " * 100000 + "\n" + "** " * 100000 + "\n" + '<a href="x">' * 100000
+    assert format_text(text).count("<p>") == 3
@@ -0,0 +1,35 @@
+"""Directory builds: a full rebuild leaves exactly the files its manifest lists."""
+import csv
+import json
+import os
+
+from titan.__main__ import build_site
+from titan.output import MANIFEST
+
+def write_site(tmp_path, rows):
+    with open(tmp_path / "catalog.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Price", "Description"])
+        writer.writerows([f"Product {i}", f"${i}.99", f"Item {i}."] for i in range(rows))
+    config = tmp_path / "site.json"
+    config.write_text(json.dumps({"inv_csv": "catalog.csv", "inv_mode": "Prerendered (Build-Time)", "show_blog": False, "self_host_fonts": False}))
+    return str(config)
+
+def site_files(root):
+    return sorted(os.path.relpath(os.path.join(d, name), root).replace(os.sep, "/") for d, _, names in os.walk(root) for name in names)
+
+def test_shrinking_catalog_prunes_dir(tmp_path):
+    out = tmp_path / "dist"
+    build_site(write_site(tmp_path, 30), str(out), as_dir=True)
+    assert len(os.listdir(out / "site" / "products")) == 30
+    build_site(write_site(tmp_path, 25), str(out), as_dir=True)
+    with open(out / "site" / MANIFEST, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert len(os.listdir(out / "site" / "products")) == 25
+    assert site_files(out / "site") == sorted(list(manifest["files"]) + [MANIFEST])
+
+def test_emptied_dirs_are_removed(tmp_path):
+    out = tmp_path / "dist"
+    build_site(write_site(tmp_path, 3), str(out), as_dir=True)
+    build_site(write_site(tmp_path, 0), str(out), as_dir=True)
+    assert not (out / "site" / "products").exists()
@@ -0,0 +1,93 @@
+"""Site search: the index files titan.search writes and the "search" JS module that queries them."""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from titan.engine import JS_MODULES, SiteConfig, search_shard, search_tokens
+from titan.search import VLQ_DIGITS, build_search_index, encode_ids, search_docs
+
+TOKEN_CASES = [
+    "Crème Brûlée Set — 4 pcs",
+    "The chairs and the TABLES are in stock!",
+    "Walking, talked, quickly, glass, boss",
+    "naïve café_au_lait 2-in-1 a b c",
+    "Ünïcödé Straße 東京 ﬁne",
+]
+
+URLS = {"product": "products/{}.html", "post": "blog/{}.html"}
+ROWS = [
+    ("oak-chair", ["Oak Chair", "$120", "Solid oak dining chair with a padded seat."]),
+    ("pine-table", ["Pine Table", "$300", "Seats six. Pairs with the oak chair."]),
+    ("oak-shelf", ["Oak Shelf", "$80", "Wall shelf."]),
+]
+POSTS = [("caring-for-oak", ["caring-for-oak", "Caring for Oak", "Oct 1, 2026", "Guides", "Oil it twice a year."])]
+
+def decode_ids(s):
+    ids, last, gap, shift = [], 0, 0, 0
+    for ch in s:
+        digit = VLQ_DIGITS.index(ch)
+        gap |= (digit & 31) << shift
+        shift += 5
+        if digit < 32:
+            last += gap
+            ids.append(last)
+            gap = shift = 0
+    return ids
+
+def test_tokens():
+    assert search_tokens("The Crème BRÛLÉE, a set of 2") == ["creme", "brulee", "set"]
+    assert search_tokens("chairs walking quickly glass", stem=True) == ["chair", "walk", "quick", "glass"]
+
+@pytest.mark.parametrize("ids", [[], [0], [0, 1, 2], [31, 32, 1023, 1024, 50000]])
+def test_encode_ids(ids):
+    assert decode_ids(encode_ids(ids)) == ids
+
+def test_index():
+    files = build_search_index(search_docs(SiteConfig(), ROWS, POSTS), URLS)
+    meta = json.loads(files["search/meta.json"])
+    assert meta["urls"] == URLS and not meta["stem"]
+    oak = json.loads(files[f"search/t/{search_shard('oak')}.json"])["oak"]
+    title, other = (decode_ids(part) for part in oak.split("|"))
+    assert title == [0, 2, 3] and other == [1]
+    assert json.loads(files["search/d/0.json"])[3] == ["post", "caring-for-oak", "Caring for Oak", "Guides"]
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+def test_js_twin():
+    """searchTokens() matches search_tokens(), and the search box finds prefixes, title matches first."""
+    files = build_search_index(search_docs(SiteConfig(), ROWS, POSTS), URLS, stem=True)
+    script = """
+    const [cases, files] = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+    const listeners = {}, input = { value: '', addEventListener() {} }, out = { hidden: true, innerHTML: '' };
+    const form = { hidden: true, dataset: { src: 'search/' }, contains: () => true,
+        querySelector: (sel) => sel === 'input' ? input : out, addEventListener: (type, fn) => { listeners[type] = fn; } };
+    global.document = { querySelector: () => form, addEventListener() {} };
+    global.fetch = async (url) => {
+        const body = files[url.split('?')[0]];
+        return { ok: body !== undefined, json: async () => JSON.parse(body) };
+    };
+    """ + JS_MODULES["search"] + """
+    const tokens = [cases.map(c => searchTokens(c, false)), cases.map(c => searchTokens(c, true))];
+    (async () => {
+        while (form.hidden) await new Promise(r => setTimeout(r, 1));
+        const results = {};
+        for (const q of ['oak', 'chairs oa', 'she', 'guide', 'walnut']) {
+            input.value = q;
+            listeners.submit({ preventDefault() {} });
+            await new Promise(r => setTimeout(r, 20));
+            results[q] = [...out.innerHTML.matchAll(/href="([^"]+)"/g)].map(m => m[1]);
+        }
+        console.log(JSON.stringify({ tokens, results }));
+    })();
+    """
+    out = subprocess.run(["node", "-e", script], input=json.dumps([TOKEN_CASES, files]), capture_output=True, text=True, check=True).stdout
+    got = json.loads(out)
+    assert got["tokens"] == [[search_tokens(c) for c in TOKEN_CASES], [search_tokens(c, stem=True) for c in TOKEN_CASES]]
+    assert got["results"] == {
+        "oak": ["products/oak-chair.html", "products/oak-shelf.html", "blog/caring-for-oak.html", "products/pine-table.html"],
+        "chairs oa": ["products/oak-chair.html", "products/pine-table.html"],
+        "she": ["products/oak-shelf.html"],
+        "guide": ["blog/caring-for-oak.html"],
+        "walnut": [],
+    }
@@ -0,0 +1 @@
+"""Titan static site compiler."""
@@ -0,0 +1,121 @@
+"""Headless builds: python -m titan build configs/*.json --out dist/ -j 8"""
+import argparse
+import contextlib
+import glob
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .engine import BuildProfile, profiling
+from .export import export_site, load_site
+from .output import MANIFEST, DirSink, ZipSink, read_manifest
+
+BUDGET_LINES = 20  # pages listed per site when over budget
+
+def _previous(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return read_manifest(f.read())
+
+def load_hook(spec):
+    """'module:function' -> the function. It is called in the worker after each build with (config path, metrics)."""
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)
+
+def build_site(config_path, out_dir, as_dir=False, delta=False, profile=False, hook=None):
+    """Builds one site config into <out_dir>/<config name>.zip, or that directory. Runs in a worker process.
+
+    The last build's manifest also keeps sitemap lastmods of unchanged pages. Pages over the config's
+    budgets are listed in the result; they make the run exit non-zero.
+    A directory build, full or delta, removes the files of the last build that this one no longer produces.
+    With delta, only files changed since the last build are written: a directory is updated in place,
+    a ZIP becomes <name>.delta.zip with a deletions.json. The last build is known from the
+    directory's manifest.json, or the <name>.manifest.json kept next to the ZIPs.
+    With profile, the build profile is written next to the output as <name>.profile.json. A metrics hook
+    receives the result and the profile, so headless runs can forward them to monitoring.
+    """
+    start = time.perf_counter()
+    cfg, inv_source, blog_source, image_files = load_site(config_path)
+    base = target = os.path.join(out_dir, os.path.splitext(os.path.basename(config_path))[0])
+    manifest_path = os.path.join(target, MANIFEST) if as_dir else base + ".manifest.json"
+    previous = _previous(manifest_path)
+    stats = BuildProfile() if profile or hook else None
+    with profiling(stats) if stats else contextlib.nullcontext():
+        if as_dir:
+            with DirSink(target) as sink:
+                zf, warnings = export_site(cfg, sink, inv_source, blog_source, image_files, previous, delta)
+            size = sum(r["minified"] for r in zf.report)
+        else:
+            target += ".delta.zip" if delta else ".zip"
+            with open(target, "wb") as f, ZipSink(f, cfg.store_compressed) as sink:
+                zf, warnings = export_site(cfg, sink, inv_source, blog_source, image_files, previous, delta)
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                f.write(zf.manifest())
+            size = os.path.getsize(target)
+    result = {
+        "target": target,
+        "seconds": time.perf_counter() - start,
+        "files": zf.totals()["files"],
+        "written": len(zf.hashes) - zf.unchanged,
+        "deleted": len(zf.deletions()),
+        "bytes": size,
+        "warnings": warnings,
+        "over_budget": [(r["page"], r["over"]) for r in zf.budget.failures()],
+    }
+    if profile:
+        with open(base + ".profile.json", "w", encoding="utf-8") as f:
+            f.write(stats.to_json())
+    if hook:
+        load_hook(hook)(config_path, dict(result, profile=stats.as_dict()))
+    return result
+
+def build(args):
+    paths = sorted({p for pattern in args.configs for p in (glob.glob(pattern) or [pattern])})
+    os.makedirs(args.out, exist_ok=True)
+    start, failed, over = time.perf_counter(), 0, 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(build_site, path, args.out, args.dir, args.delta, args.profile, args.metrics_hook): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                r = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"FAIL  {path}  {type(e).__name__}: {e}", flush=True)
+                continue
+            changes = f"  {r['written']} written, {r['deleted']} deleted" if args.delta else ""
+            print(f"ok    {path}  {r['seconds']:.2f}s  {r['files']} files{changes}  {r['bytes']:,} bytes  -> {r['target']}", flush=True)
+            for warning in r["warnings"]:
+                print(f"      warning: {warning}", flush=True)
+            for page, metrics in r["over_budget"][:BUDGET_LINES]:
+                print(f"      over budget: {page} ({', '.join(metrics)})", flush=True)
+            if len(r["over_budget"]) > BUDGET_LINES:
+                print(f"      ... and {len(r['over_budget']) - BUDGET_LINES} more pages over budget", flush=True)
+            over += bool(r["over_budget"])
+    print(f"{len(paths) - failed} built, {failed} failed, {over} over budget in {time.perf_counter() - start:.2f}s ({args.jobs or os.cpu_count()} workers)")
+    return 1 if failed or over else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m titan", description="Titan static site compiler.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("build", help="Build site configs (JSON, keyed by SiteConfig field) into ZIPs.")
+    p.add_argument("configs", nargs="+", help="Config files or glob patterns.")
+    p.add_argument("--out", default="dist", help="Output directory (default: dist).")
+    p.add_argument("--dir", action="store_true", help="Write each site into <out>/<config name>/ instead of a ZIP.")
+    p.add_argument("--delta", action="store_true", help="Only write files changed since the last build of each site.")
+    p.add_argument("--profile", action="store_true", help="Write per-step timings, output bytes and cache hits to <out>/<config name>.profile.json.")
+    p.add_argument("--metrics-hook", metavar="MODULE:FUNCTION", help="Call FUNCTION(config path, metrics) after each build, e.g. to ship the profile to monitoring.")
+    p.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: one per core).")
+    args = parser.parse_args(argv)
+    if args.metrics_hook:
+        try:
+            load_hook(args.metrics_hook)
+        except (ImportError, AttributeError, ValueError) as e:
+            parser.error(f"--metrics-hook {args.metrics_hook}: {e}")
+    return build(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Titan page budgets: static weight and render-cost analysis of every exported page."""
+import html
+import re
+import urllib.parse
+
+# (metric, SiteConfig field, scale): a page is over budget when metric > field * scale; a field of 0 is no limit.
+BUDGETS = (
+    ("html", "budget_html_kb", 1024),
+    ("inline_css", "budget_css_kb", 1024),
+    ("inline_js", "budget_js_kb", 1024),
+    ("inline_svg", "budget_svg_kb", 1024),
+    ("blocking", "budget_blocking", 1),
+    ("origins", "budget_origins", 1),
+)
+
+_BLOCK = re.compile(r'<(script|style|svg)\b([^>]*)>(.*?)</\1\s*>', re.S | re.I)
+_TAG = re.compile(r'<([a-zA-Z][\w-]*)\b([^>]*)>')
+_ATTR = re.compile(r'([\w-]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+_CSS_URL = re.compile(r'url\(\s*[\'"]?([^\'")]+)')
+_NOT_JS = ("application/ld+json", "application/json")
+_URL_ATTRS = ("src", "srcset", "data-src", "poster")
+
+def _attrs(text):
+    return {m[1].lower(): html.unescape(m[2] if m[2] is not None else m[3] if m[3] is not None else m[4] or "") for m in _ATTR.finditer(text)}
+
+def _origin(url):
+    if url.startswith("//"): url = "https:" + url
+    parts = urllib.parse.urlsplit(url.strip())
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") and parts.netloc else ""
+
+def _lcp(tag, attrs):
+    if tag == "h1":
+        return "h1"
+    if tag == "img":
+        return f"img {attrs.get('src', '')}" + (" (lazy)" if attrs.get("loading") == "lazy" else "")
+    return f"background {_CSS_URL.search(attrs['style'])[1]}"
+
+def analyze_page(markup, own_origin=""):
+    """Bytes and render cost of one HTML page, in a single scan over its <script>, <style> and <svg> blocks and tags.
+
+    blocking counts stylesheets and scripts in <head> that hold up the first render: links without a
+    print media query, and scripts without async/defer, inline ones included.
+    origins lists hosts other than own_origin that the page loads from (src, srcset, data-src, link href, CSS url()).
+    lcp names the likely Largest Contentful Paint element: the first image with fetchpriority=high, or else
+    the first image, CSS background image or <h1> after the navigation.
+    """
+    head_end = markup.find("</head>")
+    skeleton, pos = [], 0
+    css = js = svg = blocking = 0
+    for m in _BLOCK.finditer(markup):
+        tag, attrs = m[1].lower(), _attrs(m[2])
+        if tag == "style":
+            css += len(m[3])
+        elif tag == "script":
+            if "src" not in attrs and attrs.get("type") not in _NOT_JS:
+                js += len(m[3])
+            if m.start() < head_end and "async" not in attrs and "defer" not in attrs and attrs.get("type") not in _NOT_JS + ("module",):
+                blocking += 1
+        else:
+            svg += m.end() - m.start()
+        skeleton.append(markup[pos:m.start(3)] if tag != "svg" else markup[pos:m.end()])
+        pos = m.end()
+    skeleton.append(markup[pos:])
+    skeleton = "".join(skeleton)
+
+    own = _origin(own_origin)
+    origins, lcp, priority = set(), "", ""
+    after_nav = skeleton.find("</nav>")
+    for m in _TAG.finditer(skeleton):
+        tag, attrs = m[1].lower(), _attrs(m[2])
+        urls = [attrs[a] for a in _URL_ATTRS if a in attrs]
+        if tag == "link":
+            urls.append(attrs.get("href", ""))
+            rel = attrs.get("rel", "").lower()
+            if rel == "stylesheet" and m.start() < head_end and attrs.get("media", "all") != "print":
+                blocking += 1
+        if "style" in attrs:
+            urls += _CSS_URL.findall(attrs["style"])
+        for url in urls:
+            for part in url.split(","):
+                origin = _origin(part.split()[0] if part.split() else "")
+                if origin and origin != own: origins.add(origin)
+        if m.start() > after_nav >= 0:
+            if tag == "img" and attrs.get("fetchpriority") == "high" and not priority:
+                priority = _lcp(tag, attrs)
+            elif not lcp and (tag in ("img", "h1") or _CSS_URL.search(attrs.get("style", ""))):
+                lcp = _lcp(tag, attrs)
+    return {
+        "html": len(markup.encode("utf-8")),
+        "inline_css": css,
+        "inline_js": js,
+        "inline_svg": svg,
+        "blocking": blocking,
+        "origins": sorted(origins),
+        "lcp": priority or lcp,
+    }
+
+class PageBudget:
+    """Collects analyze_page() rows for the HTML files of an export and checks them against the config's budgets."""
+    def __init__(self, cfg):
+        self.own_origin = cfg.prod_url
+        self.limits = {metric: getattr(cfg, field) * scale for metric, field, scale in BUDGETS if getattr(cfg, field) > 0}
+        self.pages = []
+
+    def add(self, name, data):
+        if not name.endswith(".html"):
+            return
+        row = analyze_page(data.decode("utf-8"), self.own_origin)
+        measured = dict(row, origins=len(row["origins"]))
+        row = {"page": name, **row, "over": [m for m, limit in self.limits.items() if measured[m] > limit]}
+        self.pages.append(row)
+
+    def failures(self):
+        return [row for row in self.pages if row["over"]]
+
+    def summary(self):
+        failed = self.failures()
+        if not failed:
+            return f"{len(self.pages)} pages within budget"
+        return f"{len(failed)} of {len(self.pages)} pages over budget: " + "; ".join(f"{r['page']} ({', '.join(r['over'])})" for r in failed[:5]) + (" ..." if len(failed) > 5 else "")
@@ -0,0 +1,2073 @@
+"""Titan compiler engine: turns a SiteConfig into the generated site's HTML."""
+import contextlib
+import contextvars
+import csv
+import functools
+import hashlib
+import html
+import io
+import json
+import re
+import threading
+import time
+import unicodedata
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# --- 1. SITE CONFIG ---
+@dataclass(frozen=True)
+class SiteConfig:
+    """Every builder input the compiler reads. Defaults match the builder UI."""
+    # 3.1 Visual DNA
+    theme_mode: str = "Clean Corporate (Light)"
+    p_color: str = "#0F172A"
+    s_color: str = "#EF4444"
+    h_font: str = "Montserrat"
+    b_font: str = "Inter"
+    border_rad: str = "12px"
+    anim_type: str = "Fade Up"
+
+    # 3.2 Module Manager
+    show_hero: bool = True
+    show_stats: bool = True
+    show_features: bool = True
+    show_pricing: bool = True
+    show_inventory: bool = True
+    show_blog: bool = True
+    show_gallery: bool = True
+    show_testimonials: bool = True
+    show_faq: bool = True
+    show_cta: bool = True
+    site_search: bool = True  # build-time search index (titan.search) behind a nav search box
+    search_stemming: bool = False
+
+    # 3.3 SEO & Analytics
+    seo_area: str = "Global / Online"
+    seo_kw: str = "web design, no monthly fees, one time payment website, stop web rent"
+    gsc_tag: str = ""
+    ga_tag: str = ""
+    og_image: str = ""
+
+    # 3.4 Delivery & Performance
+    css_mode: str = "Shared File (Cached)"
+    bundle_js: bool = True
+    icon_sprite: bool = True
+    sheet_cache_ttl: int = 10
+    service_worker: bool = True
+    self_host_fonts: bool = True
+    images: tuple = ()  # ImageMeta for uploaded images, filled in by the image stage rather than a widget
+    minify_output: bool = True
+    precompress: bool = False
+    store_compressed: bool = True
+    # Per-page budgets checked after export (titan.budget); 0 = no limit
+    budget_html_kb: int = 100
+    budget_css_kb: int = 50
+    budget_js_kb: int = 50
+    budget_svg_kb: int = 20
+    budget_blocking: int = 3
+    budget_origins: int = 4
+
+    # Tab 1: Identity
+    biz_name: str = "StopWebRent.com"
+    biz_tagline: str = "Stop Renting. Start Owning."
+    biz_phone: str = "966572562151"
+    biz_email: str = "hello@kaydiemscriptlab.com"
+    prod_url: str = "https://www.stopwebrent.com"
+    biz_addr: str = "Kaydiem Script Lab\nKanishka’s House, Garia Station Rd\nKolkata, West Bengal 700084, India"
+    map_iframe: str = ""
+    seo_d: str = "Stop paying monthly fees for Wix or Shopify. The Titan Engine builds ultra-fast (0.1s) websites with $0 hosting costs. Pay once, own your code forever."
+    logo_url: str = ""
+    fb_link: str = ""
+    ig_link: str = ""
+    x_link: str = ""
+    li_link: str = ""
+    yt_link: str = ""
+    wa_num: str = "966572562151"
+
+    # Tab 2: Content Blocks
+    hero_h: str = "Stop Paying Rent for Your Website."
+    hero_sub: str = "The Titan Engine is the world’s first 0.1s website architecture that runs on $0 monthly fees. Pay once. Own it forever."
+    hero_img_1: str = "https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=1600"
+    hero_img_2: str = "https://images.unsplash.com/photo-1551288049-bebda4e38f71?q=80&w=1600"
+    hero_img_3: str = "https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?q=80&w=1600"
+    stat_1: str = "0.1s"
+    label_1: str = "Load Speed"
+    stat_2: str = "$0"
+    label_2: str = "Monthly Fees"
+    stat_3: str = "100%"
+    label_3: str = "Ownership"
+    f_title: str = "The Titan Value Pillars"
+    feat_data: str = "bolt | The Performance Pillar | **0.1s High-Velocity Loading**. While traditional sites take 3–5s, Titan loads instantly. This satisfies Google’s Core Web Vitals perfectly for higher ranking.\nwallet | The Economic Pillar | **$0 Monthly Fees**. We eliminated hosting subscriptions. You pay once and own the raw source code forever. No 'rent', no 'maintenance fees'.\ntable | The Functional Pillar | **Google Sheets CMS**. Update prices and photos directly from a simple spreadsheet. If you can use Excel, you can manage your website instantly.\nshield | The Authority Pillar | **Unhackable Security**. By removing the database (Zero-DB Architecture), we have removed the hacker's primary entry point. Your site is impenetrable.\nlayers | The Reliability Pillar | **Global Edge Deployment**. Your site doesn't live on one slow server. It is distributed across 100+ servers worldwide (CDN), creating 99.9% uptime and instant access from any city.\nstar | The Conversion Pillar | **One-Tap WhatsApp**. We embed 'Direct-to-Chat' technology. Customers don't need to save your number; they simply tap one button to start a sales conversation immediately."
+    about_h: str = "Control Your Empire from a Spreadsheet"
+    about_img: str = "https://images.unsplash.com/photo-1543286386-713df548e9cc?q=80&w=1600"
+    about_short: str = "No WordPress dashboard. No plugins to update. Just open your private Google Sheet, change a text, and watch your site update globally in seconds."
+    about_long: str = "**The Digital Landlord Trap**\nMost business owners don't realize they are trapped in a rental cycle. Platforms like Wix, Squarespace, and Shopify act as Digital Landlords. They charge you rent every single month to keep your business online. If you stop paying, they delete your website. Over 5 years, a cheap $29/mo website actually drains over $1,700 from your pocket.\n\n**The Titan Philosophy: Ownership**\nAt StopWebRent.com, we believe you should own your digital home, not rent it. We reject bloatware, heavy databases, and recurring subscription models. Our mission is to democratize Enterprise Grade technology for small business owners.\n\n**How We Achieve $0 Monthly Fees**\nWe utilize Static Site Architecture. Unlike traditional sites that require a heavy server running 24/7 (costing money), Titan sites are pre-built and live on the Global Edge (CDN)."
+
+    # Tab 3: Pricing Logic
+    titan_price: str = "$199"
+    titan_mo: str = "$0"
+    wix_name: str = "Wix (Core Plan)"
+    wix_mo: str = "$29/mo"
+    save_val: str = "$1,466"
+
+    # Tab 4: Inventory/Portfolio
+    sheet_url: str = ""
+    custom_feat: str = "https://images.unsplash.com/photo-1460925895917-afdab827c52f?q=80&w=800"
+    inv_mode: str = "Live (Browser Fetch)"
+    inv_page_size: int = 24
+
+    # Tab 5: Blog Engine
+    blog_sheet_url: str = ""
+    blog_hero_title: str = "Latest Insights"
+    blog_hero_sub: str = "Thoughts on technology, business, and freedom."
+    blog_mode: str = "Live (Browser Fetch)"
+    blog_page_size: int = 12
+
+    # Tab 6: Legal & Footer
+    testi_data: str = "Rajesh Gupta, HVAC Business Owner | I was paying Wix $35/month for 3 years. Titan built me a faster site for a one-time fee. I stopped the bleeding and finally own my asset.\nSarah Jenkins, Cafe Owner | Updating my menu used to be a nightmare on WordPress. Now, I just open a Google Sheet on my phone, change the price, and it updates the website instantly.\nDavid Miller, Financial Consultant | Speed is everything for SEO. My old site took 4 seconds to load. My new Titan site loads in 0.1 seconds. My Google ranking jumped to Page 1 within a month."
+    faq_data: str = "Do I really pay $0 for hosting? ? Yes. We utilize 'Static Site Architecture' which allows your site to be hosted on Enterprise CDNs (like Netlify/Vercel) within their generous free tiers for small businesses.\nWhat about my Domain Name? ? You pay that directly to the registrar (like GoDaddy or Namecheap). It usually costs ~$15/year. We do not mark this up.\nCan I add a blog later? ? Yes. The Titan Engine is scalable. We can add a blog, gallery, or more pages for a one-time expansion fee.\nIs it secure? ? It is safer than WordPress. Because there is no database to hack, your site is virtually impenetrable to common SQL injection attacks."
+    priv_txt: str = "**1. Introduction & Digital Sovereignty**\nAt StopWebRent.com (operated by Kaydiem Script Lab), we treat data privacy not just as a compliance requirement, but as a fundamental architectural feature. We collect the absolute minimum amount of data required to engineer, deploy, and maintain your digital asset. This Privacy Policy outlines how we handle your information under the jurisdiction of West Bengal, India, while respecting global standards.\n\n**2. Information We Collect**\nTo provide our Titan Engine services, we collect Identity Data, Contact Data, and Technical Data (your Google Sheet ID).\n\n**3. The Static Site Privacy Advantage**\nUnlike traditional WordPress sites that store user data in complex databases (vulnerable to hacking), the websites we build for you are Static. They do not inherently store your customers data on our servers. This Zero-DB Architecture inherently reduces your liability and privacy risk."
+    term_txt: str = "**1. Service Agreement**\nBy engaging StopWebRent.com (Kaydiem Script Lab) for web development services, you agree to these Terms. We provide Static Website Architecture designed for speed and cost-efficiency.\n\n**2. Payment & Fees**\nYou agree to pay the one-time architectural setup fee (e.g., $199) as advertised. StopWebRent.com does not charge monthly maintenance or hosting fees. The Client is responsible for their own Domain Name renewal fees.\n\n**3. Intellectual Property (The Ownership Clause)**\nUpon settlement of the final invoice, full intellectual property rights and source code ownership are transferred to the Client. You are granted a perpetual, worldwide, non-exclusive license to the code."
+
+# --- BUILD PROFILER ---
+_profile = contextvars.ContextVar("titan_profile", default=None)
+
+class BuildProfile:
+    """Wall time, output bytes and fragment cache hits/misses per compiler step, plus one entry per written file.
+
+    Step times are inclusive: a page generator's time contains the fragments it calls.
+    """
+    def __init__(self):
+        self.steps = {}
+        self.files = []
+
+    def _step(self, name):
+        return self.steps.setdefault(name, {"step": name, "calls": 0, "seconds": 0.0, "bytes": 0, "hits": 0, "misses": 0})
+
+    def add(self, name, seconds, size):
+        step = self._step(name)
+        step["calls"] += 1
+        step["seconds"] += seconds
+        step["bytes"] += size
+
+    def count(self, name, hit):
+        self._step(name)["hits" if hit else "misses"] += 1
+
+    def add_file(self, name, seconds, size):
+        self.add("writestr", seconds, size)
+        self.files.append({"file": name, "seconds": seconds, "bytes": size})
+
+    def rows(self):
+        """Steps, slowest first."""
+        return sorted(self.steps.values(), key=lambda s: -s["seconds"])
+
+    def as_dict(self):
+        return {"steps": self.rows(), "files": self.files}
+
+    def to_json(self):
+        return json.dumps(self.as_dict(), indent=1)
+
+@contextlib.contextmanager
+def profiling(profile=None):
+    """Profiles the compiler steps run inside the block, in this thread only. Yields the BuildProfile."""
+    profile = profile or BuildProfile()
+    token = _profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _profile.reset(token)
+
+def current_profile():
+    return _profile.get()
+
+def _count(name, hit):
+    profile = _profile.get()
+    if profile is not None:
+        profile.count(name, hit)
+
+def _size(out):
+    if isinstance(out, (str, bytes)): return len(out)
+    if isinstance(out, dict): return sum(map(_size, out.values()))
+    return 0
+
+def profiled(fn):
+    """Times a compiler step and measures its output while a build is profiled; a context lookup otherwise."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile = _profile.get()
+        if profile is None:
+            return fn(*args, **kwargs)
+        start = time.perf_counter()
+        out = fn(*args, **kwargs)
+        profile.add(fn.__name__, time.perf_counter() - start, _size(out))
+        return out
+    return wrapper
+
+# --- 2. FRAGMENT CACHE ---
+CACHE_SIZE = 256
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+class _FieldRecorder:
+    """Wraps a config and records which fields a fragment reads."""
+    def __init__(self, cfg):
+        self._cfg = cfg
+        self.fields = set()
+
+    def __getattr__(self, name):
+        self.fields.add(name)
+        return getattr(self._cfg, name)
+
+def _digest(*parts):
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
+def fragment(fn):
+    """Memoizes a generator on a hash of only the config fields it reads.
+
+    The fields are discovered by recording the first call and widened when a
+    later call takes another branch. Nested fragments report their fields to
+    the caller even on a cache hit, so composite keys stay complete.
+    """
+    deps = []
+
+    @functools.wraps(fn)
+    def wrapper(cfg, *args, **kwargs):
+        if deps:
+            key = _digest(fn.__qualname__, [getattr(cfg, f) for f in deps], args, sorted(kwargs.items()))
+            with _cache_lock:
+                if key in _cache:
+                    _cache.move_to_end(key)
+                    _cache_stats["hits"] += 1
+                    _count(fn.__name__, True)
+                    return _cache[key]
+        rec = _FieldRecorder(cfg)
+        out = fn(rec, *args, **kwargs)
+        deps[:] = sorted(set(deps) | rec.fields)
+        key = _digest(fn.__qualname__, [getattr(cfg, f) for f in deps], args, sorted(kwargs.items()))
+        _count(fn.__name__, False)
+        with _cache_lock:
+            _cache_stats["misses"] += 1
+            _cache[key] = out
+            while len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+        return out
+    return profiled(wrapper)
+
+def cache_info():
+    with _cache_lock:
+        return dict(_cache_stats, size=len(_cache), maxsize=CACHE_SIZE)
+
+def cache_clear():
+    with _cache_lock:
+        _cache.clear()
+        _cache_stats.update(hits=0, misses=0)
+
+# --- 3. COMPILER ENGINE ---
+
+# Titan Markdown, the rich-text subset of every text field and the blog's Content column.
+#   block   := heading | item | para              one per non-blank line; blank lines are skipped
+#   heading := "#"{1,3} " " inline                 <h2>..<h4>
+#            | "**" inline "**"                    a line that is one bold span is an <h3>
+#   item    := ("* " | "- ") inline                <li>; consecutive items share one <ul>
+#   para    := inline                              <p>
+#   inline  := text, "**" strong "**", "*" em "*"  markers pair left to right; unpaired ones stay literal
+# Bare &, < and > are escaped; well-formed entities (&copy;, &#169;, &#xA9;) pass through, as do <br> and
+# <b>, <strong>, <em>, <i> and links (<a href="URL">, http(s), mailto, tel or relative URL, optional
+# target="_blank") opened and closed on the same line. Anything else shows as text.
+# Output sits in <div class="md">, styled by the theme's .md rules.
+# The "md" JS module is the browser twin; both must render tests/markdown_golden.json identically.
+_MD_MARK = re.compile(r'(\*\*?)')
+_MD_ESCAPE = re.compile(r'&(?!(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+);)|[<>]')
+_MD_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+# Allowed tags are matched on the escaped line; a body stops at the next opening tag of its kind,
+# so a line is scanned once per pattern.
+_MD_BR = re.compile(r'&lt;br\s*/?&gt;', re.I)
+_MD_TAG = re.compile(r'&lt;(b|strong|em|i)&gt;((?:(?!&lt;\1&gt;).)*?)&lt;/\1&gt;', re.I)
+_MD_LINK = re.compile(r'&lt;a href="((?:https?:|mailto:|tel:)[^"\s]*|[^":\s/?#]*(?:[/?#][^"\s]*)?)"( target="_blank")?&gt;((?:(?!&lt;a ).)*?)&lt;/a&gt;', re.I)
+_MD_BLANK = ' target="_blank" rel="noopener"'
+
+def _md_tags(text):
+    return _MD_TAG.sub(lambda m: f"<{m[1].lower()}>{_md_tags(m[2])}</{m[1].lower()}>", text)
+
+def _md_inline(line):
+    """One pass over the marker/text runs; a marker opened after a span's start is dropped when the span closes."""
+    out, opened = [], {}
+    for i, part in enumerate(_MD_MARK.split(line)):
+        if i % 2 == 0:
+            if part: out.append(_MD_ESCAPE.sub(lambda m: _MD_ESCAPES[m[0]], part))
+            continue
+        at = opened.pop(part, None)
+        if at is None:
+            opened[part] = len(out)
+            out.append(part)
+            continue
+        tag = "strong" if part == "**" else "em"
+        out[at] = f"<{tag}>"
+        out.append(f"</{tag}>")
+        opened = {m: pos for m, pos in opened.items() if pos < at}
+    text = _md_tags(_MD_BR.sub("<br>", "".join(out)))
+    return _MD_LINK.sub(lambda m: f'<a href="{m[1]}"{_MD_BLANK if m[2] else ""}>{m[3]}</a>', text)
+
+def _md_block(line):
+    level = len(line) - len(line.lstrip("#"))
+    if 1 <= level <= 3 and line[level:level + 1] == " ":
+        return f"<h{level + 1}>{_md_inline(line[level + 1:].strip())}</h{level + 1}>"
+    if len(line) > 4 and line.startswith("**") and line.endswith("**") and "**" not in line[2:-2]:
+        return f"<h3>{_md_inline(line[2:-2])}</h3>"
+    return f"<p>{_md_inline(line)}</p>"
+
+@functools.lru_cache(maxsize=512)
+def format_text(text):
+    """Renders Titan Markdown (grammar above) to HTML in a single pass. Cached per input."""
+    if not text: return ""
+    out, in_list = ['<div class="md">'], False
+    for raw in text.split("\n"):
+        line = raw.strip()
+        if not line: continue
+        item = line[:2] in ("* ", "- ")
+        if item != in_list:
+            out.append("<ul>" if item else "</ul>")
+            in_list = item
+        out.append(f"<li>{_md_inline(line[2:].strip())}</li>" if item else _md_block(line))
+    if in_list: out.append("</ul>")
+    out.append("</div>")
+    return "".join(out)
+
+@fragment
+def gen_schema(cfg):
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "LocalBusiness",
+        "name": cfg.biz_name,
+        "image": cfg.logo_url or cfg.hero_img_1,
+        "telephone": cfg.biz_phone,
+        "email": cfg.biz_email,
+        "areaServed": cfg.seo_area,
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": cfg.biz_addr
+        },
+        "url": cfg.prod_url,
+        "description": cfg.seo_d
+    }
+    return f'<script type="application/ld+json">{json.dumps(schema)}</script>'
+
+@fragment
+def get_theme_css(cfg):
+    # Base Defaults
+    bg_color = "#ffffff"
+    text_color = "#0f172a"
+    card_bg = "#ffffff"
+    glass_nav = "rgba(255, 255, 255, 0.95)"
+    
+    # Theme Logic
+    if "Midnight" in cfg.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#0f172a", "#f8fafc", "#1e293b", "rgba(15, 23, 42, 0.9)"
+    elif "Cyberpunk" in cfg.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#050505", "#00ff9d", "#111", "rgba(0,0,0,0.8)"
+    elif "Luxury" in cfg.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#1c1c1c", "#D4AF37", "#2a2a2a", "rgba(28,28,28,0.95)"
+    elif "Forest" in cfg.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#f1f8e9", "#1b5e20", "#ffffff", "rgba(241,248,233,0.9)"
+    elif "Ocean" in cfg.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#e0f7fa", "#006064", "#ffffff", "rgba(224,247,250,0.9)"
+    elif "Stark" in cfg.theme_mode:
+        bg_color, text_color, card_bg, glass_nav = "#ffffff", "#000000", "#ffffff", "rgba(255,255,255,1)"
+
+    # Reveal states animate only opacity and transform, and only for visitors who have not asked for reduced motion.
+    anim_css = ""
+    if cfg.anim_type == "Fade Up":
+        anim_css = ".reveal { opacity: 0; transform: translateY(30px); transition: opacity 0.8s ease-out, transform 0.8s ease-out; } .reveal.active { opacity: 1; transform: none; }"
+    elif cfg.anim_type == "Zoom In":
+        anim_css = ".reveal { opacity: 0; transform: scale(0.95); transition: opacity 0.8s ease-out, transform 0.8s cubic-bezier(0.175, 0.885, 0.32, 1.275); } .reveal.active { opacity: 1; transform: none; }"
+    elif cfg.anim_type == "Slide Right":
+        anim_css = ".reveal { opacity: 0; transform: translateX(-40px); transition: opacity 0.8s ease-out, transform 0.8s ease-out; } .reveal.active { opacity: 1; transform: none; }"
+    if anim_css:
+        anim_css = f"@media (prefers-reduced-motion: no-preference) {{ {anim_css} }}"
+    
+    # Hero Carousel CSS
+    hero_css = """
+    .hero { position: relative; min-height: 90vh; overflow: hidden; display: flex; align-items: center; justify-content: center; text-align: center; color: white; padding-top: 80px; background-color: var(--p); }
+    .carousel-slide { position: absolute; top: 0; left: 0; width: 100%; height: 100%; object-fit: cover; opacity: 0; transition: opacity 1.5s ease-in-out; z-index: 0; }
+    .carousel-slide.active { opacity: 1; }
+    .hero-overlay { background: rgba(0,0,0,0.5); position: absolute; top: 0; left: 0; width: 100%; height: 100%; z-index: 1; }
+    .hero-content { z-index: 2; position: relative; animation: slideUp 1s ease-out; }
+    @keyframes slideUp { from { opacity:0; transform: translateY(30px); } to { opacity:1; transform: translateY(0); } }
+    @media (prefers-reduced-motion: reduce) { .hero-content { animation: none; } .carousel-slide { transition: none; } }
+    """
+
+    return f"""
+    :root {{
+        --p: {cfg.p_color}; --s: {cfg.s_color}; --bg: {bg_color}; --txt: {text_color}; --card: {card_bg};
+        --radius: {cfg.border_rad}; --nav: {glass_nav};
+        --h-font: '{cfg.h_font}', sans-serif; --b-font: '{cfg.b_font}', sans-serif;
+    }}
+    * {{ box-sizing: border-box; }}
+    html {{ scroll-behavior: smooth; }}
+    body {{ background-color: var(--bg); color: var(--txt); font-family: var(--b-font); margin: 0; line-height: 1.6; overflow-x: hidden; }}
+    
+    p, h1, h2, h3, h4, h5, h6, span, li, div {{ color: inherit; }}
+    .legal-text {{ color: var(--txt) !important; }}
+    
+    h1, h2, h3, h4 {{ font-family: var(--h-font); color: var(--p); line-height: 1.1; margin-bottom: 1rem; }}
+    strong {{ color: var(--p); font-weight: 800; }}
+    
+    input, textarea, select {{ width: 100%; padding: 0.8rem; margin-bottom: 1rem; border: 1px solid #ccc; border-radius: 6px; font-family: inherit; }}
+    label {{ color: var(--txt); font-weight: bold; margin-bottom: 0.5rem; display: block; }}
+
+    .container {{ max-width: 1280px; margin: 0 auto; padding: 0 20px; }}
+    .btn {{ display: inline-block; padding: 1rem 2.5rem; border-radius: var(--radius); font-weight: 700; text-decoration: none; transition: 0.3s; text-transform: uppercase; letter-spacing: 0.5px; cursor: pointer; border: none; text-align: center; }}
+    .btn-primary {{ background: var(--p); color: white !important; }}
+    .btn-accent {{ background: var(--s); color: white !important; box-shadow: 0 10px 25px -5px var(--s); }}
+    .btn:hover {{ transform: translateY(-3px); filter: brightness(1.15); }}
+    
+    /* Nav */
+    nav {{ position: fixed; top: 0; width: 100%; z-index: 1000; background: var(--nav); backdrop-filter: blur(12px); border-bottom: 1px solid rgba(100,100,100,0.1); padding: 1rem 0; }}
+    .nav-flex {{ display: flex; justify-content: space-between; align-items: center; }}
+    .nav-links {{ display: flex; align-items: center; }}
+    .nav-links a {{ margin-left: 2rem; text-decoration: none; font-weight: 600; color: var(--txt); font-size: 0.9rem; opacity: 0.8; transition:0.2s; }}
+    .nav-links a:hover {{ opacity: 1; color: var(--s); }}
+    .site-search {{ position: relative; margin-left: 2rem; }}
+    .site-search input {{ width: 11rem; padding: 0.5rem 1rem; border-radius: 50px; border: 1px solid rgba(128,128,128,0.3); background: var(--bg); color: var(--txt); font: inherit; font-size: 0.9rem; }}
+    .search-results {{ position: absolute; right: 0; top: calc(100% + 0.5rem); width: 22rem; max-width: 90vw; max-height: 70vh; overflow-y: auto; background: var(--card); border-radius: var(--radius); box-shadow: 0 10px 30px rgba(0,0,0,0.15); padding: 0.5rem; z-index: 1001; }}
+    .nav-links .search-results a {{ display: block; margin: 0; padding: 0.6rem 0.8rem; border-radius: 8px; opacity: 1; font-weight: 400; }}
+    .nav-links .search-results a:hover {{ background: rgba(128,128,128,0.1); }}
+    .search-results strong {{ display: block; color: var(--p); }}
+    .search-results span {{ font-size: 0.8rem; opacity: 0.7; }}
+    .search-results p {{ margin: 0; padding: 0.6rem 0.8rem; font-size: 0.9rem; opacity: 0.7; }}
+    .mobile-menu {{ display: none; font-size: 1.5rem; cursor: pointer; }}
+    
+    {hero_css}
+    .hero h1 {{ color: white; font-size: clamp(2.5rem, 8vw, 5rem); margin-bottom: 1.5rem; }}
+    .hero p {{ color: rgba(255,255,255,0.9); font-size: clamp(1.1rem, 2vw, 1.5rem); max-width: 700px; margin: 0 auto 2.5rem auto; }}
+    
+    section {{ padding: 5rem 0; }}
+    .section-head {{ text-align: center; margin-bottom: 4rem; }}
+    .section-head h2 {{ font-size: 2.5rem; }}
+    
+    /* GRIDS */
+    .grid-3 {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; }}
+    .about-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: center; }}
+    
+    /* CONTACT PAGE GRID (MOBILE FIXED) */
+    .contact-grid {{ display: grid; grid-template-columns: 1fr 2fr; gap: 3rem; }}
+    
+    .card {{ background: var(--card); padding: 2rem; border-radius: var(--radius); border: 1px solid rgba(100,100,100,0.1); transition: 0.3s; height: 100%; display: flex; flex-direction: column; }}
+    .card[data-more] {{ display: none; }}
+    .card:hover {{ transform: translateY(-5px); box-shadow: 0 20px 40px -10px rgba(0,0,0,0.1); border-color: var(--s); }}
+    
+    .prod-img {{ width: 100%; height: 250px; object-fit: cover; border-radius: calc(var(--radius) - 4px); margin-bottom: 1.5rem; background: #f1f5f9; }}
+    
+    /* PRICING TABLE */
+    .pricing-wrapper {{ overflow-x: auto; margin: 2rem 0; }}
+    .pricing-table {{ width: 100%; border-collapse: collapse; min-width: 600px; }}
+    .pricing-table th {{ background: var(--p); color: white; padding: 1.5rem; text-align: left; font-size: 1.1rem; }}
+    .pricing-table td {{ padding: 1.5rem; border-bottom: 1px solid rgba(100,100,100,0.1); background: var(--card); color: var(--txt); }}
+    .pricing-table tr:last-child td {{ font-weight: bold; font-size: 1.2rem; background: rgba(var(--s), 0.1); border-bottom: none; }}
+
+    /* FAQ */
+    details {{ background: var(--card); border: 1px solid rgba(100,100,100,0.1); border-radius: 8px; margin-bottom: 1rem; padding: 1rem; cursor: pointer; color: var(--txt); }}
+    details summary {{ font-weight: bold; font-size: 1.1rem; color: var(--txt); }}
+    details p {{ margin-top: 1rem; margin-bottom: 0; opacity: 0.9; color: var(--txt); }}
+
+    /* Footer & Social */
+    footer {{ background: var(--p); color: white; padding: 4rem 0; margin-top: auto; }}
+    .footer-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 3rem; }}
+    .footer a, footer a {{ color: rgba(255,255,255,0.8) !important; text-decoration: none; display: block; margin-bottom: 0.5rem; transition: 0.3s; }}
+    .footer a:hover, footer a:hover {{ color: #ffffff !important; text-decoration: underline; }}
+    .social-icon {{ width: 24px; height: 24px; fill: rgba(255,255,255,0.7); transition: 0.3s; }}
+    .social-icon:hover {{ fill: #ffffff; transform: scale(1.1); }}
+
+    /* Detail View */
+    .detail-view {{ display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: start; }}
+    
+    /* RICH TEXT (format_text) */
+    .md p {{ margin-bottom: 1rem; opacity: 0.9; color: inherit; }}
+    .md ul {{ margin-bottom: 1rem; padding-left: 1.5rem; }}
+    .md li {{ margin-bottom: 0.5rem; opacity: 0.9; color: inherit; }}
+    .md h2, .md h3, .md h4 {{ margin-top: 1.5rem; margin-bottom: 0.5rem; color: var(--p); }}
+    .md h3 {{ font-size: 1.25rem; }}
+
+    /* BLOG STYLES */
+    .blog-badge {{ background: var(--s); color: white; padding: 0.3rem 0.8rem; border-radius: 50px; font-size: 0.75rem; text-transform: uppercase; font-weight: bold; width: fit-content; margin-bottom: 1rem; display:inline-block; }}
+    .article-content ul {{ padding-left: 1.5rem; margin-bottom: 1.5rem; }}
+    .article-content li {{ margin-bottom: 0.5rem; }}
+    .article-content p {{ margin-bottom: 1.5rem; font-size: 1.1rem; opacity: 0.9; line-height: 1.8; }}
+    
+    /* SOCIAL SHARE BAR STYLES (NEW) */
+    .share-row {{ display: flex; gap: 0.8rem; margin-top: 2rem; align-items: center; flex-wrap: wrap; }}
+    .share-label {{ font-weight: bold; margin-right: 0.5rem; font-size: 0.9rem; opacity: 0.8; }}
+    .share-btn {{ width: 40px; height: 40px; display: flex; align-items: center; justify-content: center; border-radius: 50%; color: white; transition: 0.3s; border: none; cursor: pointer; text-decoration: none; }}
+    .share-btn:hover {{ transform: translateY(-3px); filter: brightness(1.1); }}
+    .share-btn svg {{ width: 18px; height: 18px; fill: white; }}
+    .bg-fb {{ background: #1877F2; }}
+    .bg-x {{ background: #000000; }}
+    .bg-li {{ background: #0A66C2; }}
+    .bg-link {{ background: #64748b; }}
+    
+    {anim_css}
+    
+    /* MOBILE OPTIMIZATIONS */
+    @media (max-width: 768px) {{
+        .nav-links {{ 
+            position: fixed; top: 70px; left: -100%; width: 100%; height: calc(100vh - 70px); 
+            background: var(--bg); flex-direction: column; padding: 2rem; transition: 0.3s; 
+            align-items: flex-start; justify-content: flex-start;
+            border-top: 1px solid rgba(0,0,0,0.1);
+        }}
+        .nav-links.active {{ left: 0; }}
+        .nav-links a {{ margin-left: 0; margin-bottom: 1.5rem; font-size: 1.1rem; }}
+        .site-search {{ margin: 0 0 1.5rem; width: 100%; }}
+        .site-search input {{ width: 100%; }}
+        .search-results {{ position: static; width: 100%; margin-top: 0.5rem; box-shadow: none; }}
+        .mobile-menu {{ display: block; }}
+        
+        .hero {{ min-height: 70vh; }}
+        .about-grid {{ grid-template-columns: 1fr !important; gap: 2rem; text-align: left; }}
+        .about-grid img, .about-grid picture {{ order: 2; margin-top: 1rem; }}
+        .about-grid div {{ order: 1; }}
+        
+        /* FIX: FORCE CONTACT GRID TO 1 COLUMN ON MOBILE */
+        .contact-grid {{ grid-template-columns: 1fr; gap: 2rem; }}
+        .detail-view {{ grid-template-columns: 1fr; gap: 2rem; }}
+    }}
+    """
+
+# --- SHARED STYLESHEET & PURGE ---
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_IGNORED = re.compile(r'::?[\w-]+(\([^)]*\))?|\[[^\]]*\]')
+_CSS_NAMES = re.compile(r'[.#]([\w-]+)|(?:^|(?<=[\s>+~]))([a-zA-Z][\w-]*)')
+_PAGE_TOKENS = re.compile(r'[\w-]+')
+
+def stylesheet_name(css):
+    return asset_name("styles", css, "css")
+
+def _selector_names(selector):
+    """Tag, class and id names a selector needs on the page; pseudo and attribute parts are ignored."""
+    return frozenset(a or b for a, b in _CSS_NAMES.findall(_CSS_IGNORED.sub(' ', selector.strip())))
+
+def _split_css(css):
+    """Splits a stylesheet into top-level (prelude, body) blocks by brace depth."""
+    blocks, depth, start, head = [], 0, 0, ""
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                head, start = css[start:i].strip(), i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((head, css[start:i].strip()))
+                start = i + 1
+    return blocks
+
+@functools.lru_cache(maxsize=32)
+def _parse_css(css):
+    """Rules as (selectors with their required names, body) or (at-rule, nested rules | raw body)."""
+    rules = []
+    for head, body in _split_css(_CSS_COMMENT.sub("", css)):
+        if head.startswith("@media") or head.startswith("@supports"):
+            rules.append((head, _parse_css(body)))
+        elif head.startswith("@"):
+            rules.append((head, body))
+        else:
+            rules.append((tuple((sel.strip(), _selector_names(sel)) for sel in head.split(",")), body))
+    return tuple(rules)
+
+def _emit_rules(rules, tokens):
+    out = []
+    for head, body in rules:
+        if isinstance(head, str):
+            if isinstance(body, tuple):
+                inner = _emit_rules(body, tokens)
+                if inner: out.append(f"{head}{{{inner}}}")
+            else:
+                out.append(f"{head}{{{body}}}")
+            continue
+        kept = [sel for sel, names in head if names <= tokens]
+        if kept: out.append(f"{','.join(kept)}{{{body}}}")
+    return "".join(out)
+
+def purge_css(css, markup):
+    """Drops rules whose selectors name a tag, class or id that never appears in the markup.
+
+    Every word in the page counts, scripts included, so classes toggled from JS are kept.
+    The html and body roots always count, since callers usually pass only the body markup.
+    """
+    return _emit_rules(_parse_css(css), frozenset(_PAGE_TOKENS.findall(markup)) | {"html", "body"})
+
+# --- IMAGES ---
+# Uploads are encoded at these widths by titan.images; CDN images are requested at the same steps.
+IMG_WIDTHS = (480, 960, 1600, 2400)
+CDN_HOSTS = ("images.unsplash.com",)
+
+@dataclass(frozen=True)
+class ImageMeta:
+    """An uploaded image after the image stage. Image fields refer to it by its file name."""
+    name: str
+    width: int
+    height: int
+    variants: tuple  # (mime, ((width, path), ...)) per format, best first
+    lqip: str = ""   # tiny blurred data: URI, empty when the image has transparency
+
+def cdn_url(url, width, height=0):
+    """Asks a known image CDN for a given width (and cropped height); other URLs pass through."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.hostname not in CDN_HOSTS:
+        return url
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query) if k not in ("w", "h", "fit", "auto")]
+    query += [("w", str(width))] + ([("h", str(height)), ("fit", "crop")] if height else []) + [("auto", "format")]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+def _uploaded(cfg, url):
+    return next((m for m in cfg.images if m.name == url and m.variants), None)
+
+def image_url(cfg, url, width):
+    """One URL about `width` pixels wide, for CSS backgrounds and JSON shards."""
+    meta = _uploaded(cfg, url)
+    if meta is None:
+        return cdn_url(url, width)
+    steps = meta.variants[-1][1]
+    return next((path for w, path in steps if w >= width), steps[-1][1])
+
+CARD_SIZES = "(max-width: 768px) 100vw, 400px"
+ABOUT_SIZES = "(max-width: 768px) 100vw, 50vw"
+
+def img_fallback(cfg):
+    """onerror attribute that swaps a broken product image for the default one."""
+    src = html.escape(image_url(cfg, cfg.custom_feat, 960))
+    return f' onerror="this.onerror=null;this.removeAttribute(\'srcset\');this.src=\'{src}\';"'
+
+def _srcset(steps):
+    return ", ".join(f"{path} {w}w" for w, path in steps)
+
+def responsive_img(cfg, url, alt="", sizes="100vw", cls="", style="", extra="", aspect=0, eager=False):
+    """<img> (or <picture> for uploads with several formats) sized for the layout.
+
+    Uploads get srcset per format, intrinsic width/height and a blur placeholder. CDN images get a
+    width-stepped srcset, cropped to `aspect` (height / width) when given. Eager images are
+    LCP candidates and get fetchpriority=high; the rest load lazily.
+    """
+    e = html.escape
+    meta = _uploaded(cfg, url)
+    attrs = f' alt="{e(alt)}"' + (f' class="{cls}"' if cls else "")
+    attrs += ' fetchpriority="high"' if eager else ' loading="lazy"'
+    if meta is not None:
+        if meta.lqip: style = f"{style}; background: url({meta.lqip}) center/cover".lstrip("; ")
+        (_, steps), sources = meta.variants[-1], meta.variants[:-1]
+        src = next((path for w, path in steps if w >= 960), steps[-1][1])
+        attrs += f' width="{meta.width}" height="{meta.height}" decoding="async"'
+        attrs += f' style="{style}"' if style else ""
+        tag = f'<img src="{src}" srcset="{_srcset(steps)}" sizes="{sizes}"{attrs}{extra}>'
+        if not sources:
+            return tag
+        return "<picture>" + "".join(f'<source type="{m}" srcset="{_srcset(s)}" sizes="{sizes}">' for m, s in sources) + tag + "</picture>"
+    attrs += f' style="{style}"' if style else ""
+    if urllib.parse.urlsplit(url).hostname not in CDN_HOSTS:
+        return f'<img src="{e(url)}"{attrs}{extra}>'
+    height = lambda w: round(w * aspect) if aspect else 0
+    srcset = ", ".join(f"{e(cdn_url(url, w, height(w)))} {w}w" for w in IMG_WIDTHS)
+    if aspect: attrs += f' width="{IMG_WIDTHS[2]}" height="{height(IMG_WIDTHS[2])}"'
+    return f'<img src="{e(cdn_url(url, 960, height(960)))}" srcset="{srcset}" sizes="{sizes}"{attrs}{extra}>'
+
+@fragment
+def gen_nav(cfg):
+    close_menu = "document.querySelector('.nav-links').classList.remove('active')"
+    logo_display = f'<img src="{image_url(cfg, cfg.logo_url, 480)}" height="40" alt="{cfg.biz_name} Logo">' if cfg.logo_url else f'<span style="font-weight:900; font-size:1.5rem; color:var(--p)">{cfg.biz_name}</span>'
+    features_link = f'<a href="index.html#features" onclick="{close_menu}">Features</a>' if cfg.show_features else ''
+    pricing_link = f'<a href="index.html#pricing" onclick="{close_menu}">Savings</a>' if cfg.show_pricing else ''
+    inventory_link = f'<a href="index.html#inventory" onclick="{close_menu}">Portfolio</a>' if cfg.show_inventory else ''
+    blog_link = f'<a href="blog.html" onclick="{close_menu}">Blog</a>' if cfg.show_blog else ''
+    search_box = f'<form class="site-search" role="search" data-src="{SEARCH_DIR}" hidden><input type="search" name="q" placeholder="Search" aria-label="Search the site" autocomplete="off"><div class="search-results" hidden></div></form>{use_js("search")}' if search_enabled(cfg) else ''
+    
+    return f"""
+    <nav><div class="container nav-flex">
+        <a href="index.html" style="text-decoration:none">{logo_display}</a>
+        <div class="mobile-menu" onclick="document.querySelector('.nav-links').classList.toggle('active')">☰</div>
+        <div class="nav-links">
+            <a href="index.html" onclick="{close_menu}">Home</a>
+            {features_link}
+            {pricing_link}
+            {inventory_link}
+            {blog_link}
+            <a href="about.html" onclick="{close_menu}">About</a>
+            <a href="contact.html" onclick="{close_menu}">Contact</a>
+            {search_box}
+            <a href="tel:{cfg.biz_phone}" class="btn-accent" style="padding:0.6rem 1.5rem; margin-left:1.5rem; margin-bottom:0; border-radius:50px; color:white !important;">Call Now</a>
+        </div>
+    </div></nav>
+    """
+
+@fragment
+def gen_hero(cfg):
+    return f"""
+    <section class="hero">
+        <div class="hero-overlay"></div>
+        {responsive_img(cfg, cfg.hero_img_1, cls="carousel-slide active", eager=True)}
+        {responsive_img(cfg, cfg.hero_img_2, cls="carousel-slide")}
+        {responsive_img(cfg, cfg.hero_img_3, cls="carousel-slide")}
+        
+        <div class="container hero-content">
+            <h1>{cfg.hero_h}</h1>
+            <p>{cfg.hero_sub}</p>
+            <div style="display:flex; gap:1rem; justify-content:center; flex-wrap:wrap;">
+                <a href="#inventory" class="btn btn-accent">Explore Now</a>
+                <a href="contact.html" class="btn" style="background:rgba(255,255,255,0.2); backdrop-filter:blur(10px); color:white;">Contact Us</a>
+            </div>
+        </div>
+    </section>
+    {use_js('carousel')}
+    """
+
+# --- ICONS ---
+# One path per icon on a 0 0 24 24 grid, drawn in the current fill colour.
+ICONS = {
+    "code": "M9.4 16.6L4.8 12l4.6-4.6L8 6l-6 6 6 6 1.4-1.4zm5.2 0l4.6-4.6-4.6-4.6L16 6l6 6-6 6-1.4-1.4z",
+    "database": "M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-6h2v6zm0-8h-2V7h2v2z",
+    "layers": "M11.99 18.54l-7.37-5.73L3 14.07l9 7 9-7-1.63-1.27-7.38 5.74zM12 16l7.36-5.73L21 9l-9-7-9 7 1.63 1.27L12 16z",
+    "truck": "M20 8h-3V4H3c-1.1 0-2 .9-2 2v11h2c0 1.66 1.34 3 3 3s3-1.34 3-3h6c0 1.66 1.34 3 3 3s3-1.34 3-3h2v-5l-3-4zM6 18.5c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5zm13.5-9l1.96 2.5H17V9.5h2.5zm-1.5 9c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5z",
+    "shield": "M12 1L3 5v6c0 5.55 3.84 10.74 9 12 5.16-1.26 9-6.45 9-12V5l-9-4zm0 10.99h7c-.53 4.12-3.28 7.79-7 8.94V12H5V6.3l7-3.11v8.8z",
+    "hammer": "M22.11 11.26l-1.41-1.41c-.55-.56-1.43-.6-2.03-.1L15 6.6V3c0-.55-.45-1-1-1H9c-.55 0-1 .45-1 1v7h2v-2h2v4l-6.88 5.73c-.78.65-1.95.65-2.73 0-.78-.65-.78-1.71 0-2.36L8.53 10.2l-1.27-1.27c-.78-.78-.78-2.05 0-2.83.78-.78 2.05-.78 2.83 0l1.27 1.27 5.14-4.28c.15-.12.33-.19.51-.19.18 0 .37.07.51.19l1.41 1.41c.29.29.29.77 0 1.06L14 10.53l6.59 5.49c1.56-1.56 1.56-4.09 1.52-4.76z",
+    "water": "M12 22c4.97 0 9-4.03 9-9 0-4.97-9-13-9-13S3 8.03 3 13c0 4.97 4.03 9 9 9zm0-11c1.66 0 3 1.34 3 3s-1.34 3-3 3-3-1.34-3-3 1.34-3 3-3z",
+    "home": "M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z",
+    "bolt": "M11 21h-1l1-7H7.5c-.58 0-.57-.32-.38-.66.19-.34.05-.08.07-.12C8.48 10.94 10.42 7.54 13 3h1l-1 7h3.5c.49 0 .56.33.47.51l-.07.15C12.96 17.55 11 21 11 21z",
+    "star": "M12 17.27L18.18 21l-1.64-7.03L22 9.24l-7.19-.61L12 2 9.19 8.63 2 9.24l5.46 4.73L5.82 21z",
+    "heart": "M12 21.35l-1.45-1.32C5.4 15.36 2 12.28 2 8.5 2 5.42 4.42 3 7.5 3c1.74 0 3.41.81 4.5 2.09C13.09 3.81 14.76 3 16.5 3 19.58 3 22 5.42 22 8.5c0 3.78-3.4 6.86-8.55 11.54L12 21.35z",
+    "wallet": "M21 18v1c0 1.1-.9 2-2 2H5c-1.11 0-2-.9-2-2V5c0-1.1.89-2 2-2h14c1.1 0 2 .9 2 2v1h-9c-1.11 0-2 .9-2 2v8c0 1.1.89 2 2 2h9zm-9-2h10V8H12v8zm4-2.5c-.83 0-1.5-.67-1.5-1.5s.67-1.5 1.5-1.5 1.5.67 1.5 1.5-.67 1.5-1.5 1.5z",
+    "table": "M19 3H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zM5 19V5h14v14H5zm2-2h10v-2H7v2zm0-4h10v-2H7v2zm0-4h10V7H7v2z",
+    "check": "M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z",
+    "facebook": "M18 2h-3a5 5 0 0 0-5 5v3H7v4h3v8h4v-8h3l1-4h-4V7a1 1 0 0 1 1-1h3z",
+    "instagram": "M16.98 0a6.9 6.9 0 0 1 5.08 1.98A6.94 6.94 0 0 1 24 7.02v9.96c0 2.08-.68 3.87-1.98 5.13A7.14 7.14 0 0 1 16.94 24H7.06a7.06 7.06 0 0 1-5.03-1.89A6.96 6.96 0 0 1 0 16.94V7.02C0 2.8 2.8 0 7.02 0h9.96zM7.17 2.1c-1.4 0-2.6.48-3.46 1.33c-.85.85-1.33 2.06-1.33 3.46v10.3c0 1.3.47 2.5 1.33 3.36c.86.85 2.06 1.33 3.46 1.33h9.66c1.4 0 2.6-.48 3.46-1.33c.85-.85 1.33-2.06 1.33-3.46V6.89c0-1.4-.47-2.6-1.33-3.46c-.86-.85-2.06-1.33-3.46-1.33H7.17zm11.97 3.33c.77 0 1.4.63 1.4 1.4c0 .77-.63 1.4-1.4 1.4c-.77 0-1.4-.63-1.4-1.4c0-.77.63-1.4 1.4-1.4zM12 5.76c3.39 0 6.14 2.75 6.14 6.14c0 3.39-2.75 6.14-6.14 6.14c-3.39 0-6.14-2.75-6.14-6.14c0-3.39 2.75-6.14 6.14-6.14zm0 2.1c-2.2 0-3.99 1.79-3.99 4.04c0 2.25 1.79 4.04 3.99 4.04c2.2 0 3.99-1.79 3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04c0-2.25-1.79-4.04-3.99-4.04z",
+    "x": "M18.901 1.153h3.68l-8.04 9.19L24 22.846h-7.406l-5.8-7.584l-6.638 7.584H.474l8.6-9.83L0 1.154h7.594l5.243 6.932ZM17.61 20.644h2.039L6.486 3.24H4.298Z",
+    "linkedin": "M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2a2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6zM2 9h4v12H2zM4 2a2 2 0 1 1-2 2a2 2 0 0 1 2-2z",
+    "youtube": "M23.498 6.186a3.016 3.016 0 0 0-2.122-2.136C19.505 3.545 12 3.545 12 3.545s-7.505 0-9.377.505A3.017 3.017 0 0 0 .502 6.186C0 8.07 0 12 0 12s0 3.93.502 5.814a3.016 3.016 0 0 0 2.122 2.136c1.871.505 9.376.505 9.376.505s7.505 0 9.377-.505a3.015 3.015 0 0 0 2.122-2.136C24 15.93 24 12 24 12s0-3.93-.502-5.814zM9.545 15.568V8.432L15.818 12l-6.273 3.568z",
+    "link": "M3.9 12c0-1.71 1.39-3.1 3.1-3.1h4V7H7c-2.76 0-5 2.24-5 5s2.24 5 5 5h4v-1.9H7c-1.71 0-3.1-1.39-3.1-3.1zM8 13h8v-2H8v2zm9-6h-4v1.9h4c1.71 0 3.1 1.39 3.1 3.1s-1.39 3.1-3.1 3.1h-4V17h4c2.76 0 5-2.24 5-5s-2.24-5-5-5z",
+    "whatsapp": "M12.04 2c-5.46 0-9.91 4.45-9.91 9.91c0 1.75.46 3.45 1.32 4.95L2.05 22l5.25-1.38c1.45.79 3.08 1.21 4.74 1.21c5.46 0 9.91-4.45 9.91-9.91c0-2.65-1.03-5.14-2.9-7.01A9.816 9.816 0 0 0 12.04 2m.01 1.67c2.2 0 4.26.86 5.82 2.42a8.225 8.225 0 0 1 2.41 5.83c0 4.54-3.7 8.23-8.24 8.23c-1.48 0-2.93-.39-4.19-1.15l-.3-.17l-3.12.82l.83-3.04l-.2-.32a8.188 8.188 0 0 1-1.26-4.38c.01-4.54 3.7-8.24 8.25-8.24m-3.53 3.16c-.13 0-.35.05-.54.26c-.19.2-.72.7-.72 1.72s.73 2.01.83 2.14c.1.13 1.44 2.19 3.48 3.07c.49.21.87.33 1.16.43c.49.16.94.13 1.29.08c.4-.06 1.21-.5 1.38-.98c.17-.48.17-.89.12-.98c-.05-.09-.18-.13-.37-.23c-.19-.1-.1.13-.1.13s-1.13-.56-1.32-.66c-.19-.1-.32-.15-.45.05c-.13.2-.51.65-.62.78c-.11.13-.23.15-.42.05c-.19-.1-.8-.3-1.53-.94c-.57-.5-1.02-1.12-1.21-1.45c-.11-.19-.01-.29.09-.38c.09-.08.19-.23.29-.34c.1-.11.13-.19.19-.32c.06-.13.03-.24-.01-.34c-.05-.1-.45-1.08-.62-1.48c-.16-.4-.36-.34-.51-.35c-.11-.01-.25-.01-.4-.01Z",
+}
+# Feature-line keywords and other names that map onto an icon.
+ICON_ALIASES = {
+    "logistics": "truck", "delivery": "truck", "shipping": "truck",
+    "secure": "shield", "security": "shield", "safe": "shield",
+    "build": "hammer", "builder": "hammer", "construction": "hammer", "repair": "hammer",
+    "plumb": "water", "plumbing": "water", "drop": "water",
+    "roof": "home", "roofing": "home", "house": "home",
+    "electric": "bolt", "electrical": "bolt", "power": "bolt", "fast": "bolt",
+    "data": "database", "stack": "layers", "money": "wallet", "price": "wallet", "grid": "table",
+    "fb": "facebook", "twitter": "x", "wa": "whatsapp", "copy": "link",
+}
+ICON_DEFAULT = "check"
+_ICON_LOOKUP = {**{name: name for name in ICONS}, **ICON_ALIASES}
+_ICON_WORD = re.compile(r'[a-z0-9]+')
+_ICON_STEM = 4  # shortest name or alias a longer word may start with ("plumber" -> plumb, "roofer" -> roof)
+_ICON_REF = re.compile(r'href="#i-([\w-]+)"')
+
+def _icon_word(word):
+    """Icon for one word: exact name or alias, then the singular, then the longest name or alias it starts with."""
+    if word in _ICON_LOOKUP: return _ICON_LOOKUP[word]
+    if word.endswith("s") and word[:-1] in _ICON_LOOKUP: return _ICON_LOOKUP[word[:-1]]
+    for n in range(len(word) - 1, _ICON_STEM - 1, -1):
+        if word[:n] in _ICON_LOOKUP: return _ICON_LOOKUP[word[:n]]
+    return None
+
+def icon_name(keyword):
+    """Registry name for a keyword: the first of its words that is an icon or alias, a plural of one or starts
+    with one, else the check mark."""
+    for word in _ICON_WORD.findall(keyword.lower()):
+        name = _icon_word(word)
+        if name: return name
+    return ICON_DEFAULT
+
+def icon(name, cls="", size=0):
+    """An icon drawn from the page's symbols; build_page points the reference at the sprite file or inlines the symbol."""
+    attrs = (f' class="{cls}"' if cls else "") + (f' width="{size}" height="{size}"' if size else "")
+    return f'<svg{attrs} fill="currentColor" aria-hidden="true"><use href="#i-{name}"></use></svg>'
+
+def gen_icon_symbols(names, attrs=""):
+    """<svg> holding one <symbol id="i-<name>"> per icon; the sprite file is all of ICONS."""
+    symbols = "".join(f'<symbol id="i-{n}" viewBox="0 0 24 24"><path d="{ICONS[n]}"/></symbol>' for n in names if n in ICONS)
+    return f'<svg xmlns="http://www.w3.org/2000/svg"{attrs}>{symbols}</svg>'
+
+@fragment
+def gen_features(cfg):
+    cards = ""
+    lines = [x for x in cfg.feat_data.split('\n') if x.strip()]
+    for line in lines:
+        if "|" in line:
+            parts = line.split('|')
+            if len(parts) >= 3:
+                icon_code = icon(icon_name(parts[0]), size=32)
+                title = parts[1].strip()
+                desc = parts[2].strip()
+                cards += f"""<div class="card reveal"><div style="color:var(--s); margin-bottom:1rem;">{icon_code}</div><h3 style="color:var(--p); font-size:1.2rem; text-transform:uppercase; letter-spacing:1px;">{title}</h3><div style="opacity:0.9; color:var(--txt); font-size:0.95rem;">{format_text(desc)}</div></div>"""
+            elif len(parts) == 2:
+                title = parts[0].strip()
+                desc = parts[1].strip()
+                cards += f"""<div class="card reveal"><h3 style="color:var(--s); font-size:1.2rem; text-transform:uppercase; letter-spacing:1px;">{title}</h3><div style="opacity:0.9; color:var(--txt); font-size:0.95rem;">{format_text(desc)}</div></div>"""
+    return f"""<section id="features"><div class="container"><div class="section-head reveal"><h2>{cfg.f_title}</h2></div><div class="grid-3">{cards}</div></div></section>"""
+
+@fragment
+def gen_stats(cfg):
+    return f"""
+    <div style="background:var(--p); color:white; padding:3rem 0; text-align:center;">
+        <div class="container grid-3">
+            <div class="reveal">
+                <h3 style="color:#ffffff; margin:0; font-size:3rem;">{cfg.stat_1}</h3>
+                <p style="color:rgba(255,255,255,0.8); margin:0;">{cfg.label_1}</p>
+            </div>
+            <div class="reveal">
+                <h3 style="color:#ffffff; margin:0; font-size:3rem;">{cfg.stat_2}</h3>
+                <p style="color:rgba(255,255,255,0.8); margin:0;">{cfg.label_2}</p>
+            </div>
+            <div class="reveal">
+                <h3 style="color:#ffffff; margin:0; font-size:3rem;">{cfg.stat_3}</h3>
+                <p style="color:rgba(255,255,255,0.8); margin:0;">{cfg.label_3}</p>
+            </div>
+        </div>
+    </div>
+    """
+
+@fragment
+def gen_pricing_table(cfg):
+    if not cfg.show_pricing: return ""
+    return f"""
+    <section id="pricing"><div class="container">
+        <div class="section-head reveal"><h2>The Cost of Ownership</h2><p>See how the "Monthly Trap" adds up over 5 years.</p></div>
+        <div class="pricing-wrapper reveal">
+            <table class="pricing-table">
+                <thead>
+                    <tr><th style="width:40%">Expense Category</th><th style="background:var(--s); font-size:1.2rem;">Titan Engine (Us)</th><th>{cfg.wix_name}</th><th>Standard Agency</th></tr>
+                </thead>
+                <tbody>
+                    <tr><td>Initial Setup Fee</td><td><strong>{cfg.titan_price}</strong> (One-time)</td><td>$0 (DIY)</td><td>$2,000+</td></tr>
+                    <tr><td>Annual Hosting Costs</td><td><strong>{cfg.titan_mo}</strong></td><td>{cfg.wix_mo} ($348/yr)</td><td>$600/yr</td></tr>
+                    <tr><td>SSL & Security</td><td>$0 (Included)</td><td>$0 (Included)</td><td>$100/yr</td></tr>
+                    <tr><td><strong>Your 5-Year Savings</strong></td><td style="color:var(--s); font-size:1.3rem;">You Save {cfg.save_val}</td><td>$0</td><td>$0</td></tr>
+                </tbody>
+            </table>
+        </div>
+        <p style="text-align:center; font-size:0.8rem; opacity:0.6; margin-top:1rem;">*Comparison pricing based on standard public rates. Titan Engine is not affiliated with competitor trademarks.</p>
+    </div></section>
+    """
+
+# --- SEARCH ---
+# The site search box reads a build-time inverted index (titan.search) through the "search" JS module.
+# Both sides tokenize alike: accents folded, lower case, runs of letters and digits, one-letter words and
+# stopwords dropped and, with stemming on, one common English suffix cut. Keep searchTokens() in step.
+SEARCH_DIR = "search/"
+SEARCH_DOCS_PER_SHARD = 500
+SEARCH_STOPWORDS = frozenset("a an and are as at be by for from in is it of on or the to with".split())
+STEM_SUFFIXES = ("ing", "ed", "ly", "s")  # the stem keeps at least 3 letters; "-ss" words keep their s
+_SEARCH_WORD = re.compile(r'[^\W_]+')
+
+def search_stem(token):
+    for suffix in STEM_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith("ss"):
+            return token[:-len(suffix)]
+    return token
+
+def search_tokens(text, stem=False):
+    """Index terms of a text, in order, repeats kept."""
+    folded = "".join(c for c in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.category(c).startswith("M"))
+    tokens = [t for t in _SEARCH_WORD.findall(folded) if len(t) > 1 and t not in SEARCH_STOPWORDS]
+    return [search_stem(t) for t in tokens] if stem else tokens
+
+def search_shard(term):
+    """Index shard of a term: its first two characters, anything but a-z and 0-9 spelled _<hex code>."""
+    return "".join(c if "a" <= c <= "z" or "0" <= c <= "9" else f"_{ord(c):x}" for c in term[:2])
+
+def search_enabled(cfg):
+    """Search needs rows at build time: the catalog or the blog in a prerendered or JSON mode."""
+    return cfg.site_search and (cfg.show_inventory and not cfg.inv_mode.startswith("Live") or cfg.show_blog and not cfg.blog_mode.startswith("Live"))
+
+# --- RUNTIME JS MODULES ---
+@profiled
+def gen_share_row(share_url, share_title, label, style=""):
+    style_attr = f' style="{style}"' if style else ""
+    return f"""<div class="share-row"{style_attr}>
+                <span class="share-label">{label}</span>
+                <a href="https://www.facebook.com/sharer/sharer.php?u={share_url}" target="_blank" class="share-btn bg-fb">{icon('facebook')}</a>
+                <a href="https://twitter.com/intent/tweet?url={share_url}&text={share_title}" target="_blank" class="share-btn bg-x">{icon('x')}</a>
+                <a href="https://www.linkedin.com/sharing/share-offsite/?url={share_url}" target="_blank" class="share-btn bg-li">{icon('linkedin')}</a>
+                <button onclick="navigator.clipboard.writeText(window.location.href);alert('Link Copied!')" class="share-btn bg-link" title="Copy Link">{icon('link')}</button>
+            </div>"""
+
+# Page generators never inline scripts. They drop a use_js() mark and read their
+# settings from data-* attributes, so the same module source serves every page.
+JS_MODULES = {
+    "core": r"""
+    // Reveal engine: each .reveal element is observed once and let go as soon as it activates.
+    // Cards injected later (Load More, live sheets) are picked up by the MutationObserver.
+    // With reduced motion, or without IntersectionObserver, everything is shown straight away.
+    const reducedMotion = () => window.matchMedia && matchMedia('(prefers-reduced-motion: reduce)').matches;
+    (() => {
+        const io = !reducedMotion() && 'IntersectionObserver' in window && new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (!entry.isIntersecting) return;
+                entry.target.classList.add('active');
+                io.unobserve(entry.target);
+            });
+        }, { rootMargin: '0px 0px -150px 0px' });
+        const watch = (el) => io ? io.observe(el) : el.classList.add('active');
+        const scan = (root) => {
+            if (root.matches && root.matches('.reveal:not(.active)')) watch(root);
+            root.querySelectorAll('.reveal:not(.active)').forEach(watch);
+        };
+        scan(document);
+        new MutationObserver((records) => records.forEach(r => r.addedNodes.forEach(node => {
+            if (node.nodeType === 1) scan(node);
+        }))).observe(document.body, { childList: true, subtree: true });
+    })();
+    """,
+    "carousel": r"""
+    (() => {
+        let slides = document.querySelectorAll('.carousel-slide');
+        if (slides.length < 2 || reducedMotion()) return;
+        let currentSlide = 0;
+        setInterval(() => {
+            slides[currentSlide].classList.remove('active');
+            currentSlide = (currentSlide + 1) % slides.length;
+            slides[currentSlide].classList.add('active');
+        }, 4000);
+    })();
+    """,
+    "csv": r"""
+    // RFC 4180 state machine. It keeps its state between push() calls, so quoted fields may span
+    // lines and chunk boundaries. Blank rows are dropped and cells trimmed, like the build-time reader.
+    function csvParser() {
+        let row = [], field = '', state = 0, skipLF = false, rows = [];
+        const endField = () => { row.push(field.trim()); field = ''; };
+        const endRow = () => { endField(); if (row.some(c => c)) rows.push(row); row = []; };
+        const take = () => { const out = rows; rows = []; return out; };
+        return {
+            push(text) {
+                for (let i = 0; i < text.length; i++) {
+                    const c = text[i];
+                    if (skipLF) { skipLF = false; if (c === '\n') continue; }
+                    if (state === 1) { if (c === '"') state = 2; else field += c; continue; }
+                    if (state === 2) { state = 0; if (c === '"') { field += '"'; state = 1; continue; } }
+                    if (c === '"') state = 1;
+                    else if (c === ',') endField();
+                    else if (c === '\n' || c === '\r') { endRow(); skipLF = c === '\r'; }
+                    else field += c;
+                }
+                return take();
+            },
+            end() { if (field || row.length) endRow(); return take(); },
+        };
+    }
+    function csvWorker() {
+        onmessage = async (e) => {
+            try {
+                const res = await fetch(e.data.url, e.data.init);
+                const reader = res.body.getReader();
+                const decoder = new TextDecoder();
+                const parser = csvParser();
+                for (;;) {
+                    const { done, value } = await reader.read();
+                    if (done) break;
+                    const rows = parser.push(decoder.decode(value, { stream: true }));
+                    if (rows.length) postMessage({ rows });
+                }
+                postMessage({ rows: parser.push(decoder.decode()).concat(parser.end()), done: true });
+            } catch (err) { postMessage({ error: String(err) }); }
+        };
+    }
+    // Streams a sheet through a Web Worker and hands over rows (header skipped) as each chunk is parsed.
+    // onRows may return true to stop reading early. Without workers or streams the same parser runs here.
+    // With revalidate the request bypasses freshness, so the browser sends a conditional request.
+    function streamCSV(url, onRows, revalidate) {
+        const init = revalidate ? { cache: 'no-cache' } : {};
+        return new Promise((resolve, reject) => {
+            let header = true, stopped = false, started = false, worker = null;
+            const emit = (rows) => {
+                if (stopped) return;
+                if (header && rows.length) { rows = rows.slice(1); header = false; }
+                if (rows.length && onRows(rows) === true) { stopped = true; if (worker) worker.terminate(); resolve(); }
+            };
+            const inline = () => fetch(url, init).then(r => r.text()).then(t => {
+                const parser = csvParser();
+                emit(parser.push(t)); emit(parser.end()); resolve();
+            }, reject);
+            if (!(window.Worker && window.ReadableStream && window.Blob && window.URL)) return inline();
+            try {
+                const src = `const csvParser = ${csvParser};\n(${csvWorker})();`;
+                worker = new Worker(URL.createObjectURL(new Blob([src], { type: 'text/javascript' })));
+            } catch (e) { return inline(); }
+            worker.onmessage = (e) => {
+                started = true;
+                if (e.data.error) { worker.terminate(); reject(new Error(e.data.error)); return; }
+                emit(e.data.rows);
+                if (e.data.done) { worker.terminate(); resolve(); }
+            };
+            // Before the first message the worker itself failed (e.g. blocked by CSP): parse here instead.
+            // Later on the stream is half read, so the load fails.
+            worker.onerror = (e) => {
+                worker.terminate();
+                if (!started) inline();
+                else if (!stopped) { stopped = true; reject(new Error(e.message || 'CSV worker failed')); }
+            };
+            worker.postMessage({ url: new URL(url, document.baseURI).href, init });
+        });
+    }
+    // Shown in place of the loading placeholder, or after the rows that did arrive, when a sheet fails.
+    function sheetFailed(box, err) {
+        console.log(err);
+        if (!box.querySelector('.card')) box.innerHTML = '';
+        box.insertAdjacentHTML('beforeend', '<p class="sheet-error" style="grid-column:1/-1; text-align:center; padding:3rem; opacity:0.7;">Could not load the latest data. Please refresh the page.</p>');
+    }
+    // Parsed sheets are kept in IndexedDB, so later pages render without waiting on the sheet.
+    const sheetStore = (() => {
+        let db = null;
+        const open = () => db || (db = new Promise((resolve) => {
+            try {
+                const req = indexedDB.open('titan-sheets', 1);
+                req.onupgradeneeded = () => req.result.createObjectStore('sheets');
+                req.onsuccess = () => resolve(req.result);
+                req.onerror = () => resolve(null);
+            } catch (e) { resolve(null); }
+        }));
+        const run = (mode, op) => open().then(d => d && new Promise((resolve) => {
+            try {
+                const req = op(d.transaction('sheets', mode).objectStore('sheets'));
+                req.onsuccess = () => resolve(req.result);
+                req.onerror = () => resolve(null);
+            } catch (e) { resolve(null); }
+        }));
+        return {
+            get: (url) => run('readonly', store => store.get(url)),
+            put: (url, rows) => run('readwrite', store => store.put({ rows, time: Date.now() }, url)),
+        };
+    })();
+    // Stale-while-revalidate over streamCSV: a cached copy renders at once and, once older than ttl
+    // seconds, is refreshed in the background for the next page. A miss streams as usual and keeps
+    // reading after onRows stops early, so the whole sheet gets cached. ttl 0 disables the cache.
+    function loadSheet(url, ttl, onRows) {
+        if (!ttl || !window.indexedDB) return streamCSV(url, onRows);
+        return sheetStore.get(url).then(hit => new Promise((resolve, reject) => {
+            const refresh = (background) => {
+                const all = [];
+                let live = !background;
+                streamCSV(url, rows => {
+                    for (const r of rows) all.push(r);
+                    if (live && onRows(rows) === true) { live = false; resolve(); }
+                }, background).then(() => {
+                    sheetStore.put(url, all);
+                    if (live) resolve();
+                }, (e) => { if (live) reject(e); });
+            };
+            if (!hit) return refresh(false);
+            onRows(hit.rows);
+            resolve();
+            if (Date.now() - hit.time > ttl * 1000) refresh(true);
+        }));
+    }
+    """,
+    "md": r"""
+    // Browser twin of format_text(): same grammar, same output (tests/markdown_golden.json).
+    const MD_ESC = { '&': '&amp;', '<': '&lt;', '>': '&gt;' };
+    const MD_ESCAPE = /&(?!(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+);)|[<>]/g;
+    const MD_BR = /&lt;br\s*\/?&gt;/gi, MD_TAG = /&lt;(b|strong|em|i)&gt;((?:(?!&lt;\1&gt;).)*?)&lt;\/\1&gt;/gi;
+    const mdTags = (text) => text.replace(MD_TAG, (m, tag, body) => `<${tag.toLowerCase()}>${mdTags(body)}</${tag.toLowerCase()}>`);
+    const MD_LINK = /&lt;a href="((?:https?:|mailto:|tel:)[^"\s]*|[^":\s\/?#]*(?:[\/?#][^"\s]*)?)"( target="_blank")?&gt;((?:(?!&lt;a ).)*?)&lt;\/a&gt;/gi;
+    function mdInline(line) {
+        const out = [];
+        let opened = {};
+        line.split(/(\*\*?)/).forEach((part, i) => {
+            if (i % 2 === 0) {
+                if (part) out.push(part.replace(MD_ESCAPE, c => MD_ESC[c]));
+                return;
+            }
+            const at = opened[part];
+            if (at === undefined) {
+                opened[part] = out.length;
+                out.push(part);
+                return;
+            }
+            const tag = part === '**' ? 'strong' : 'em';
+            out[at] = `<${tag}>`;
+            out.push(`</${tag}>`);
+            opened = Object.fromEntries(Object.entries(opened).filter(([, pos]) => pos < at));
+        });
+        return mdTags(out.join('').replace(MD_BR, '<br>')).replace(MD_LINK, (m, href, blank, body) => `<a href="${href}"${blank ? ' target="_blank" rel="noopener"' : ''}>${body}</a>`);
+    }
+    function mdBlock(line) {
+        const level = line.length - line.replace(/^#+/, '').length;
+        if (level >= 1 && level <= 3 && line[level] === ' ') return `<h${level + 1}>${mdInline(line.slice(level + 1).trim())}</h${level + 1}>`;
+        if (line.length > 4 && line.startsWith('**') && line.endsWith('**') && !line.slice(2, -2).includes('**')) return `<h3>${mdInline(line.slice(2, -2))}</h3>`;
+        return `<p>${mdInline(line)}</p>`;
+    }
+    function formatText(text) {
+        if (!text) return '';
+        const out = ['<div class="md">'];
+        let inList = false;
+        for (const raw of text.split('\n')) {
+            const line = raw.trim();
+            if (!line) continue;
+            const item = ['* ', '- '].includes(line.slice(0, 2));
+            if (item !== inList) {
+                out.push(item ? '<ul>' : '</ul>');
+                inList = item;
+            }
+            out.push(item ? `<li>${mdInline(line.slice(2).trim())}</li>` : mdBlock(line));
+        }
+        if (inList) out.push('</ul>');
+        out.push('</div>');
+        return out.join('');
+    }
+    """,
+    "img": r"""
+    // Browser twin of responsive_img() for CDN images in cards rendered from sheet data.
+    const IMG_WIDTHS = [480, 960, 1600, 2400];
+    const CDN_HOSTS = %s, CARD_SIZES = '%s', ABOUT_SIZES = '%s';
+    function isCdn(url) {
+        try { return CDN_HOSTS.includes(new URL(url).hostname); } catch (err) { return false; }
+    }
+    function cdnUrl(url, w) {
+        const u = new URL(url);
+        ['w', 'h', 'fit', 'auto'].forEach(k => u.searchParams.delete(k));
+        u.searchParams.set('w', w);
+        u.searchParams.set('auto', 'format');
+        return u.href;
+    }
+    function imgAttrs(url, sizes) {
+        if (!isCdn(url)) return `src="${url}"`;
+        return `src="${cdnUrl(url, 960)}" srcset="${IMG_WIDTHS.map(w => cdnUrl(url, w) + ' ' + w + 'w').join(', ')}" sizes="${sizes}"`;
+    }
+    """,
+    "share": r"""
+    function shareWA(url, title) { window.open('https://wa.me/?text=' + encodeURIComponent(title + ' ' + url), '_blank'); }
+    function shareRow(title, label, style) {
+        const shareUrl = encodeURIComponent(window.location.href);
+        const shareTitle = encodeURIComponent(title);
+        const icons = document.documentElement.dataset.icons || '';  // sprite file, or '' for inlined symbols
+        return `""" + gen_share_row("${shareUrl}", "${shareTitle}", "${label}", "${style || ''}") + r"""`.replace(/href="#i-/g, `href="${icons}#i-`);
+    }
+    """,
+    "pager": r"""
+    function loadMoreButton(box, onClick) {
+        const more = document.createElement('button');
+        more.type = 'button';
+        more.className = 'btn btn-primary';
+        more.textContent = 'Load More';
+        more.style.cssText = 'display:none; margin:3rem auto 0;';
+        more.addEventListener('click', onClick);
+        box.after(more);
+        return more;
+    }
+    // Live grids: cards are built from row data a chunk per frame, one insertion per chunk,
+    // and never past the current page, so unseen cards cost nothing and fetch no images.
+    function createPager(box, renderCard) {
+        const pageSize = parseInt(box.dataset.pageSize, 10) || 0;
+        const rows = [];
+        let shown = 0, target = pageSize || Infinity, queued = false, fresh = true;
+        const more = loadMoreButton(box, () => { target += pageSize; schedule(); });
+        function pump() {
+            queued = false;
+            const end = Math.min(rows.length, target, shown + 48);
+            if (end > shown) {
+                box.insertAdjacentHTML('beforeend', rows.slice(shown, end).map(renderCard).join(''));
+                shown = end;
+            }
+            if (shown < Math.min(rows.length, target)) schedule();
+            more.style.display = shown < rows.length && shown >= target ? 'block' : 'none';
+        }
+        function schedule() {
+            if (!queued) { queued = true; requestAnimationFrame(pump); }
+        }
+        // The placeholder stays until the first batch (or done()) so slow sheets never flash empty.
+        const clear = () => { if (fresh) { box.innerHTML = ''; fresh = false; } };
+        return { add(batch) { clear(); for (const row of batch) rows.push(row); schedule(); }, done: clear };
+    }
+    // Prerendered grids: cards past the first page ship hidden (data-more) and are shown a page at a time.
+    function pageStatic(box) {
+        const pageSize = parseInt(box.dataset.pageSize, 10) || 0;
+        if (!pageSize) return;
+        const more = loadMoreButton(box, () => {
+            const next = box.querySelectorAll('[data-more]');
+            for (let i = 0; i < Math.min(pageSize, next.length); i++) next[i].removeAttribute('data-more');
+            if (next.length <= pageSize) more.remove();
+        });
+        if (box.querySelector('[data-more]')) more.style.display = 'block';
+    }
+    document.querySelectorAll('[data-paged]').forEach(pageStatic);
+    """,
+    "search": r"""
+    // Site search over the build-time index in search/ (titan.search). Terms are sharded by their first
+    // two characters, so a query fetches one small shard per word; every word matches as a prefix.
+    const SEARCH_STOP = new Set(%s), STEM_SUFFIXES = %s;
+    function searchStem(t) {
+        for (const s of STEM_SUFFIXES) if (t.endsWith(s) && t.length - s.length >= 3 && !t.endsWith('ss')) return t.slice(0, -s.length);
+        return t;
+    }
+    // Same terms as search_tokens() in the engine.
+    function searchTokens(text, stem) {
+        const words = text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '').match(/[\p{L}\p{N}]+/gu) || [];
+        const tokens = words.filter(t => [...t].length > 1 && !SEARCH_STOP.has(t));
+        return stem ? tokens.map(searchStem) : tokens;
+    }
+    function searchShard(term) {
+        return [...term].slice(0, 2).map(c => /[a-z0-9]/.test(c) ? c : '_' + c.codePointAt(0).toString(16)).join('');
+    }
+    (() => {
+        const form = document.querySelector('.site-search');
+        if (!form) return;
+        const input = form.querySelector('input'), out = form.querySelector('.search-results');
+        const base = form.dataset.src, shards = {}, docs = {};
+        let meta = null, seq = 0, timer = 0;
+        const get = (path) => fetch(base + path + '?v=' + meta.v).then(r => r.ok ? r.json() : {}).catch(() => ({}));
+        // Posting lists are ascending doc ids as unsigned base64 VLQ gaps (encode_ids in titan.search).
+        const VLQ = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+        function ids(s) {
+            const out = [];
+            let id = 0, gap = 0, shift = 0;
+            for (const ch of s) {
+                const digit = VLQ.indexOf(ch);
+                gap += (digit & 31) * 2 ** shift;
+                shift += 5;
+                if (digit < 32) { out.push(id += gap); gap = shift = 0; }
+            }
+            return out;
+        }
+        // doc id -> 1 when the word is in the title, 0 when only in the description.
+        async function lookup(word) {
+            const key = searchShard(word);
+            const shard = await (shards[key] = shards[key] || get('t/' + key + '.json'));
+            const hits = new Map();
+            for (const term in shard) {
+                if (!term.startsWith(word)) continue;
+                const [title, body] = shard[term].split('|');
+                for (const id of ids(body)) if (!hits.has(id)) hits.set(id, 0);
+                for (const id of ids(title)) hits.set(id, 1);
+            }
+            return hits;
+        }
+        async function doc(id) {
+            const n = Math.floor(id / meta.per);
+            const block = await (docs[n] = docs[n] || get('d/' + n + '.json'));
+            return block[id - n * meta.per];
+        }
+        async function run() {
+            const mine = ++seq, words = searchTokens(input.value, meta.stem);
+            if (!words.length) { out.hidden = true; return; }
+            const sets = await Promise.all(words.map(lookup));
+            const ranked = [...sets[0].keys()].filter(id => sets.every(s => s.has(id)))
+                .map(id => [id, sets.reduce((n, s) => n + s.get(id), 0)])
+                .sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, meta.limit);
+            const found = (await Promise.all(ranked.map(([id]) => doc(id)))).filter(Boolean);
+            if (mine !== seq) return;
+            out.innerHTML = found.length ? found.map(([kind, slug, title, sub]) =>
+                `<a href="${meta.urls[kind].replace('{}', slug)}"><strong>${title}</strong><span>${sub}</span></a>`).join('')
+                : '<p>No results</p>';
+            out.hidden = false;
+        }
+        fetch(base + 'meta.json').then(r => r.ok ? r.json() : null).then(m => {
+            if (!m) return;
+            meta = m;
+            form.hidden = false;
+            input.addEventListener('input', () => { clearTimeout(timer); timer = setTimeout(run, 100); });
+            form.addEventListener('submit', e => { e.preventDefault(); run(); });
+            document.addEventListener('click', e => { if (!form.contains(e.target)) out.hidden = true; });
+        }).catch(() => {});
+    })();
+    """,
+    "inventory": r"""
+    (() => {
+        const box = document.getElementById('inv-grid');
+        if (!box || !box.dataset.format) return;
+        const d = box.dataset;
+        function invCard([name, price, desc, img, item]) {
+            const prodName = encodeURIComponent(name);
+            return `
+                    <div class="card reveal" style="color: var(--txt);">
+                        <img ${imgAttrs(img, CARD_SIZES)} class="prod-img" loading="lazy" alt="${name}" onerror="this.onerror=null;this.removeAttribute('srcset');this.src='${d.fallback}';">
+                        <div style="flex-grow:1; display:flex; flex-direction:column; justify-content:space-between;">
+                            <div>
+                                <h3 style="color:var(--p);">${name}</h3>
+                                <p style="font-weight:bold; color:var(--s); font-size:1.1rem;">${price}</p>
+                                <p style="font-size:0.9rem; opacity:0.9; margin-bottom:1rem; color:var(--txt);">${desc}</p>
+                            </div>
+                            <div style="display:grid; grid-template-columns:1fr 1fr; gap:0.5rem;">
+                                <a href="product.html?item=${encodeURIComponent(item)}" class="btn" style="background:#e2e8f0; color:#0f172a !important; padding:0.8rem; font-size:0.8rem;">View Details</a>
+                                <a href="https://wa.me/${d.wa}?text=I am interested in ${prodName}" target="_blank" class="btn-primary btn" style="padding:0.8rem; font-size:0.8rem;">WhatsApp</a>
+                            </div>
+                        </div>
+                    </div>`;
+        }
+        async function loadInv() {
+            try {
+                if (d.format === 'json') {
+                    const res = await fetch('data/inventory.index.json');
+                    const items = await res.json();
+                    box.innerHTML = '';
+                    createPager(box, invCard).add(items.map(p => [p.name, p.price, p.desc, p.img, p.slug]));
+                    return;
+                }
+                const pager = createPager(box, invCard);
+                await loadSheet(d.src, +d.ttl, rows => {
+                    const cards = [];
+                    for (const clean of rows) {
+                        let img = clean[3] && clean[3].length > 5 ? clean[3] : d.fallback;
+                        if(clean[6] && clean[6].length > 5) img = clean[6];
+                        if(clean.length > 1) cards.push([clean[0], clean[1], clean[2] ? clean[2].substring(0,60)+'...' : '', img, clean[0]]);
+                    }
+                    pager.add(cards);
+                });
+                pager.done();
+            } catch(e) { sheetFailed(box, e); }
+        }
+        loadInv();
+    })();
+    """,
+    "product": r"""
+    (() => {
+        const box = document.getElementById('product-detail');
+        if (!box || !box.dataset.format) return;
+        const d = box.dataset;
+        const isDemo = d.demo === 'true';
+        function renderProduct(clean) {
+            let img = clean[3] || d.fallback;
+            box.innerHTML = `
+                <img ${imgAttrs(img, ABOUT_SIZES)} fetchpriority="high" style="width:100%; border-radius:12px;">
+                <div>
+                    <h1 style="font-size:3rem; line-height:1.1;">${clean[0]}</h1>
+                    <p style="font-size:1.5rem; color:var(--s); font-weight:bold; margin-bottom:1.5rem;">${clean[1]}</p>
+                    <p>${clean[2]}</p>
+                    <button onclick="shareWA(window.location.href, '${clean[0]}')" class="btn btn-primary" style="width:100%; margin-top:2rem;">Share on WhatsApp</button>
+                    ${shareRow(clean[0], 'Share This:')}
+                </div>
+            `;
+        }
+        async function loadProduct() {
+            const params = new URLSearchParams(window.location.search);
+            let targetName = params.get('item');
+            if(isDemo && !targetName) targetName = "Demo Item";
+            try {
+                if (d.format === 'json') {
+                    const res = await fetch('data/products/' + encodeURIComponent(targetName) + '.json');
+                    if(res.ok) { const p = await res.json(); renderProduct([p.name, p.price, p.desc, p.img]); }
+                    return;
+                }
+                await loadSheet(d.src, +d.ttl, rows => {
+                    for (const clean of rows) {
+                        if(isDemo) targetName = clean[0];
+                        if(clean[0] === targetName) { renderProduct(clean); return true; }
+                    }
+                });
+            } catch(e) { sheetFailed(box, e); }
+        }
+        loadProduct();
+    })();
+    """,
+    "blog": r"""
+    (() => {
+        const box = document.getElementById('blog-grid');
+        if (!box || !box.dataset.format) return;
+        const d = box.dataset;
+        function blogCard(r) {
+            return `
+                <div class="card reveal">
+                    <img ${imgAttrs(r[5] || d.fallback, CARD_SIZES)} class="prod-img" loading="lazy" alt="${r[1]}">
+                    <div>
+                        <span class="blog-badge">${r[3]}</span>
+                        <span style="float:right; font-size:0.8rem; opacity:0.7;">${r[2]}</span>
+                        <h3 style="margin-top:0.5rem; color:var(--p);"><a href="post.html?id=${r[0]}" style="text-decoration:none; color:inherit;">${r[1]}</a></h3>
+                        <p style="font-size:0.95rem; opacity:0.8;">${r[4]}</p>
+                        <a href="post.html?id=${r[0]}" style="color:var(--s); font-weight:bold; text-decoration:none;">Read Article &rarr;</a>
+                    </div>
+                </div>`;
+        }
+        async function loadBlog() {
+            try {
+                if (d.format === 'json') {
+                    const res = await fetch('data/blog.index.json');
+                    const posts = await res.json();
+                    box.innerHTML = '';
+                    createPager(box, blogCard).add(posts.map(p => [p.slug, p.title, p.date, p.category, p.summary, p.img]));
+                    return;
+                }
+                const pager = createPager(box, blogCard);
+                await loadSheet(d.src, +d.ttl, rows => { pager.add(rows.filter(r => r.length > 4)); });
+                pager.done();
+            } catch(e) { sheetFailed(box, e); }
+        }
+        loadBlog();
+    })();
+    """,
+    "post": r"""
+    (() => {
+        const container = document.getElementById('post-container');
+        if (!container || !container.dataset.format) return;
+        const d = container.dataset;
+        function renderPost(r, contentHtml) {
+            document.title = r[1] + " | " + d.site;
+            container.innerHTML = `
+                <div style="background:var(--p); padding:6rem 0 4rem 0; color:white; text-align:center;">
+                    <div class="container">
+                        <span class="blog-badge" style="background:rgba(255,255,255,0.2); margin-bottom:1rem; display:inline-block;">${r[3]}</span>
+                        <h1 style="font-size:clamp(2rem, 5vw, 3.5rem); margin-bottom:1rem; color:white;">${r[1]}</h1>
+                        <p style="opacity:0.8;">Published on ${r[2]}</p>
+                    </div>
+                </div>
+                <div class="container" style="max-width:800px; padding:4rem 1rem;">
+                    <img ${imgAttrs(r[5], '(max-width: 800px) 100vw, 800px')} style="width:100%; border-radius:12px; margin-bottom:3rem; box-shadow:0 10px 30px rgba(0,0,0,0.1);">
+                    <div class="article-content" style="line-height:1.8; color:var(--txt);">
+                        ${contentHtml}
+                    </div>
+                    ${shareRow(r[1], 'Share Article:', 'margin-top:3rem; border-top:1px solid #eee; padding-top:2rem;')}
+                    <hr style="margin:2rem 0; border:0; border-top:1px solid #eee;">
+                    <a href="blog.html" class="btn btn-primary">&larr; Back to Blog</a>
+                </div>
+            `;
+        }
+        function postNotFound() {
+            container.innerHTML = '<div class="container" style="text-align:center; padding:5rem;"><h2>Article Not Found</h2><a href="blog.html" class="btn btn-primary">Back</a></div>';
+        }
+        async function loadPost() {
+            const params = new URLSearchParams(window.location.search);
+            const slug = params.get('id');
+            if(!slug) { window.location.href = 'blog.html'; return; }
+            try {
+                if (d.format === 'json') {
+                    const res = await fetch('data/posts/' + encodeURIComponent(slug) + '.json');
+                    if(res.ok) {
+                        const p = await res.json();
+                        renderPost([p.slug, p.title, p.date, p.category, p.summary, p.img], p.html);
+                    } else {
+                        postNotFound();
+                    }
+                    return;
+                }
+                let found = false;
+                await loadSheet(d.src, +d.ttl, rows => {
+                    const r = rows.find(r => r[0] === slug);
+                    if(r) {
+                        found = true;
+                        renderPost(r, formatText(r[6]));
+                        return true;
+                    }
+                });
+                if(!found) postNotFound();
+            } catch(e) { sheetFailed(container, e); }
+        }
+        loadPost();
+    })();
+    """,
+}
+JS_MODULES["img"] %= (json.dumps(list(CDN_HOSTS)), CARD_SIZES, ABOUT_SIZES)
+JS_MODULES["search"] %= (json.dumps(sorted(SEARCH_STOPWORDS)), json.dumps(STEM_SUFFIXES))
+JS_DEPS = {"inventory": ("csv", "img", "pager"), "product": ("csv", "img", "share"), "blog": ("csv", "img", "pager"), "post": ("csv", "img", "md", "share")}
+APP_MODULES = ("core", "csv", "img", "md", "share", "carousel", "pager", "search")
+
+def asset_name(stem, text, ext):
+    """Content-hashed file name, so browsers can cache the asset forever."""
+    return f"{stem}.{hashlib.blake2b(text.encode(), digest_size=5).hexdigest()}.{ext}"
+
+ICON_SPRITE = gen_icon_symbols(ICONS)
+ICON_FILE = asset_name("icons", ICON_SPRITE, "svg")
+
+APP_JS = "".join(JS_MODULES[name] for name in APP_MODULES)
+# Exported JS files keyed by module: the shared app bundle plus one small entry file per page type.
+JS_FILES = {"app": (asset_name("app", APP_JS, "js"), APP_JS)}
+JS_FILES.update((name, (asset_name(f"js/{name}", src, "js"), src)) for name, src in JS_MODULES.items() if name not in APP_MODULES)
+
+_JS_MARK = re.compile(r'<!--titan:js (\w+)-->')
+
+def use_js(name):
+    """Marks the page as needing a runtime module; build_page turns the marks into script tags."""
+    return f"<!--titan:js {name}-->"
+
+def page_modules(markup):
+    """Runtime modules a page uses, dependencies first. The reveal core is always on."""
+    names = ["core"]
+    for name in _JS_MARK.findall(markup):
+        for dep in JS_DEPS.get(name, ()) + (name,):
+            if dep not in names: names.append(dep)
+    return names
+
+@profiled
+def gen_inventory(cfg, inv_rows=None, json_data=False):
+    if not cfg.show_inventory: return ""
+    if inv_rows is not None:
+        size = cfg.inv_page_size
+        grid = "".join(gen_inventory_card(cfg, row, slug, more=0 < size <= i) for i, (slug, row) in enumerate(inv_rows))
+        paged = 0 < size < len(inv_rows)
+        return f"""
+    <section id="inventory" style="background:rgba(0,0,0,0.02)"><div class="container">
+        <div class="section-head reveal"><h2>Portfolio / Templates</h2><p>Choose a foundation. We customize it for you.</p></div>
+        <div id="inv-grid" class="grid-3"{f' data-paged data-page-size="{size}"' if paged else ''}>{grid}</div>
+    </div></section>
+    {use_js('pager') if paged else ''}
+    """
+    e = html.escape
+    return f"""
+    <section id="inventory" style="background:rgba(0,0,0,0.02)"><div class="container">
+        <div class="section-head reveal"><h2>Portfolio / Templates</h2><p>Choose a foundation. We customize it for you.</p></div>
+        <div id="inv-grid" class="grid-3" data-format="{'json' if json_data else 'csv'}" data-src="{e(cfg.sheet_url)}" data-fallback="{e(image_url(cfg, cfg.custom_feat, 960))}" data-wa="{e(cfg.wa_num)}" data-page-size="{cfg.inv_page_size}" data-ttl="{cfg.sheet_cache_ttl * 60}"><div style="grid-column:1/-1; text-align:center; padding:4rem; color:var(--s);">Loading Database...</div></div>
+    </div></section>
+    {use_js('inventory')}
+    """
+
+# --- BUILD-TIME CATALOG (PRERENDER) ---
+def load_csv_rows(source):
+    """Reads a sheet CSV once at build time from a URL, local path or uploaded file."""
+    if not source: return []
+    if hasattr(source, "getvalue"):
+        raw = source.getvalue()
+    elif source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source, timeout=30) as res:
+            raw = res.read()
+    else:
+        with open(source, "rb") as f:
+            raw = f.read()
+    reader = csv.reader(io.StringIO(raw.decode("utf-8-sig")))
+    next(reader, None)
+    return [[c.strip() for c in row] for row in reader if any(c.strip() for c in row)]
+
+def slugify(text):
+    slug = re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return slug or "item"
+
+def assign_slugs(rows, col=0):
+    """Pairs each row with a unique slug taken from one of its columns."""
+    seen = {}
+    out = []
+    for row in rows:
+        base = slugify(row[col] if len(row) > col else "")
+        seen[base] = seen.get(base, 0) + 1
+        out.append((base if seen[base] == 1 else f"{base}-{seen[base]}", row))
+    return out
+
+def inventory_fields(cfg, row):
+    name, price, desc = (row + ["", "", ""])[:3]
+    img = row[3] if len(row) > 3 and len(row[3]) > 5 else cfg.custom_feat
+    if len(row) > 6 and len(row[6]) > 5: img = row[6]
+    return name, price, desc, img
+
+def compile_inventory_json(cfg, inv_rows):
+    """Splits the catalog into a card-only index shard and one detail shard per slug."""
+    index, details = [], {}
+    for slug, row in inv_rows:
+        name, price, desc, img = inventory_fields(cfg, row)
+        img = image_url(cfg, img, 960)
+        index.append({"slug": slug, "name": name, "price": price, "desc": desc[:60] + '...' if desc else '', "img": img})
+        details[slug] = {"slug": slug, "name": name, "price": price, "desc": desc, "img": img}
+    return index, details
+
+def to_json(data):
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+@profiled
+def gen_inventory_card(cfg, row, slug, more=False):
+    name, price, desc, img = inventory_fields(cfg, row)
+    e = html.escape
+    short = e(desc[:60] + '...') if desc else ''
+    fallback = img_fallback(cfg)
+    wa_text = urllib.parse.quote(f"I am interested in {name}")
+    return f"""
+                    <div class="card reveal"{' data-more' if more else ''} style="color: var(--txt);">
+                        {responsive_img(cfg, img, name, CARD_SIZES, "prod-img", extra=fallback)}
+                        <div style="flex-grow:1; display:flex; flex-direction:column; justify-content:space-between;">
+                            <div>
+                                <h3 style="color:var(--p);">{e(name)}</h3>
+                                <p style="font-weight:bold; color:var(--s); font-size:1.1rem;">{e(price)}</p>
+                                <p style="font-size:0.9rem; opacity:0.9; margin-bottom:1rem; color:var(--txt);">{short}</p>
+                            </div>
+                            <div style="display:grid; grid-template-columns:1fr 1fr; gap:0.5rem;">
+                                <a href="products/{slug}.html" class="btn" style="background:#e2e8f0; color:#0f172a !important; padding:0.8rem; font-size:0.8rem;">View Details</a>
+                                <a href="https://wa.me/{cfg.wa_num}?text={wa_text}" target="_blank" class="btn-primary btn" style="padding:0.8rem; font-size:0.8rem;">WhatsApp</a>
+                            </div>
+                        </div>
+                    </div>"""
+
+@profiled
+def gen_product_static_content(cfg, row, slug):
+    name, price, desc, img = inventory_fields(cfg, row)
+    e = html.escape
+    page_url = f"{cfg.prod_url}/products/{slug}.html"
+    share_url = urllib.parse.quote(page_url, safe="")
+    share_title = urllib.parse.quote(name, safe="")
+    wa_share = urllib.parse.quote(f"{name} {page_url}", safe="")
+    fallback = img_fallback(cfg)
+    return f"""
+    <section style="padding-top:150px;"><div class="container"><div id="product-detail" class="detail-view">
+        {responsive_img(cfg, img, name, ABOUT_SIZES, style="width:100%; height:auto; border-radius:12px;", extra=fallback, eager=True)}
+        <div>
+            <h1 style="font-size:3rem; line-height:1.1;">{e(name)}</h1>
+            <p style="font-size:1.5rem; color:var(--s); font-weight:bold; margin-bottom:1.5rem;">{e(price)}</p>
+            <p>{e(desc)}</p>
+            <a href="https://wa.me/?text={wa_share}" target="_blank" class="btn btn-primary" style="width:100%; margin-top:2rem;">Share on WhatsApp</a>
+
+            {gen_share_row(share_url, share_title, 'Share This:')}
+        </div>
+    </div></div></section>
+    """
+
+@fragment
+def gen_about_section(cfg):
+    formatted_about = format_text(cfg.about_short)
+    return f"""
+    <section id="about"><div class="container">
+        <div class="about-grid">
+            <div class="reveal">
+                <h2 style="font-size:2.5rem; margin-bottom:1.5rem;">{cfg.about_h}</h2>
+                <div style="font-size:1.1rem; opacity:0.9; margin-bottom:2rem; color:var(--txt);">{formatted_about}</div>
+                <a href="about.html" class="btn btn-primary" style="padding: 0.8rem 2rem; font-size:0.9rem;">Read Our Full Story</a>
+            </div>
+            {responsive_img(cfg, cfg.about_img, f"About {cfg.biz_name}", ABOUT_SIZES, "reveal", "width:100%; height:auto; border-radius:var(--radius); box-shadow:0 20px 50px -20px rgba(0,0,0,0.2); aspect-ratio:4/3; object-fit:cover;", aspect=0.75)}
+        </div>
+    </div></section>
+    """
+
+@fragment
+def gen_faq_section(cfg):
+    items = ""
+    for line in cfg.faq_data.split('\n'):
+        if "?" in line and not line.strip() == "":
+            parts = line.split('?', 1)
+            if len(parts) == 2:
+                q = parts[0].strip() + "?"
+                a = parts[1].replace("?", "").strip()
+                items += f"<details class='reveal'><summary>{q}</summary><p>{a}</p></details>"
+    return f"""<section id="faq" style="background:rgba(0,0,0,0.02)"><div class="container" style="max-width:800px;"><div class="section-head reveal"><h2>Frequently Asked Questions</h2></div>{items}</div></section>"""
+
+@fragment
+def gen_footer(cfg):
+    icons = ""
+    if cfg.fb_link: icons += f'<a href="{cfg.fb_link}" target="_blank" aria-label="Facebook">{icon("facebook", "social-icon")}</a>'
+    if cfg.ig_link: icons += f'<a href="{cfg.ig_link}" target="_blank" aria-label="Instagram">{icon("instagram", "social-icon")}</a>'
+    if cfg.x_link: icons += f'<a href="{cfg.x_link}" target="_blank" aria-label="X (Twitter)">{icon("x", "social-icon")}</a>'
+    if cfg.li_link: icons += f'<a href="{cfg.li_link}" target="_blank" aria-label="LinkedIn">{icon("linkedin", "social-icon")}</a>'
+    if cfg.yt_link: icons += f'<a href="{cfg.yt_link}" target="_blank" aria-label="YouTube">{icon("youtube", "social-icon")}</a>'
+
+    return f"""
+    <footer><div class="container">
+        <div class="footer-grid">
+            <div>
+                <h3 style="color:white; margin-bottom:1.5rem;">{cfg.biz_name}</h3>
+                <p style="opacity:0.8; font-size:0.9rem;">{cfg.biz_addr}</p>
+                <p style="opacity:0.8; font-size:0.9rem; margin-top:1rem;">{cfg.biz_email}</p>
+                <p style="opacity:0.6; font-size:0.8rem; margin-top:1rem;">Serving: {cfg.seo_area}</p>
+                <div style="margin-top:1.5rem; display:flex; gap:1.2rem; align-items:center;">
+                    {icons}
+                </div>
+            </div>
+            <div>
+                <h4 style="color:white; font-size:0.9rem; text-transform:uppercase; letter-spacing:1px; margin-bottom:1.5rem;">Explore</h4>
+                <a href="index.html">Home</a>
+                <a href="blog.html">Blog</a>
+                <a href="about.html">About Us</a>
+                <a href="contact.html">Contact</a>
+            </div>
+            <div>
+                <h4 style="color:white; font-size:0.9rem; text-transform:uppercase; letter-spacing:1px; margin-bottom:1.5rem;">Legal</h4>
+                <a href="privacy.html">Privacy Policy</a>
+                <a href="terms.html">Terms of Service</a>
+            </div>
+        </div>
+        <div style="border-top:1px solid rgba(255,255,255,0.1); margin-top:3rem; padding-top:2rem; text-align:center; opacity:0.4; font-size:0.8rem;">
+            &copy; <a href="https://www.kaydiemscriptlab.com/" target="_blank" style="display:inline; color:white;">Kaydiem Script Lab</a>. Powered by Titan Engine.
+        </div>
+    </div></footer>
+    """
+
+@fragment
+def gen_wa_widget(cfg):
+    if not cfg.wa_num: return ""
+    return f"""<a href="https://wa.me/{cfg.wa_num}" class="wa-float" target="_blank" aria-label="Chat on WhatsApp" style="position:fixed; bottom:30px; right:30px; background:#25d366; color:white; width:60px; height:60px; border-radius:50%; display:flex; align-items:center; justify-content:center; box-shadow:0 10px 30px rgba(37,211,102,0.4); z-index:9999;">{icon("whatsapp", size=32)}</a>"""
+
+@profiled
+def build_page(cfg, title, content, extra_js="", base_href="", css_href="", purge=False, bundle_js=False, sw_url="", fonts=(), icon_href=""):
+    """Full HTML document.
+
+    With css_href the theme is linked instead of inlined; purge trims inline CSS to this page.
+    With bundle_js the page loads the deferred app bundle and its entry files instead of inline modules.
+    With sw_url the page registers that service worker once loaded.
+    fonts are self-hosted FontFaces; a linked stylesheet must already carry their @font-face rules.
+    With icon_href icons reference that sprite file; otherwise the symbols the page and its modules use are inlined once.
+    """
+    meta_tags = f'<meta name="description" content="{cfg.seo_d}">'
+    if base_href: meta_tags += f'\n<base href="{base_href}">'
+    if cfg.gsc_tag: meta_tags += f'\n<meta name="google-site-verification" content="{cfg.gsc_tag}">'
+    if cfg.og_image: meta_tags += f'\n<meta property="og:image" content="{cfg.og_image}">'
+    
+    analytics = ""
+    if cfg.ga_tag:
+        analytics = f"""<script async src="https://www.googletagmanager.com/gtag/js?id={cfg.ga_tag}"></script>
+        <script>window.dataLayer=window.dataLayer||[];function gtag(){{dataLayer.push(arguments);}}gtag('js',new Date());gtag('config','{cfg.ga_tag}');</script>"""
+
+    body = f"""
+        {gen_nav(cfg)}
+        {content}
+        {gen_footer(cfg)}
+        {gen_wa_widget(cfg)}
+    """
+    modules = page_modules(body)
+    body = _JS_MARK.sub("", body)
+    if icon_href:
+        body = body.replace('href="#i-', f'href="{icon_href}#i-')
+    else:
+        used = dict.fromkeys(_ICON_REF.findall(body + "".join(JS_MODULES[name] for name in modules)))
+        if used: body = gen_icon_symbols(used, ' style="display:none"') + body
+    if bundle_js:
+        srcs = [JS_FILES["app"][0]] + [JS_FILES[name][0] for name in modules if name not in APP_MODULES]
+        body += "".join(f'<script defer src="{src}"></script>' for src in srcs)
+    else:
+        body += "".join(f"<script>{JS_MODULES[name]}</script>" for name in modules)
+    if sw_url:
+        body += f"<script>if('serviceWorker' in navigator) window.addEventListener('load', () => navigator.serviceWorker.register('{sw_url}'));</script>"
+    body += extra_js
+    if css_href:
+        stylesheet = f'<link rel="stylesheet" href="{css_href}">'
+    else:
+        css = font_face_css(fonts) + get_theme_css(cfg)
+        if purge: css = purge_css(css, body + "".join(JS_MODULES[name] for name in modules))
+        stylesheet = f"<style>{css}</style>"
+
+    return f"""
+    <!DOCTYPE html>
+    <html lang="en"{f' data-icons="{icon_href}"' if icon_href else ""}>
+    <head>
+        <meta charset="UTF-8"><meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>{title} | {cfg.biz_name}</title>
+        {meta_tags}
+        {gen_schema(cfg)}
+        {gen_font_links(cfg, fonts)}
+        {stylesheet}
+        {analytics}
+    </head>
+    <body>{body}</body>
+    </html>
+    """
+
+# --- FONTS ---
+# Weights requested per font field; headings (h1-h4) render at the browser's default bold.
+FONT_WEIGHTS = {"h_font": (400, 700, 900), "b_font": (300, 400, 600)}
+HEADING_WEIGHT = 700
+FONTSHARE_FAMILIES = ("Clash Display", "Satoshi")  # not on Google Fonts
+
+@dataclass(frozen=True)
+class FontFace:
+    """A self-hosted font file in the export."""
+    family: str
+    weight: str  # "700", or "100 900" for a variable font
+    path: str
+
+    @property
+    def format(self):
+        return self.path.rsplit(".", 1)[-1]
+
+    def covers(self, weight):
+        lo, hi = (self.weight.split() * 2)[:2]
+        return int(lo) <= weight <= int(hi)
+
+def font_face_css(faces):
+    return "".join(f"@font-face {{ font-family: '{f.family}'; font-style: normal; font-weight: {f.weight}; font-display: swap; src: url({f.path}) format('{f.format}'); }}\n" for f in faces)
+
+@profiled
+def gen_font_links(cfg, faces=()):
+    """Preload for the self-hosted heading face, remote stylesheets for families the export does not carry."""
+    hosted = {f.family for f in faces}
+    links = ""
+    heading = next((f for f in faces if f.family == cfg.h_font and f.covers(HEADING_WEIGHT)), None)
+    if heading:
+        links += f'<link rel="preload" href="{heading.path}" as="font" type="font/{heading.format}" crossorigin>'
+    remote = [(getattr(cfg, field), weights) for field, weights in FONT_WEIGHTS.items() if getattr(cfg, field) not in hosted]
+    google = [f"family={fam.replace(' ', '+')}:wght@{';'.join(map(str, w))}" for fam, w in remote if fam not in FONTSHARE_FAMILIES]
+    fontshare = [f"f[]={slugify(fam)}@{','.join(map(str, w))}" for fam, w in remote if fam in FONTSHARE_FAMILIES]
+    if google:
+        links += f'<link href="https://fonts.googleapis.com/css2?{"&".join(google)}&display=swap" rel="stylesheet">'
+    if fontshare:
+        links += f'<link href="https://api.fontshare.com/v2/css?{"&".join(fontshare)}&display=swap" rel="stylesheet">'
+    return links
+
+# --- SERVICE WORKER ---
+def is_shell_file(name):
+    """Files the service worker precaches: top-level pages plus the stylesheet, icon sprite and JS bundle."""
+    return name.endswith((".html", ".css", ".js", ".svg")) and name != "sw.js" and ("/" not in name or name.startswith("js/"))
+
+@profiled
+def gen_service_worker(version, precache):
+    """sw.js for the exported site. The shell cache is named after the build's content hash,
+    so a new build installs a fresh shell and activation deletes the old one."""
+    return f"""const SHELL = 'titan-shell-{version}';
+const PRECACHE = {json.dumps(sorted(precache))};
+
+self.addEventListener('install', (e) => {{
+    e.waitUntil(caches.open(SHELL).then(c => c.addAll(PRECACHE)).then(() => self.skipWaiting()));
+}});
+self.addEventListener('activate', (e) => {{
+    e.waitUntil(caches.keys()
+        .then(keys => Promise.all(keys.filter(k => k.startsWith('titan-shell-') && k !== SHELL).map(k => caches.delete(k))))
+        .then(() => self.clients.claim()));
+}});
+
+// Pages and sheet data: network first, cached copy when offline.
+async function networkFirst(req, cacheName, fallback) {{
+    const cache = await caches.open(cacheName);
+    try {{
+        const res = await fetch(req);
+        if (res.ok) cache.put(req, res.clone());
+        return res;
+    }} catch (err) {{
+        const hit = await cache.match(req) || await caches.match(req, {{ ignoreSearch: req.mode === 'navigate' }});
+        return hit || (fallback && await caches.match(fallback)) || Response.error();
+    }}
+}}
+// Hashed assets, images and fonts: cache first. Runtime caches keep the newest `limit` entries.
+async function cacheFirst(req, cacheName, limit) {{
+    const hit = await caches.match(req);
+    if (hit) return hit;
+    const res = await fetch(req);
+    if (res.ok || res.type === 'opaque') {{
+        const cache = await caches.open(cacheName);
+        await cache.put(req, res.clone());
+        if (limit) cache.keys().then(keys => keys.slice(0, Math.max(0, keys.length - limit)).forEach(k => cache.delete(k)));
+    }}
+    return res;
+}}
+
+self.addEventListener('fetch', (e) => {{
+    const req = e.request;
+    if (req.method !== 'GET') return;
+    const url = new URL(req.url);
+    if (req.mode === 'navigate') e.respondWith(networkFirst(req, SHELL, '404.html'));
+    else if (req.destination === 'image') e.respondWith(cacheFirst(req, 'titan-images', 120));
+    else if (req.destination === 'font' || ['fonts.googleapis.com', 'api.fontshare.com'].includes(url.hostname)) e.respondWith(cacheFirst(req, 'titan-fonts', 30));
+    else if (/\\.(csv|json)$/.test(url.pathname) || url.searchParams.get('output') === 'csv') e.respondWith(networkFirst(req, 'titan-data'));
+    else if (url.origin === self.location.origin) e.respondWith(cacheFirst(req, SHELL));
+}});
+"""
+
+# --- SITEMAP ---
+SITEMAP_MAX_URLS = 50000            # per file, protocol limit
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024  # per file, uncompressed
+_SITEMAP_NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+@profiled
+def gen_sitemaps(base_url, urls, max_urls=SITEMAP_MAX_URLS, max_bytes=SITEMAP_MAX_BYTES):
+    """Sitemap files for (path, lastmod) pairs as {file name: xml}.
+
+    Small sites get a single sitemap.xml. Past either limit the URLs are split into
+    sitemap-1.xml, sitemap-2.xml, ... and sitemap.xml becomes their index, so robots.txt never changes.
+    """
+    head, tail = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset {_SITEMAP_NS}>\n', "</urlset>\n"
+    parts, entries, size = [], [], len(head) + len(tail)
+    for path, lastmod in urls:
+        entry = f"<url><loc>{html.escape(f'{base_url}/{path}')}</loc><lastmod>{lastmod}</lastmod></url>\n"
+        if entries and (len(entries) >= max_urls or size + len(entry.encode()) > max_bytes):
+            parts.append(entries)
+            entries, size = [], len(head) + len(tail)
+        entries.append((entry, lastmod))
+        size += len(entry.encode())
+    parts.append(entries)
+    if len(parts) == 1:
+        return {"sitemap.xml": head + "".join(entry for entry, _ in entries) + tail}
+    files = {f"sitemap-{i}.xml": head + "".join(entry for entry, _ in part) + tail for i, part in enumerate(parts, 1)}
+    index = "".join(f"<sitemap><loc>{html.escape(f'{base_url}/sitemap-{i}.xml')}</loc><lastmod>{max(m for _, m in part)}</lastmod></sitemap>\n" for i, part in enumerate(parts, 1))
+    files["sitemap.xml"] = f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex {_SITEMAP_NS}>\n{index}</sitemapindex>\n'
+    return files
+
+# --- 404 & PRODUCTS ---
+@profiled
+def gen_404_content():
+    return f"""<section class="hero" style="min-height:70vh;"><div class="container"><h1 style="font-size:6rem; margin:0;">404</h1><p>Page Not Found</p><br><a href="index.html" class="btn btn-accent">Return Home</a></div></section>"""
+
+# --- MODIFIED: gen_product_page_content with Social Shares ---
+@fragment
+def gen_product_page_content(cfg, is_demo=False, json_data=False):
+    e = html.escape
+    return f"""
+    <section style="padding-top:150px;"><div class="container"><div id="product-detail" class="detail-view" data-format="{'json' if json_data else 'csv'}" data-src="{e(cfg.sheet_url)}" data-fallback="{e(image_url(cfg, cfg.custom_feat, 960))}" data-demo="{'true' if is_demo else 'false'}" data-ttl="{cfg.sheet_cache_ttl * 60}">
+        <div style="background:#eee; height:400px; border-radius:12px;"></div><div>Loading...</div>
+    </div></div></section>
+    {use_js('product')}
+    """
+
+# --- BLOG GENERATION LOGIC ---
+@profiled
+def gen_blog_card(cfg, row, slug, more=False):
+    r = [html.escape(c) for c in (row + [""] * 7)[:7]]
+    return f"""
+                    <div class="card reveal"{' data-more' if more else ''}>
+                        {responsive_img(cfg, row[5] if len(row) > 5 and row[5] else cfg.hero_img_1, row[1] if len(row) > 1 else "", CARD_SIZES, "prod-img")}
+                        <div>
+                            <span class="blog-badge">{r[3]}</span>
+                            <span style="float:right; font-size:0.8rem; opacity:0.7;">{r[2]}</span>
+                            <h3 style="margin-top:0.5rem; color:var(--p);"><a href="blog/{slug}.html" style="text-decoration:none; color:inherit;">{r[1]}</a></h3>
+                            <p style="font-size:0.95rem; opacity:0.8;">{r[4]}</p>
+                            <a href="blog/{slug}.html" style="color:var(--s); font-weight:bold; text-decoration:none;">Read Article &rarr;</a>
+                        </div>
+                    </div>"""
+
+@profiled
+def gen_blog_index_html(cfg, blog_rows=None, json_data=False):
+    if blog_rows is not None:
+        size = cfg.blog_page_size
+        posts = [(slug, row) for slug, row in blog_rows if len(row) > 4]
+        grid = "".join(gen_blog_card(cfg, row, slug, more=0 < size <= i) for i, (slug, row) in enumerate(posts))
+        paged = 0 < size < len(posts)
+        return f"""
+    <section class="hero" style="min-height:40vh; background-image: linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{image_url(cfg, cfg.hero_img_1, 1600)}'); background-size: cover; background-position: center;">
+        <div class="container"><h1>{cfg.blog_hero_title}</h1><p>{cfg.blog_hero_sub}</p></div>
+    </section>
+    <section>
+        <div class="container">
+            <div id="blog-grid" class="grid-3"{f' data-paged data-page-size="{size}"' if paged else ''}>{grid}</div>
+        </div>
+    </section>
+    {use_js('pager') if paged else ''}
+    """
+    e = html.escape
+    return f"""
+    <section class="hero" style="min-height:40vh; background-image: linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{image_url(cfg, cfg.hero_img_1, 1600)}'); background-size: cover; background-position: center;">
+        <div class="container"><h1>{cfg.blog_hero_title}</h1><p>{cfg.blog_hero_sub}</p></div>
+    </section>
+    <section>
+        <div class="container">
+            <div id="blog-grid" class="grid-3" data-format="{'json' if json_data else 'csv'}" data-src="{e(cfg.blog_sheet_url)}" data-fallback="{e(cfg.hero_img_1)}" data-page-size="{cfg.blog_page_size}" data-ttl="{cfg.sheet_cache_ttl * 60}">
+                <div style="text-align:center; grid-column:1/-1;">Loading Articles...</div>
+            </div>
+        </div>
+    </section>
+    {use_js('blog')}
+    """
+
+# --- MODIFIED: gen_blog_post_html with Social Shares ---
+@fragment
+def gen_blog_post_html(cfg, json_data=False):
+    e = html.escape
+    return f"""
+    <div id="post-container" style="padding-top:100px; min-height:60vh;" data-format="{'json' if json_data else 'csv'}" data-src="{e(cfg.blog_sheet_url)}" data-site="{e(cfg.biz_name)}" data-ttl="{cfg.sheet_cache_ttl * 60}">
+        <div class="container" style="text-align:center; padding:5rem 0;">
+            <h1>Loading Article...</h1>
+        </div>
+    </div>
+    {use_js('post')}
+    """
+
+def compile_blog_json(cfg, blog_rows):
+    """Splits the blog into a summary-only index shard and one detail shard per slug."""
+    index, details = [], {}
+    for slug, row in blog_rows:
+        if len(row) <= 4: continue
+        r = (row + [""] * 7)[:7]
+        card = {"slug": slug, "title": r[1], "date": r[2], "category": r[3], "summary": r[4], "img": image_url(cfg, r[5] or cfg.hero_img_1, 960)}
+        index.append(card)
+        details[slug] = dict(card, html=format_text(r[6]))
+    return index, details
+
+@profiled
+def gen_blog_post_static(cfg, row, slug):
+    r = [html.escape(c) for c in (row + [""] * 7)[:7]]
+    page_url = f"{cfg.prod_url}/blog/{slug}.html"
+    share_url = urllib.parse.quote(page_url, safe="")
+    share_title = urllib.parse.quote(row[1] if len(row) > 1 else "", safe="")
+    return f"""
+    <div id="post-container" style="padding-top:100px; min-height:60vh;">
+        <div style="background:var(--p); padding:6rem 0 4rem 0; color:white; text-align:center;">
+            <div class="container">
+                <span class="blog-badge" style="background:rgba(255,255,255,0.2); margin-bottom:1rem; display:inline-block;">{r[3]}</span>
+                <h1 style="font-size:clamp(2rem, 5vw, 3.5rem); margin-bottom:1rem; color:white;">{r[1]}</h1>
+                <p style="opacity:0.8;">Published on {r[2]}</p>
+            </div>
+        </div>
+        <div class="container" style="max-width:800px; padding:4rem 1rem;">
+            {responsive_img(cfg, row[5] if len(row) > 5 and row[5] else cfg.hero_img_1, row[1] if len(row) > 1 else "", "(max-width: 800px) 100vw, 800px", style="width:100%; height:auto; border-radius:12px; margin-bottom:3rem; box-shadow:0 10px 30px rgba(0,0,0,0.1);")}
+            <div class="article-content" style="line-height:1.8; color:var(--txt);">
+                {format_text(row[6] if len(row) > 6 else "")}
+            </div>
+
+            {gen_share_row(share_url, share_title, 'Share Article:', 'margin-top:3rem; border-top:1px solid #eee; padding-top:2rem;')}
+
+            <hr style="margin:2rem 0; border:0; border-top:1px solid #eee;">
+            <a href="blog.html" class="btn btn-primary">&larr; Back to Blog</a>
+        </div>
+    </div>
+    """
+
+# --- 4. PAGE CONTENT GENERATION ---
+@profiled
+def gen_home_content(cfg, inv_rows=None, json_data=False):
+    home_content = ""
+    if cfg.show_hero: home_content += gen_hero(cfg)
+    if cfg.show_stats: home_content += gen_stats(cfg)
+    if cfg.show_features: home_content += gen_features(cfg)
+    if cfg.show_pricing: home_content += gen_pricing_table(cfg)
+    if cfg.show_inventory: home_content += gen_inventory(cfg, inv_rows, json_data)
+    if cfg.show_gallery: home_content += gen_about_section(cfg)
+    if cfg.show_testimonials: 
+        t_cards = "".join([f'<div class="card reveal" style="text-align:center;"><i>"{x.split("|")[1]}"</i><br><br><b>- {x.split("|")[0]}</b></div>' for x in cfg.testi_data.split('\n') if "|" in x])
+        home_content += f'<section style="background:#f8fafc"><div class="container"><div class="section-head reveal"><h2>Client Stories</h2></div><div class="grid-3">{t_cards}</div></div></section>'
+    if cfg.show_faq: home_content += gen_faq_section(cfg)
+    if cfg.show_cta: home_content += f'<section style="background:var(--s); color:white; text-align:center;"><div class="container reveal"><h2>Start Owning Your Future</h2><p style="margin-bottom:2rem;">Stop paying rent. Start building equity.</p><a href="contact.html" class="btn" style="background:white; color:var(--s);">Get Started</a></div></section>'
+    return home_content
+
+# --- 5. INNER PAGES ---
+# HELPER: Function to generate a header for inner pages with the image
+@fragment
+def gen_inner_header(cfg, title):
+    return f"""
+    <section class="hero" style="min-height: 40vh; background-image: linear-gradient(rgba(0,0,0,0.6), rgba(0,0,0,0.6)), url('{image_url(cfg, cfg.hero_img_1, 1600)}'); background-size: cover; background-position: center;">
+        <div class="container">
+            <h1 style="font-size: 3.5rem; margin-bottom: 0;">{title}</h1>
+        </div>
+    </section>
+    """
+
+# 1. GENERATE ABOUT PAGE CONTENT
+@fragment
+def gen_about_page(cfg):
+    about_body = format_text(cfg.about_long)
+    return f"""{gen_inner_header(cfg, "About Us")}<section><div class="container"><div class="about-grid"><div class="legal-text">{about_body}</div>{responsive_img(cfg, cfg.about_img, f"About {cfg.biz_name}", ABOUT_SIZES, style="width:100%; height:auto; border-radius:12px; box-shadow:0 10px 30px rgba(0,0,0,0.1);")}</div></div></section>"""
+
+# 2. GENERATE CONTACT PAGE CONTENT (FIXED MOBILE LAYOUT)
+@fragment
+def gen_contact_page(cfg):
+    return f"""
+{gen_inner_header(cfg, "Contact Us")}
+<section>
+    <div class="container">
+        <!-- FIXED: Class instead of inline style -->
+        <div class="contact-grid">
+            <div>
+                <div style="background:var(--card); padding:2rem; border-radius:12px; border:1px solid #eee;">
+                    <h3 style="color:var(--p);">Get In Touch</h3>
+                    <p style="margin-top:1rem;"><strong>📍 Address:</strong><br>{cfg.biz_addr.replace(chr(10),'<br>')}</p>
+                    <p style="margin-top:1rem;"><strong>📞 Phone:</strong><br><a href="tel:{cfg.biz_phone}" style="color:var(--s);">{cfg.biz_phone}</a></p>
+                    <p style="margin-top:1rem;"><strong>📧 Email:</strong><br><a href="mailto:{cfg.biz_email}">{cfg.biz_email}</a></p>
+                    <br>
+                    <a href="https://wa.me/{cfg.wa_num}" target="_blank" class="btn btn-accent" style="width:100%; text-align:center;">Chat on WhatsApp</a>
+                </div>
+            </div>
+            
+            <div class="card">
+                <h3 style="margin-bottom:1.5rem;">Send a Message</h3>
+                <form action="https://formsubmit.co/{cfg.biz_email}" method="POST">
+                    <div style="display:grid; grid-template-columns:1fr 1fr; gap:1rem;">
+                        <div><label>Name</label><input type="text" name="name" required placeholder="Your Name"></div>
+                        <div><label>Email</label><input type="email" name="email" required placeholder="Your Email"></div>
+                    </div>
+                    <label>Message</label><textarea name="message" rows="5" required placeholder="How can we help you?"></textarea>
+                    <button type="submit" class="btn btn-primary" style="width:100%;">Send Message</button>
+                    <input type="hidden" name="_captcha" value="false">
+                    <input type="hidden" name="_next" value="{cfg.prod_url}/contact.html">
+                </form>
+            </div>
+        </div>
+        <br><br>
+        <div style="border-radius:12px; overflow:hidden; box-shadow:0 10px 30px rgba(0,0,0,0.1);">{cfg.map_iframe}</div>
+    </div>
+</section>
+"""
+
+# 3. GENERATE LEGAL PAGES
+@fragment
+def gen_privacy_page(cfg):
+    return f'{gen_inner_header(cfg, "Privacy Policy")}<section><div class="container legal-text">{format_text(cfg.priv_txt)}</div></section>'
+
+@fragment
+def gen_terms_page(cfg):
+    return f'{gen_inner_header(cfg, "Terms of Service")}<section><div class="container legal-text">{format_text(cfg.term_txt)}</div></section>'
@@ -0,0 +1,182 @@
+"""Titan exporter: writes a complete site into a ZIP or directory sink. Shared by the Streamlit app and the headless CLI."""
+import dataclasses
+import datetime
+import functools
+import html
+import json
+import os
+import re
+import time
+
+from .engine import (
+    SiteConfig, build_page, gen_home_content, gen_about_page, gen_contact_page,
+    gen_privacy_page, gen_terms_page, gen_blog_index_html, gen_blog_post_html,
+    gen_product_page_content, gen_product_static_content, gen_blog_post_static,
+    gen_404_content, load_csv_rows, assign_slugs, compile_inventory_json,
+    compile_blog_json, to_json, get_theme_css, stylesheet_name, JS_FILES,
+    gen_service_worker, is_shell_file, font_face_css, gen_sitemaps, ICON_FILE, ICON_SPRITE, search_enabled,
+)
+from .budget import PageBudget
+from .fonts import TTFont, build_fonts, site_chars
+from .output import OutputStage
+from .search import build_search_index, search_docs
+
+# Pages that only render with a query string; their real URLs come from the JSON shards instead.
+TEMPLATE_PAGES = ("404.html", "product.html", "post.html")
+_SHARD = re.compile(r'data/(products|posts)/(.+)\.json$')
+SHARD_URLS = {"products": "product.html?item={}", "posts": "post.html?id={}"}
+
+# Keys a site config file may carry besides the SiteConfig fields; paths are relative to the file.
+SOURCE_KEYS = ("inv_csv", "blog_csv", "images")
+
+def load_site(path):
+    """Reads a site config JSON: (SiteConfig, catalog source, blog source, {path: bytes} image files).
+
+    Keys are SiteConfig field names, as in the app's sidebar and tabs. Missing fields keep their defaults.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    fields = {f.name for f in dataclasses.fields(SiteConfig)} - {"images"}
+    unknown = set(data) - fields - set(SOURCE_KEYS)
+    if unknown:
+        raise ValueError(f"unknown config keys: {', '.join(sorted(unknown))}")
+    here = os.path.dirname(os.path.abspath(path))
+    local = lambda p: p if not p or p.startswith(("http://", "https://")) else os.path.join(here, p)
+    metas, image_files = [], {}
+    if data.get("images"):
+        from .images import available_formats, process_image
+        if not available_formats():
+            raise RuntimeError("images need Pillow with WebP support")
+        for name in data["images"]:
+            with open(local(name), "rb") as f:
+                meta, files = process_image(os.path.basename(name), f.read())
+            metas.append(meta)
+            image_files.update(files)
+    cfg = SiteConfig(**{k: v for k, v in data.items() if k in fields}, images=tuple(metas))
+    return cfg, local(data.get("inv_csv")), local(data.get("blog_csv")), image_files
+
+def build_date():
+    """Today, or the date of $SOURCE_DATE_EPOCH for reproducible builds."""
+    return datetime.datetime.fromtimestamp(int(os.environ.get("SOURCE_DATE_EPOCH", time.time())), datetime.timezone.utc).date().isoformat()
+
+def sitemap_urls(hashes):
+    """(URL path, output file) for every page the export produced, home first."""
+    urls = []
+    for name in sorted(hashes):
+        shard = _SHARD.match(name)
+        if shard:
+            urls.append((SHARD_URLS[shard[1]].format(shard[2]), name))
+        elif name.endswith(".html") and name not in TEMPLATE_PAGES:
+            urls.append(("" if name == "index.html" else name, name))
+    return sorted(urls, key=lambda u: u[0] != "")
+
+def page_lastmods(hashes, previous, today):
+    """lastmod per output file: kept from the previous manifest while the file's hash is unchanged."""
+    old_files, old_dates = previous.get("files", {}), previous.get("lastmod", {})
+    return {name: old_dates[name] if old_files.get(name) == digest and name in old_dates else today for name, digest in hashes.items()}
+
+def empty_sheet_warning(kind, source):
+    """Why a build-time section came out empty: no sheet configured, or a sheet without data rows."""
+    if not source:
+        return f"The {kind} uses a build-time mode but has no sheet URL or CSV file; it was exported empty."
+    return f"The {kind} sheet has no data rows; it was exported empty."
+
+def export_site(cfg, sink, inv_source=None, blog_source=None, image_files=None, previous=None, delta=False):
+    """Builds every page and asset of the site into sink (a ZipSink, DirSink or ZipFile).
+
+    inv_source / blog_source override the sheet URLs for build-time modes (path, URL or uploaded file).
+    previous is the last deploy's manifest; sitemap lastmods carry over from it for unchanged pages,
+    and a directory sink loses the files it lists that this build no longer produces.
+    With delta only files whose hash differs from it are written.
+    Returns (OutputStage, warnings); a sheet that cannot be read falls back to live mode with a warning,
+    and a build-time section without a sheet or without rows is exported empty with a warning.
+    The stage's budget attribute holds the PageBudget analysis of every HTML page.
+    With site search on, the build-time rows are also indexed into search/ for the nav search box.
+    """
+    warnings = []
+    inv_rows = None
+    if cfg.show_inventory and not cfg.inv_mode.startswith("Live"):
+        try:
+            inv_rows = assign_slugs(load_csv_rows(inv_source or cfg.sheet_url))
+        except Exception as e:
+            warnings.append(f"Could not read the catalog CSV, falling back to live mode: {e}")
+        if inv_rows == []:
+            warnings.append(empty_sheet_warning("catalog", inv_source or cfg.sheet_url))
+    inv_json = inv_rows is not None and cfg.inv_mode.startswith("JSON")
+    blog_rows = None
+    if cfg.show_blog and not cfg.blog_mode.startswith("Live"):
+        try:
+            blog_rows = assign_slugs(load_csv_rows(blog_source or cfg.blog_sheet_url))
+        except Exception as e:
+            warnings.append(f"Could not read the blog CSV, falling back to live mode: {e}")
+        if blog_rows == []:
+            warnings.append(empty_sheet_warning("blog", blog_source or cfg.blog_sheet_url))
+    blog_json = blog_rows is not None and cfg.blog_mode.startswith("JSON")
+    fonts, font_files = build_fonts(cfg, site_chars(cfg, inv_rows, blog_rows)) if cfg.self_host_fonts and TTFont else ((), {})
+    css = font_face_css(fonts) + get_theme_css(cfg)
+    css_href = stylesheet_name(css) if cfg.css_mode.startswith("Shared") else ""
+    page = functools.partial(build_page, cfg, css_href=css_href, purge=cfg.css_mode.startswith("Inline, Purged"), bundle_js=cfg.bundle_js, sw_url="sw.js" if cfg.service_worker else "", fonts=fonts, icon_href=ICON_FILE if cfg.icon_sprite else "")
+
+    previous = previous or {}
+    budget = PageBudget(cfg)
+    zf = OutputStage(sink, minify=cfg.minify_output, precompress=cfg.precompress, previous=previous.get("files", {} if delta else None), delta=delta, inspect=budget.add)
+    zf.budget = budget
+    if inv_json:
+        inv_index, inv_details = compile_inventory_json(cfg, inv_rows)
+        zf.writestr("index.html", page("Home", gen_home_content(cfg, json_data=True)))
+        zf.writestr("data/inventory.index.json", to_json(inv_index))
+        for slug, item in inv_details.items():
+            zf.writestr(f"data/products/{slug}.json", to_json(item))
+    elif inv_rows is not None:
+        zf.writestr("index.html", page("Home", gen_home_content(cfg, inv_rows)))
+        for slug, row in inv_rows:
+            zf.writestr(f"products/{slug}.html", page(html.escape(row[0]), gen_product_static_content(cfg, row, slug), base_href="../"))
+    else:
+        zf.writestr("index.html", page("Home", gen_home_content(cfg)))
+    zf.writestr("about.html", page("About", gen_about_page(cfg)))
+    zf.writestr("contact.html", page("Contact", gen_contact_page(cfg)))
+    zf.writestr("privacy.html", page("Privacy Policy", gen_privacy_page(cfg)))
+    zf.writestr("terms.html", page("Terms of Service", gen_terms_page(cfg)))
+    zf.writestr("product.html", page("Product Details", gen_product_page_content(cfg, is_demo=False, json_data=inv_json)))
+
+    if cfg.show_blog:
+        if blog_json:
+            blog_index, blog_details = compile_blog_json(cfg, blog_rows)
+            zf.writestr("blog.html", page("Blog", gen_blog_index_html(cfg, json_data=True)))
+            zf.writestr("data/blog.index.json", to_json(blog_index))
+            for slug, post in blog_details.items():
+                zf.writestr(f"data/posts/{slug}.json", to_json(post))
+        else:
+            zf.writestr("blog.html", page("Blog", gen_blog_index_html(cfg, blog_rows)))
+            for slug, row in blog_rows or []:
+                if len(row) > 4:
+                    zf.writestr(f"blog/{slug}.html", page(html.escape(row[1]), gen_blog_post_static(cfg, row, slug), base_href="../"))
+        zf.writestr("post.html", page("Article", gen_blog_post_html(cfg, json_data=blog_json)))
+
+    if search_enabled(cfg) and (inv_rows is not None or blog_rows is not None):
+        urls = {"product": SHARD_URLS["products"] if inv_json else "products/{}.html", "post": SHARD_URLS["posts"] if blog_json else "blog/{}.html"}
+        for path, data in build_search_index(search_docs(cfg, inv_rows, blog_rows), urls, cfg.search_stemming).items():
+            zf.writestr(path, data)
+    if css_href:
+        zf.writestr(css_href, css)
+    if cfg.icon_sprite:
+        zf.writestr(ICON_FILE, ICON_SPRITE)
+    if cfg.bundle_js:
+        for path, src in JS_FILES.values():
+            zf.writestr(path, src)
+    for path, data in (image_files or {}).items():
+        zf.writestr(path, data)
+    for path, data in font_files.items():
+        zf.writestr(path, data)
+    zf.writestr("404.html", page("404 Not Found", gen_404_content()))
+    zf.writestr("robots.txt", f"User-agent: *\nAllow: /\nSitemap: {cfg.prod_url}/sitemap.xml")
+
+    pages = sitemap_urls(zf.hashes)
+    zf.lastmod = page_lastmods({name: zf.hashes[name] for _, name in pages}, previous, build_date())
+    for name, xml in gen_sitemaps(cfg.prod_url, [(url, zf.lastmod[name]) for url, name in pages]).items():
+        zf.writestr(name, xml)
+    if cfg.service_worker:
+        shell = [name for name in zf.hashes if is_shell_file(name)]
+        zf.writestr("sw.js", gen_service_worker(zf.version(shell), shell))
+    zf.finish()
+    return zf, warnings
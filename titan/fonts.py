@@ -0,0 +1,110 @@
+"""Titan font stage: self-hosts the configured fonts from a local cache, subset to the site's characters."""
+import functools
+import hashlib
+import io
+import logging
+import os
+
+from .engine import FONT_WEIGHTS, FontFace, slugify
+
+try:
+    from fontTools.subset import Options, Subsetter
+    from fontTools.ttLib import TTFont
+    logging.getLogger("fontTools.subset").setLevel(logging.ERROR)  # its "table not subset" notices, once per face
+except ImportError:  # optional: without fontTools fonts stay on their remote stylesheets
+    TTFont = None
+
+try:
+    import brotli  # fontTools needs it for WOFF2
+except ImportError:
+    brotli = None
+
+FONT_DIR = os.environ.get("TITAN_FONT_DIR", "fonts")
+FONT_EXTS = (".ttf", ".otf", ".woff", ".woff2")
+# Always kept, so text that only arrives at runtime from live sheets still gets the font:
+# printable ASCII, Latin-1 and the punctuation the templates use.
+BASE_CHARS = "".join(map(chr, range(0x20, 0x7F))) + "".join(map(chr, range(0xA0, 0x100))) + "‘’“”–—…•→←€™"
+
+def _describe(path):
+    """(family, (min, max) weight) of an upright face, or None for italics."""
+    font = TTFont(path, lazy=True)
+    if font["OS/2"].fsSelection & 1:
+        return None
+    family = font["name"].getDebugName(16) or font["name"].getDebugName(1)
+    axis = next((a for a in font["fvar"].axes if a.axisTag == "wght"), None) if "fvar" in font else None
+    weight = font["OS/2"].usWeightClass
+    return family, (int(axis.minValue), int(axis.maxValue)) if axis else (weight, weight)
+
+@functools.lru_cache(maxsize=4)
+def _scan(font_dir, stamp):
+    faces = {}
+    for root, _, files in os.walk(font_dir):
+        for name in sorted(files):
+            if not name.lower().endswith(FONT_EXTS):
+                continue
+            path = os.path.join(root, name)
+            try:
+                info = _describe(path)
+            except Exception:  # not a font fontTools can read; leave it out
+                continue
+            if info:
+                faces.setdefault(info[0].lower(), []).append((info[1], path))
+    return faces
+
+def cached_faces(family, font_dir=FONT_DIR):
+    """Upright faces of a family in the font cache as [((min, max) weight, path)]."""
+    if TTFont is None or not os.path.isdir(font_dir):
+        return []
+    stamp = max(os.stat(root).st_mtime for root, _, _ in os.walk(font_dir))
+    return _scan(font_dir, stamp).get(family.lower(), [])
+
+def _pick(faces, weights):
+    """The face covering each weight, or the nearest one, without duplicates."""
+    picked = []
+    for w in weights:
+        best = min(faces, key=lambda f: max(f[0][0] - w, w - f[0][1], 0))
+        if best not in picked:
+            picked.append(best)
+    return picked
+
+@functools.lru_cache(maxsize=32)
+def subset_font(path, stamp, chars):
+    font = TTFont(path)
+    options = Options()
+    options.flavor = "woff2" if brotli else "woff"
+    subsetter = Subsetter(options)
+    subsetter.populate(unicodes=[ord(c) for c in chars])
+    subsetter.subset(font)
+    font.flavor = options.flavor
+    buf = io.BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+def site_chars(cfg, *row_sets):
+    """Every character in the config's text fields and the build-time sheet rows, plus BASE_CHARS."""
+    chars = set(BASE_CHARS)
+    for value in vars(cfg).values():
+        if isinstance(value, str): chars.update(value)
+    for rows in row_sets:
+        for _, row in rows or []:
+            for cell in row: chars.update(cell)
+    return "".join(sorted(c for c in chars if c.isprintable()))
+
+def build_fonts(cfg, chars, font_dir=FONT_DIR):
+    """Subset copies of the configured fonts found in the cache: (FontFace tuple, {path: bytes}).
+
+    Families the cache lacks are left out; build_page links them from their remote service instead.
+    """
+    faces, files = [], {}
+    for field, weights in FONT_WEIGHTS.items():
+        family = getattr(cfg, field)
+        available = cached_faces(family, font_dir)
+        if not available:
+            continue
+        for (lo, hi), path in _pick(available, weights):
+            data = subset_font(path, os.stat(path).st_mtime, chars)
+            weight = str(lo) if lo == hi else f"{lo} {hi}"
+            name = f"fonts/{slugify(family)}-{weight.replace(' ', '-')}.{hashlib.blake2b(data, digest_size=5).hexdigest()}.{'woff2' if brotli else 'woff'}"
+            files[name] = data
+            faces.append(FontFace(family, weight, name))
+    return tuple(faces), files
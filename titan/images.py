@@ -0,0 +1,58 @@
+"""Titan image stage: turns uploaded images into resized AVIF/WebP variants and inline blur placeholders."""
+import base64
+import functools
+import hashlib
+import io
+
+from .engine import IMG_WIDTHS, ImageMeta, slugify
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # optional: without Pillow uploads are not accepted
+    Image = None
+
+# Best format first; the last one available becomes the <img> fallback.
+FORMATS = (("avif", "image/avif", 50), ("webp", "image/webp", 75))
+LQIP_WIDTH = 16
+
+def available_formats():
+    if Image is None:
+        return ()
+    return tuple(f for f in FORMATS if features.check(f[0]))
+
+def _encode(img, fmt, quality):
+    buf = io.BytesIO()
+    img.save(buf, fmt.upper(), quality=quality)
+    return buf.getvalue()
+
+def _has_alpha(img):
+    return img.mode in ("RGBA", "LA") and img.getchannel("A").getextrema()[0] < 255
+
+@functools.lru_cache(maxsize=64)
+def process_image(name, data):
+    """Variants at each IMG_WIDTHS step up to the source width, plus the source width itself
+    (capped at the largest step, which is then only encoded once).
+
+    Returns (ImageMeta, {path: bytes}). Paths carry a hash of the source, so they can be cached forever.
+    """
+    img = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+    img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+    width, height = img.size
+    steps = sorted({w for w in IMG_WIDTHS if w < width} | {min(width, IMG_WIDTHS[-1])})
+    stem = f"img/{slugify(name.rsplit('.', 1)[0])}"
+    tag = hashlib.blake2b(data, digest_size=5).hexdigest()
+
+    files, variants = {}, []
+    for fmt, mime, quality in available_formats():
+        paths = []
+        for w in steps:
+            path = f"{stem}-{w}.{tag}.{fmt}"
+            files[path] = _encode(img.resize((w, round(height * w / width)), Image.LANCZOS), fmt, quality)
+            paths.append((w, path))
+        variants.append((mime, tuple(paths)))
+
+    lqip = ""
+    if not _has_alpha(img):
+        tiny = img.convert("RGB").resize((LQIP_WIDTH, max(1, round(height * LQIP_WIDTH / width))), Image.BILINEAR)
+        lqip = "data:image/webp;base64," + base64.b64encode(_encode(tiny, "webp", 30)).decode()
+    return ImageMeta(name, width, height, tuple(variants), lqip), files
@@ -0,0 +1,219 @@
+"""Titan output stage: minifies and precompresses generated files on their way into the ZIP or a directory."""
+import gzip
+import hashlib
+import json
+import os
+import re
+import time
+import zipfile
+
+from .engine import current_profile
+
+try:
+    import brotli
+except ImportError:  # optional: .br siblings are skipped without it
+    brotli = None
+
+TEXT_TYPES = (".html", ".css", ".js", ".json", ".xml", ".txt", ".svg")
+COMPRESSED_TYPES = (".gz", ".br", ".zip", ".woff", ".woff2", ".webp", ".avif", ".jpg", ".jpeg", ".png", ".gif")
+MANIFEST = "manifest.json"
+FIXED_DATE = (1980, 1, 1, 0, 0, 0)  # earliest ZIP timestamp; keeps archives byte-reproducible
+
+# --- 1. MINIFIERS ---
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s+')
+_CSS_PUNCT = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+_HTML_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_HTML_RAW = re.compile(r'(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2>)', re.S | re.I)
+_HTML_SPACE = re.compile(r'\s+')
+
+def minify_css(css):
+    """Drops comments and the whitespace around punctuation. Spaces inside calc() and selectors stay."""
+    css = _CSS_SPACE.sub(" ", _CSS_COMMENT.sub("", css))
+    css = _CSS_COLON.sub(":", _CSS_PUNCT.sub(r"\1", css))
+    return css.replace(";}", "}").strip()
+
+def minify_js(js):
+    """Line-level only: trims indentation, blank lines and whole-line // comments.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as before.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def _collapse(text):
+    return _HTML_SPACE.sub(lambda m: "\n" if "\n" in m.group() else " ", text)
+
+def minify_html(page):
+    """Removes comments and collapses whitespace runs; inline <script>/<style> go through their own minifier."""
+    page = _HTML_COMMENT.sub("", page)
+    out, pos = [], 0
+    for m in _HTML_RAW.finditer(page):
+        out.append(_collapse(page[pos:m.start()]))
+        open_tag, tag, body, close_tag = m.groups()
+        tag = tag.lower()
+        if tag == "script": body = minify_js(body)
+        elif tag == "style": body = minify_css(body)
+        out.append(open_tag + body + close_tag)
+        pos = m.end()
+    out.append(_collapse(page[pos:]))
+    return "".join(out).strip()
+
+MINIFIERS = {".html": minify_html, ".css": minify_css, ".js": minify_js}
+
+# --- 2. OUTPUT STAGE ---
+class OutputStage:
+    """Sits between the exporter and the ZIP: minifies, writes .gz/.br siblings and measures every file.
+
+    `writestr` mirrors `ZipFile.writestr`, so the exporter only swaps the object it writes to.
+    Every output is content-hashed for manifest.json. previous holds the hashes of the last build's
+    manifest; with delta, files whose hash is unchanged are not written, which turns the output into
+    a delta package. inspect, if given, sees every file as it is written: inspect(name, bytes).
+    """
+
+    def __init__(self, zf, minify=True, precompress=False, previous=None, delta=False, inspect=None):
+        self.zf = zf
+        self.minify = minify
+        self.precompress = precompress
+        self.previous = previous
+        self.delta = delta
+        self.inspect = inspect
+        self.report = []
+        self.hashes = {}
+        self.lastmod = {}
+        self.unchanged = 0
+
+    def _put(self, name, data):
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self.hashes[name] = digest
+        if self.delta and self.previous and self.previous.get(name) == digest:
+            self.unchanged += 1
+            return
+        self.zf.writestr(name, data)
+
+    def writestr(self, name, data):
+        profile = current_profile()
+        start = time.perf_counter()
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        ext = name[name.rfind("."):].lower() if "." in name else ""
+        out = raw
+        if self.minify and ext in MINIFIERS:
+            out = MINIFIERS[ext](raw.decode("utf-8")).encode("utf-8")
+        self._put(name, out)
+        if self.inspect is not None:
+            self.inspect(name, out)
+        row = {"file": name, "original": len(raw), "minified": len(out), "gzip": None, "brotli": None}
+        if self.precompress and ext in TEXT_TYPES:
+            gz = gzip.compress(out, 9, mtime=0)
+            if len(gz) < len(out):
+                self._put(name + ".gz", gz)
+                row["gzip"] = len(gz)
+            if brotli is not None:
+                br = brotli.compress(out, quality=11)
+                if len(br) < len(out):
+                    self._put(name + ".br", br)
+                    row["brotli"] = len(br)
+        self.report.append(row)
+        if profile is not None:
+            profile.add_file(name, time.perf_counter() - start, len(out))
+
+    def version(self, names):
+        """Content hash over a set of written files, stable for identical output."""
+        return hashlib.blake2b(repr(sorted((n, self.hashes[n]) for n in names)).encode(), digest_size=6).hexdigest()
+
+    def deletions(self):
+        """Paths in the previous manifest that this build no longer produces."""
+        return sorted(set(self.previous or ()) - set(self.hashes))
+
+    def manifest(self):
+        """Content hash of every output, plus the date each page last changed (kept for sitemap lastmods)."""
+        return json.dumps({"files": dict(sorted(self.hashes.items())), "lastmod": dict(sorted(self.lastmod.items()))}, indent=1)
+
+    def finish(self):
+        """Writes manifest.json. Files of the previous build that this one no longer produces are
+        removed from a directory sink, full build or delta; a delta ZIP lists them in deletions.json
+        for the deploy step."""
+        if self.previous is not None:
+            gone = self.deletions()
+            if hasattr(self.zf, "delete"):
+                for name in gone:
+                    self.zf.delete(name)
+            elif self.delta:
+                self.zf.writestr("deletions.json", json.dumps(gone, indent=1))
+        self.zf.writestr(MANIFEST, self.manifest())
+
+    def totals(self):
+        return {
+            "files": len(self.report),
+            "original": sum(r["original"] for r in self.report),
+            "minified": sum(r["minified"] for r in self.report),
+        }
+
+# --- 3. SINKS ---
+class ZipSink:
+    """Streams entries into a ZIP with fixed timestamps and permissions and a name-sorted directory,
+    so identical sites produce identical archives.
+
+    With store_compressed, formats that are already compressed are stored instead of deflated again.
+    """
+
+    def __init__(self, file, store_compressed=True):
+        self.zf = zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED)
+        self.store_compressed = store_compressed
+
+    def writestr(self, name, data):
+        info = zipfile.ZipInfo(name, FIXED_DATE)
+        info.create_system = 3
+        info.external_attr = 0o644 << 16
+        stored = self.store_compressed and name.lower().endswith(COMPRESSED_TYPES)
+        info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+        self.zf.writestr(info, data)
+
+    def close(self):
+        self.zf.filelist.sort(key=lambda info: info.filename)
+        self.zf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class DirSink:
+    """Writes entries as files under a directory, e.g. a web root or a deploy checkout."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def writestr(self, name, data):
+        path = os.path.join(self.root, *name.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+
+    def delete(self, name):
+        """Removes a file, and the directories it leaves empty."""
+        path = os.path.join(self.root, *name.split("/"))
+        if os.path.exists(path):
+            os.remove(path)
+        parent = os.path.dirname(path)
+        while os.path.normpath(parent) != os.path.normpath(self.root) and os.path.isdir(parent) and not os.listdir(parent):
+            os.rmdir(parent)
+            parent = os.path.dirname(parent)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_manifest(text):
+    """A manifest.json written by OutputStage.finish(): {"files": {path: hash}, "lastmod": {path: date}}."""
+    manifest = json.loads(text)
+    if not isinstance(manifest.get("files"), dict):
+        raise ValueError("not a Titan manifest")
+    return manifest
@@ -0,0 +1,67 @@
+"""Titan site search: a build-time inverted index over the catalog and blog, read by the "search" JS module."""
+import hashlib
+import html
+
+from .engine import SEARCH_DIR, SEARCH_DOCS_PER_SHARD, inventory_fields, profiled, search_shard, search_tokens, to_json
+
+SEARCH_LIMIT = 8  # results the search box lists
+
+VLQ_DIGITS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+def encode_ids(ids):
+    """Ascending doc ids as base64 VLQ gaps, as in source maps but unsigned: 5 bits per digit, 6th bit = more digits follow."""
+    out, last = [], 0
+    for i in ids:
+        gap, last = i - last, i
+        while gap >= 32:
+            out.append(VLQ_DIGITS[32 | gap & 31])
+            gap >>= 5
+        out.append(VLQ_DIGITS[gap])
+    return "".join(out)
+
+def search_docs(cfg, inv_rows=None, blog_rows=None):
+    """(kind, slug, title, subtitle, text) per searchable page.
+
+    Products are found by Name and Description and show their price; posts by Title, Summary and
+    Category and show their category. Titles are also part of the searchable text.
+    """
+    docs = []
+    for slug, row in inv_rows or []:
+        name, price, desc, _ = inventory_fields(cfg, row)
+        docs.append(("product", slug, name, price, desc))
+    for slug, row in blog_rows or []:
+        if len(row) > 4:
+            docs.append(("post", slug, row[1], row[3], f"{row[3]} {row[4]}"))
+    return docs
+
+@profiled
+def build_search_index(docs, urls, stem=False):
+    """{path: JSON text} of the search index files, under SEARCH_DIR.
+
+    meta.json: version, stemming, docs per shard, result limit and the page URL template per kind.
+    t/<first two chars>.json: {term: "title ids|other ids"}, ids that have the term in the title and
+    ids that only have it in the text, so title matches can rank first.
+    d/<n>.json: [kind, slug, title, subtitle] of docs n * SEARCH_DOCS_PER_SHARD onwards, HTML-escaped.
+    The catalog itself is never downloaded: a query costs one term shard per word plus the doc
+    shards of the results shown.
+    """
+    postings = {}
+    for i, (kind, slug, title, sub, text) in enumerate(docs):
+        in_title = set(search_tokens(title, stem))
+        for term in in_title:
+            postings.setdefault(term, ([], []))[0].append(i)
+        for term in set(search_tokens(text, stem)) - in_title:
+            postings.setdefault(term, ([], []))[1].append(i)
+    shards = {}
+    for term in sorted(postings):
+        title, other = postings[term]
+        shards.setdefault(search_shard(term), {})[term] = f"{encode_ids(title)}|{encode_ids(other)}"
+    files = {f"{SEARCH_DIR}t/{key}.json": to_json(terms) for key, terms in shards.items()}
+    e = html.escape
+    for n in range(0, len(docs), SEARCH_DOCS_PER_SHARD):
+        block = [[kind, slug, e(title), e(sub)] for kind, slug, title, sub, _ in docs[n:n + SEARCH_DOCS_PER_SHARD]]
+        files[f"{SEARCH_DIR}d/{n // SEARCH_DOCS_PER_SHARD}.json"] = to_json(block)
+    version = hashlib.blake2b("".join(files[k] for k in sorted(files)).encode(), digest_size=5).hexdigest()
+    meta = {"v": version, "stem": stem, "per": SEARCH_DOCS_PER_SHARD, "limit": SEARCH_LIMIT, "urls": urls}
+    files[f"{SEARCH_DIR}meta.json"] = to_json(meta)
+    return files